@@ -52,6 +52,24 @@ class Settings(BaseSettings):
         default="audio",
         description="Verbatim caption policy: audio (default) or script.",
     )
+    asr_device: str = Field(
+        default="auto",
+        description="faster-whisper device: auto, cpu, or cuda.",
+    )
+    asr_compute_type: str = Field(
+        default="auto",
+        description=(
+            "faster-whisper compute type (e.g. int8, int8_float16, float16). "
+            "auto uses float16 on cuda and int8 on cpu."
+        ),
+    )
+    asr_batch_size: int = Field(
+        default=0,
+        description=(
+            "Batch size for faster-whisper's batched pipeline; 0 transcribes "
+            "sequentially (one job per process)."
+        ),
+    )
 
     # ------------------------------------------------------------------
     # News
@@ -105,6 +123,14 @@ class Settings(BaseSettings):
         description="Fail rendering if subtitle layout exceeds safe-area constraints.",
     )
 
+    video_encoder: str = Field(
+        default="auto",
+        description=(
+            "H.264 encoder: auto (hardware when available), cpu (libx264), "
+            "nvenc, vt (VideoToolbox), or qsv."
+        ),
+    )
+
     loudnorm: bool = Field(
         default=False,
         description="Enable ffmpeg loudnorm filter for loudness normalization.",
@@ -134,6 +160,9 @@ class Settings(BaseSettings):
             "subtitles_mode": self.subtitles_mode,
             "captions_source": self.captions_source,
             "verbatim_policy": self.verbatim_policy,
+            "asr_device": self.asr_device,
+            "asr_compute_type": self.asr_compute_type,
+            "asr_batch_size": self.asr_batch_size,
             "rss_url": self.rss_url,
             "max_items": self.max_items,
             "model": self.model,
@@ -143,6 +172,7 @@ class Settings(BaseSettings):
             "background_video": self.background_video,
             "burn_subtitles": self.burn_subtitles,
             "subtitle_layout_strict": self.subtitle_layout_strict,
+            "video_encoder": self.video_encoder,
             "loudnorm": self.loudnorm,
             "log_level": self.log_level,
         }
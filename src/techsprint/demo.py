@@ -169,6 +169,7 @@ class DemoAudioService:
         text_path = job.workspace.audio_text_txt
         text_path.write_text(normalized_text, encoding="utf-8")
         text_sha = sha256_text(normalized_text)
+        word_timings = None
 
         if edge_tts_available() and not self.force_sine:
             try:
@@ -179,7 +180,9 @@ class DemoAudioService:
                     out_path=out,
                     voice=voice,
                 )
-                _run_async(backend_coro)
+                result = _run_async(backend_coro)
+                if isinstance(result, list):
+                    word_timings = result or None
             except Exception:
                 log.warning("Demo audio: edge-tts failed; falling back to sine tone.")
 
@@ -189,6 +192,7 @@ class DemoAudioService:
                 format="mp3",
                 text_path=text_path,
                 text_sha256=text_sha,
+                word_timings=word_timings,
             )
 
         if out.exists() and out.stat().st_size == 0:
@@ -267,7 +271,7 @@ def run_demo(
         script=DemoScriptService(),      # type: ignore[arg-type]
         audio=DemoAudioService(force_sine=force_sine),  # type: ignore[arg-type]
         subtitles=SubtitleService(backend=None, mode=job.settings.subtitles_mode),
-        compose=ComposeService(),
+        compose=ComposeService(preview=True),
         render=render,
     )
 
@@ -17,6 +17,7 @@ class AudioArtifact:
     format: str = "mp3"
     text_path: Path | None = None
     text_sha256: str | None = None
+    word_timings: list[tuple[str, float, float]] | None = None
 
 
 @dataclass(frozen=True)
@@ -22,7 +22,9 @@ Does NOT:
 
 from __future__ import annotations
 
-from techsprint.domain.artifacts import Artifacts
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from techsprint.domain.artifacts import Artifacts, VideoArtifact
 from techsprint.domain.job import Job
 from techsprint.renderers.base import RenderSpec
 from techsprint.services.audio import AudioService, create_audio_service
@@ -30,9 +32,12 @@ from techsprint.services.compose import ComposeService
 from techsprint.services.news import NewsService
 from techsprint.services.script import ScriptService, create_script_service
 from techsprint.services.subtitles import SubtitleService, create_subtitle_service
+from techsprint.utils.logging import get_logger
 from techsprint.utils.manifest import write_run_manifest
 from techsprint.utils.timing import StepTimer, utc_now
 
+log = get_logger(__name__)
+
 
 class Pipeline:
     """
@@ -107,24 +112,42 @@ class Pipeline:
                 )
                 job.artifacts.audio = audio_artifact
 
-            # 4) Subtitle generation (ASR or fallback)
-            with timer.step("generate_subtitles"):
-                subtitle_service = self.subtitles or create_subtitle_service(job)
-                subtitle_artifact = subtitle_service.generate(
-                    job,
-                    script_text=script_artifact.text,
-                )
-                job.artifacts.subtitles = subtitle_artifact
-
-            # 5) Compose final video
-            # If your ComposeService doesn't accept `render=...` yet, keep the call as `.render(job)`.
-            with timer.step("compose_video"):
-                try:
-                    video_artifact = self.compose.render(job, render=self.render)
-                except TypeError:
-                    video_artifact = self.compose.render(job)
-                job.artifacts.video = video_artifact
-
+            burn_subtitles = (
+                self.render.burn_subtitles
+                if self.render is not None
+                else job.settings.burn_subtitles
+            )
+            if burn_subtitles:
+                # 4) Subtitle generation (ASR or fallback)
+                with timer.step("generate_subtitles"):
+                    self._generate_subtitles(job, script_text=script_artifact.text)
+
+                # 5) Compose final video
+                with timer.step("compose_video"):
+                    job.artifacts.video = self._compose(job)
+                return job
+
+            # 4+5) Without burn-in the encode never reads the captions, so the
+            # ffmpeg encode (CPU) runs alongside subtitle/ASR work.
+            compose_timer = StepTimer(clock=clock)
+            pool = ThreadPoolExecutor(max_workers=1)
+            compose_future = pool.submit(self._timed_compose, job, compose_timer)
+            try:
+                with timer.step("generate_subtitles"):
+                    self._generate_subtitles(job, script_text=script_artifact.text)
+            except BaseException as exc:
+                # The run has already failed: don't sit out the rest of the encode, but
+                # make sure a compose failure is still reported rather than dropped.
+                pool.shutdown(wait=False, cancel_futures=True)
+                if compose_future.done():
+                    _note_compose_error(exc, compose_future)
+                else:
+                    compose_future.add_done_callback(_log_compose_error)
+                timer.steps.extend(compose_timer.steps)
+                raise
+            pool.shutdown(wait=True)
+            timer.steps.extend(compose_timer.steps)
+            job.artifacts.video = compose_future.result()
             return job
         finally:
             finished_at = clock()
@@ -135,3 +158,37 @@ class Pipeline:
                 finished_at=finished_at,
                 render=self.render,
             )
+
+    def _generate_subtitles(self, job: Job, *, script_text: str) -> None:
+        subtitle_service = self.subtitles or create_subtitle_service(job)
+        job.artifacts.subtitles = subtitle_service.generate(job, script_text=script_text)
+
+    def _compose(self, job: Job) -> VideoArtifact:
+        # If your ComposeService doesn't accept `render=...` yet, keep the call as `.render(job)`.
+        try:
+            return self.compose.render(job, render=self.render)
+        except TypeError:
+            return self.compose.render(job)
+
+    def _timed_compose(self, job: Job, timer: StepTimer) -> VideoArtifact:
+        """
+        Compose on a worker thread while subtitles are generated.
+
+        Only used when captions are not burned in. Burned-in captions are part of the
+        video frames, so a background-only encode would have to be re-encoded with the
+        subtitles filter afterwards; that second pass costs as much as the encode it
+        would overlap, so the burn-in path stays sequential.
+        """
+        with timer.step("compose_video"):
+            return self._compose(job)
+
+
+def _log_compose_error(future: Future[VideoArtifact]) -> None:
+    if not future.cancelled() and (error := future.exception()) is not None:
+        log.error("Background compose failed after the run had already failed: %s", error)
+
+
+def _note_compose_error(exc: BaseException, future: Future[VideoArtifact]) -> None:
+    if not future.cancelled() and (error := future.exception()) is not None:
+        log.error("Compose also failed: %s", error)
+        exc.add_note(f"Compose also failed: {type(error).__name__}: {error}")
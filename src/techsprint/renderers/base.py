@@ -22,3 +22,6 @@ class RenderSpec:
     subtitle_margin_bottom_px: int | None = None
     subtitle_margin_left_px: int | None = None
     subtitle_margin_right_px: int | None = None
+    x264_preset: str = "medium"
+    x264_crf: int = 20
+    x264_tune: str | None = None
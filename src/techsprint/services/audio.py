@@ -36,8 +36,11 @@ from techsprint.utils.logging import get_logger
 log = get_logger(__name__)
 
 
+WordTimings = list[tuple[str, float, float]]
+
+
 class AudioBackend(Protocol):
-    async def synthesize(self, *, text: str, out_path: Path, voice: str) -> None: ...
+    async def synthesize(self, *, text: str, out_path: Path, voice: str) -> WordTimings | None: ...
 
 
 class StubAudioBackend:
@@ -52,15 +55,32 @@ class StubAudioBackend:
 
 
 class EdgeTTSBackend:
-    """edge-tts backend (async)."""
+    """
+    edge-tts backend (async).
+
+    Streams audio to disk and records WordBoundary events so subtitles can be
+    timed without an ASR pass.
+    """
+
+    # edge-tts reports offsets/durations in 100ns ticks.
+    _TICKS_PER_SECOND = 10_000_000
 
     def __init__(self) -> None:
         import edge_tts  # type: ignore
         self._edge_tts = edge_tts
 
-    async def synthesize(self, *, text: str, out_path: Path, voice: str) -> None:
-        communicate = self._edge_tts.Communicate(text=text, voice=voice)
-        await communicate.save(str(out_path))
+    async def synthesize(self, *, text: str, out_path: Path, voice: str) -> WordTimings:
+        communicate = self._edge_tts.Communicate(text=text, voice=voice, boundary="WordBoundary")
+        word_timings: WordTimings = []
+        with out_path.open("wb") as fh:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    fh.write(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    start = chunk["offset"] / self._TICKS_PER_SECOND
+                    end = start + chunk["duration"] / self._TICKS_PER_SECOND
+                    word_timings.append((chunk["text"], start, end))
+        return word_timings
 
 
 def _run_async(coro):
@@ -125,11 +145,12 @@ class AudioService:
 
         log.info("Generating audio (mp3) voice=%s -> %s", voice, out)
 
+        word_timings: WordTimings | None = None
         if self.backend is not None:
             try:
                 task = _run_async(self.backend.synthesize(text=text, out_path=out, voice=voice))
                 # If _run_async returned a Task (running loop case), we can't block easily here.
-                # In CLI (no loop), asyncio.run completes and returns None.
+                # In CLI (no loop), asyncio.run completes and returns the word timings.
                 if hasattr(task, "__await__"):
                     # best-effort: in case someone calls inside an event loop
                     # they should await externally; we log a warning.
@@ -140,10 +161,13 @@ class AudioService:
                         if out.exists() and out.stat().st_size > 0:
                             break
                         time.sleep(0.1)
+                else:
+                    word_timings = task or None
             except Exception as exc:
                 log.warning("Audio synthesis failed (%s); falling back to sine tone.", exc)
 
         if not out.exists() or out.stat().st_size == 0:
+            word_timings = None
             ffmpeg.ensure_ffmpeg()
             cmd = ffmpeg.build_sine_audio_cmd(str(out))
             log.info("Generating sine audio fallback -> %s", out)
@@ -157,6 +181,7 @@ class AudioService:
             format="mp3",
             text_path=text_path,
             text_sha256=text_sha,
+            word_timings=word_timings,
         )
 
 
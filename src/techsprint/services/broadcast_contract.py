@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import math
 import re
+from collections.abc import Callable
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
-from typing import Callable
 
 
 @dataclass(frozen=True)
@@ -20,8 +21,8 @@ def validate_cue(
     text: str,
     *,
     continuation: bool,
-    forbidden_starts: set[str],
-    dangling_tails: set[str],
+    forbidden_starts: AbstractSet[str],
+    dangling_tails: AbstractSet[str],
     has_verb_fn: Callable[[str], bool],
 ) -> list[str]:
     words = text.split()
@@ -54,8 +55,8 @@ def enforce_contract(
     *,
     max_seconds: float,
     min_seconds: float,
-    forbidden_starts: set[str],
-    dangling_tails: set[str],
+    forbidden_starts: AbstractSet[str],
+    dangling_tails: AbstractSet[str],
     is_continuation_fn: Callable[[str | None, str], bool],
     has_verb_fn: Callable[[str], bool],
     split_text_fn: Callable[[str, int], list[str]],
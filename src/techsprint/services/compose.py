@@ -43,8 +43,11 @@ class ComposeService:
     Notes:
     - Uses a provided background video when available, falling back to a solid color.
     - Uses a RenderSpec (if provided) or `job.settings.burn_subtitles` to decide subtitle burn-in.
+    - `preview=True` trades file size for speed (x264 ultrafast/zerolatency) for demo runs.
     """
 
+    preview: bool = False
+
     def render(self, job: Job, *, render: RenderSpec | None = None) -> VideoArtifact:
         ffmpeg.ensure_ffmpeg()
 
@@ -109,10 +112,10 @@ class ComposeService:
                     raise TechSprintError("Subtitle layout exceeds safe area constraints.")
 
             if subtitles_path:
-                ass_path = job.workspace.path("captions.ass")
-                ffmpeg.write_ass_from_srt(
+                # Kept in the run dir as an artifact; re-renders of the run reuse it.
+                ass_path = ffmpeg.cached_ass_from_srt(
                     Path(subtitles_path),
-                    ass_path,
+                    job.workspace.root,
                     render=render,
                     max_subtitle_lines=MAX_SUBTITLE_LINES,
                     max_chars_per_line=MAX_CHARS_PER_LINE,
@@ -129,6 +132,19 @@ class ComposeService:
         if audio_duration and bg_duration:
             loop_background = audio_duration > (bg_duration + 0.05)
 
+        # Without burn-in, and with the background already at the render size/rate, the
+        # frames pass through untouched, so an H.264 source can be remuxed, not re-encoded.
+        stream_copy_video = (
+            bg_path is not None
+            and subtitles_path is None
+            and ffmpeg.can_stream_copy_video(bg_path, render)
+        )
+        video_encoder = (
+            ffmpeg.CPU_VIDEO_ENCODER
+            if stream_copy_video
+            else ffmpeg.select_video_encoder(job.settings.video_encoder)
+        )
+
         cmd = ffmpeg.build_compose_cmd(
             str(bg_path) if bg_path else None,
             str(audio),
@@ -142,9 +158,15 @@ class ComposeService:
             max_chars_per_line=MAX_CHARS_PER_LINE if burn_subtitles else None,
             subtitles_force_style=subtitles_force_style,
             loudnorm=job.settings.loudnorm,
+            video_encoder=video_encoder,
+            stream_copy_video=stream_copy_video,
+            preset=ffmpeg.PREVIEW_X264_PRESET if self.preview else None,
+            tune=ffmpeg.PREVIEW_X264_TUNE if self.preview else None,
+            faststart=not self.preview,
         )
 
         log.info("Rendering video -> %s", out)
+        # Joined once: run.log and job.ffmpeg_cmd need it regardless of log level.
         cmd_str = " ".join(cmd)
         log.debug("ffmpeg cmd: %s", cmd_str)
 
@@ -11,6 +11,7 @@ Does NOT:
 """
 
 from __future__ import annotations
+import functools
 import json
 import math
 import os
@@ -25,7 +26,7 @@ from techsprint.domain.artifacts import SubtitleArtifact, AsrArtifact
 from techsprint.domain.job import Job
 from techsprint.exceptions import TechSprintError
 from techsprint.utils import ffmpeg
-from techsprint.utils.text import normalize_text, sha256_text
+from techsprint.utils.text import normalize_text, write_text_with_digest
 from techsprint.utils.logging import get_logger
 from techsprint.services import broadcast_contract
 
@@ -37,15 +38,24 @@ class SubtitleBackend(Protocol):
 
 
 def _format_srt_time(seconds: float) -> str:
-    # seconds -> "HH:MM:SS,mmm"
-    ms = int(round((seconds - int(seconds)) * 1000))
-    s = int(seconds)
-    hh = s // 3600
-    mm = (s % 3600) // 60
-    ss = s % 60
+    # seconds -> "HH:MM:SS,mmm"; round once on total ms so 1.9996 never yields ",1000".
+    total_s, ms = divmod(int(round(seconds * 1000)), 1000)
+    total_m, ss = divmod(total_s, 60)
+    hh, mm = divmod(total_m, 60)
     return f"{hh:02d}:{mm:02d}:{ss:02d},{ms:03d}"
 
 
+def _render_srt(cues: list[tuple[float, float, str]], *, sanitize: bool = True) -> bytes:
+    cues = [cue for cue in cues if cue[1] > cue[0]]
+    buf = bytearray()
+    for idx, (start, end, text) in enumerate(cues, start=1):
+        wrapped = _wrap_text_lines(text, duration_seconds=end - start, sanitize=sanitize)
+        buf += (
+            f"{idx}\n{_format_srt_time(start)} --> {_format_srt_time(end)}\n{wrapped}\n\n"
+        ).encode()
+    return bytes(buf.strip()) + b"\n"
+
+
 def _parse_srt_time(value: str) -> float | None:
     try:
         hms, ms = value.split(",")
@@ -74,7 +84,7 @@ ASR_TARGET_MAX_SECONDS = 2.4
 ASR_MAX_CUE_SECONDS = 6.0
 ASR_MIN_WORDS = 2
 ASR_MERGE_TARGET_SECONDS = 2.2
-CAPTION_FORBIDDEN_TOKENS = {
+CAPTION_FORBIDDEN_TOKENS = frozenset({
     "and",
     "but",
     "or",
@@ -92,7 +102,7 @@ CAPTION_FORBIDDEN_TOKENS = {
     "the",
     "a",
     "an",
-}
+})
 CAPTION_METADATA_RE = re.compile(r"\b(anchor|asterisk|narrator|speaker|sfx|music)\b", re.IGNORECASE)
 CAPTION_BRACKET_LINE_RE = re.compile(r"^\W*[\[\(].*[\]\)]\W*$")
 CAPTION_BAD_FORMS = {
@@ -129,7 +139,7 @@ CAPTION_DANGLING_WORDS = {
     "while",
     "though",
 }
-CAPTION_DANGLING_TAIL_WORDS = {
+CAPTION_DANGLING_TAIL_WORDS = frozenset({
     "raising",
     "including",
     "aiming",
@@ -142,7 +152,7 @@ CAPTION_DANGLING_TAIL_WORDS = {
     "but",
     "as",
     "from",
-}
+})
 CAPTION_SHORT_OK = {
     "lastly",
     "finally",
@@ -623,6 +633,23 @@ def _split_cues_for_layout(
     return adjusted
 
 
+def _normalize_segment(seg: object) -> tuple[float, float, str, list | None]:
+    """Return (start, end, text, words) from a dict or an SDK segment object."""
+    if isinstance(seg, dict):
+        return (
+            float(seg["start"]),
+            float(seg["end"]),
+            str(seg.get("text") or "").strip(),
+            seg.get("words"),
+        )
+    return (
+        float(seg.start),  # type: ignore[attr-defined]
+        float(seg.end),  # type: ignore[attr-defined]
+        str(getattr(seg, "text", None) or "").strip(),
+        getattr(seg, "words", None),
+    )
+
+
 def _asr_anchor_cues(
     segments: list[dict],
     *,
@@ -630,14 +657,11 @@ def _asr_anchor_cues(
 ) -> list[tuple[float, float, str]]:
     anchors: list[tuple[float, float, str]] = []
     for seg in segments:
-        start = float(seg["start"])
-        end = float(seg["end"])
+        start, end, text, words = _normalize_segment(seg)
         if audio_duration is not None:
             end = min(end, audio_duration)
         if end <= start:
             continue
-        text = str(seg.get("text", "")).strip()
-        words = seg.get("words")
         if words:
             anchors.extend(
                 _split_asr_segment(
@@ -955,13 +979,7 @@ def _rewrite_srt_with_finalization(path: Path, *, enforce_cps: bool = True) -> N
     if not cues:
         return
     cues = _finalize_cues_for_srt(cues, enforce_cps=enforce_cps)
-    lines: list[str] = []
-    for idx, (start, end, text) in enumerate(cues, start=1):
-        lines.append(str(idx))
-        lines.append(f"{_format_srt_time(start)} --> {_format_srt_time(end)}")
-        lines.append(_wrap_text_lines(text, duration_seconds=end - start))
-        lines.append("")
-    path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+    path.write_bytes(_render_srt(cues))
 
 
 def _strip_dangling_tail(text: str) -> str:
@@ -1516,13 +1534,7 @@ def _write_srt_from_text(
             break
     cues = _postprocess_cues(cues, audio_duration=duration, repairs=repairs)
     cues = _finalize_cues_for_srt(cues)
-    lines: list[str] = []
-    for idx, (start, end, chunk) in enumerate(cues, start=1):
-        lines.append(str(idx))
-        lines.append(f"{_format_srt_time(start)} --> {_format_srt_time(end)}")
-        lines.append(_wrap_text_lines(chunk, duration_seconds=end - start))
-        lines.append("")
-    out_path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+    out_path.write_bytes(_render_srt(cues))
     _rewrite_srt_with_finalization(out_path)
 
 
@@ -2356,13 +2368,49 @@ def _cue_stats(cues: list[tuple[float, float, str]]) -> dict:
     }
 
 
-def _transcribe_with_faster_whisper(audio_path: Path) -> list[dict] | None:
+def _resolve_whisper_runtime(device: str = "auto", compute_type: str = "auto") -> tuple[str, str]:
+    # fp32 doubles/quadruples the bytes moved per matmul; prefer reduced precision.
+    if device == "auto":
+        try:
+            import ctranslate2  # type: ignore
+
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        except (ImportError, OSError, RuntimeError):
+            device = "cpu"
+    if compute_type == "auto":
+        compute_type = "float16" if device == "cuda" else "int8"
+    return device, compute_type
+
+
+def _transcribe_with_faster_whisper(
+    audio_path: Path,
+    *,
+    device: str = "auto",
+    compute_type: str = "auto",
+    batch_size: int = 0,
+) -> list[dict] | None:
     try:
         from faster_whisper import WhisperModel  # type: ignore
     except Exception:
         return None
-    model = WhisperModel("base", device="cpu", compute_type="int8")
-    segments, _info = model.transcribe(str(audio_path), word_timestamps=True)
+    if batch_size < 0:
+        raise TechSprintError("Invalid asr_batch_size; use 0 or a positive integer.")
+    device, compute_type = _resolve_whisper_runtime(device, compute_type)
+    model_kwargs: dict = {"device": device, "compute_type": compute_type}
+    if device == "cpu":
+        model_kwargs["cpu_threads"] = min(4, os.cpu_count() or 1)
+    model = WhisperModel("base", **model_kwargs)
+    if batch_size > 0:
+        # The batched pipeline splits on VAD speech chunks, so each batch holds
+        # similar-length windows instead of padding everything to 30s.
+        from faster_whisper import BatchedInferencePipeline  # type: ignore
+
+        pipeline = BatchedInferencePipeline(model=model)
+        segments, _info = pipeline.transcribe(
+            str(audio_path), word_timestamps=True, batch_size=batch_size
+        )
+    else:
+        segments, _info = model.transcribe(str(audio_path), word_timestamps=True)
     payload = []
     for seg in segments:
         words = None
@@ -2375,6 +2423,33 @@ def _transcribe_with_faster_whisper(audio_path: Path) -> list[dict] | None:
     return payload
 
 
+def _segments_from_word_timings(
+    word_timings: list[tuple[str, float, float]],
+    *,
+    pause_seconds: float = 0.3,
+) -> list[dict]:
+    """Group TTS word boundaries into ASR-shaped segments, splitting on pauses."""
+    segments: list[dict] = []
+    words: list[dict] = []
+    for word, start, end in word_timings:
+        if words and start - words[-1]["end"] > pause_seconds:
+            segments.append(_segment_from_words(words))
+            words = []
+        words.append({"start": start, "end": end, "word": word})
+    if words:
+        segments.append(_segment_from_words(words))
+    return segments
+
+
+def _segment_from_words(words: list[dict]) -> dict:
+    return {
+        "start": words[0]["start"],
+        "end": words[-1]["end"],
+        "text": " ".join(str(w["word"]).strip() for w in words),
+        "words": words,
+    }
+
+
 def _segment_stats(segments: list[dict]) -> dict:
     durations = [float(seg["end"]) - float(seg["start"]) for seg in segments if seg["end"] >= seg["start"]]
     if not durations:
@@ -2386,6 +2461,18 @@ def _segment_stats(segments: list[dict]) -> dict:
     }
 
 
+# Models documented to return segment timestamps via verbose_json; others go straight to json.
+VERBOSE_JSON_MODELS = frozenset({"whisper-1"})
+
+
+@functools.lru_cache(maxsize=4)
+def _openai_client(api_key: str):
+    """Share one client (and its keep-alive connection pool) per API key."""
+    from openai import OpenAI  # local import
+
+    return OpenAI(api_key=api_key)
+
+
 class OpenAITranscribeBackend:
     """
     OpenAI transcription backend that produces SRT by converting returned segments.
@@ -2400,29 +2487,38 @@ class OpenAITranscribeBackend:
         *,
         duration_hint: float | None = None,
     ) -> None:
-        from openai import OpenAI  # local import
-
-        self._client = OpenAI(api_key=api_key)
+        self._client = _openai_client(api_key)
         self._model = model
         self._duration_hint = duration_hint
+        self._audio: tuple[Path, bytes] | None = None
+
+    def _audio_upload(self, audio_path: Path) -> tuple[str, bytes, str]:
+        # Read once so the json fallback re-sends the same bytes without touching disk.
+        cached = self._audio
+        if cached is None or cached[0] != audio_path:
+            cached = (audio_path, audio_path.read_bytes())
+            self._audio = cached
+        return audio_path.name, cached[1], "audio/mpeg"
 
     def _request_transcription(self, *, audio_path: Path, response_format: str):
-        with audio_path.open("rb") as f:
-            return self._client.audio.transcriptions.create(
-                model=self._model,
-                file=f,
-                response_format=response_format,
-            )
+        return self._client.audio.transcriptions.create(
+            model=self._model,
+            file=self._audio_upload(audio_path),
+            response_format=response_format,
+        )
 
     def transcribe_to_srt(self, *, audio_path: Path, out_path: Path) -> None:
+        response_format = "verbose_json" if self._model in VERBOSE_JSON_MODELS else "json"
         try:
             resp = self._request_transcription(
                 audio_path=audio_path,
-                response_format="verbose_json",
+                response_format=response_format,
             )
         except Exception as exc:
             msg = str(exc)
-            if "response_format" in msg or "unsupported_value" in msg:
+            if response_format == "verbose_json" and (
+                "response_format" in msg or "unsupported_value" in msg
+            ):
                 log.warning(
                     "Transcription model does not support verbose_json; falling back to json."
                 )
@@ -2455,13 +2551,11 @@ class OpenAITranscribeBackend:
 
         cues: list[tuple[float, float, str]] = []
         for seg in segments:
-            start = float(getattr(seg, "start", None) or seg["start"])
-            end = float(getattr(seg, "end", None) or seg["end"])
+            start, end, text, _words = _normalize_segment(seg)
             if audio_duration is not None:
                 end = min(end, audio_duration)
             if end <= start:
                 continue
-            text = str(getattr(seg, "text", None) or seg["text"]).strip()
             if not text:
                 continue
 
@@ -2479,14 +2573,7 @@ class OpenAITranscribeBackend:
                 cues.append((seg_start, seg_end, chunk))
         cues = _postprocess_cues(cues, audio_duration=audio_duration, merge_gap_seconds=0.0)
         cues = _finalize_cues_for_srt(cues)
-        lines: list[str] = []
-        for idx, (start, end, chunk) in enumerate(cues, start=1):
-            lines.append(str(idx))
-            lines.append(f"{_format_srt_time(start)} --> {_format_srt_time(end)}")
-            lines.append(_wrap_text_lines(chunk, duration_seconds=end - start))
-            lines.append("")
-
-        out_path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+        out_path.write_bytes(_render_srt(cues))
 
 
 class FallbackSubtitleBackend:
@@ -2511,8 +2598,7 @@ class SubtitleService:
         out = job.workspace.subtitles_srt
         normalized_text = normalize_text(script_text)
         text_path = job.workspace.subtitles_text_txt
-        text_path.write_text(normalized_text, encoding="utf-8")
-        subtitle_digest = sha256_text(normalized_text)
+        subtitle_digest = write_text_with_digest(text_path, normalized_text)
         audio_digest = job.artifacts.audio.text_sha256 if job.artifacts.audio else None
         if not audio_digest:
             raise TechSprintError(
@@ -2530,8 +2616,21 @@ class SubtitleService:
         if self.mode not in {"auto", "asr", "heuristic"}:
             raise TechSprintError("Invalid subtitles mode; use auto, asr, or heuristic.")
 
+        word_timings = job.artifacts.audio.word_timings if job.artifacts.audio else None
+        # Only auto mode may substitute TTS word boundaries; asr mode always transcribes.
+        use_tts_timings = self.mode == "auto" and bool(word_timings)
         if self.mode in {"auto", "asr"} and audio.exists():
-            segments = _transcribe_with_faster_whisper(audio)
+            if use_tts_timings:
+                # TTS already knows when each word is spoken; skip the ASR round trip.
+                log.info("Subtitle timing: TTS word boundaries (ASR skipped).")
+                segments = _segments_from_word_timings(word_timings)
+            else:
+                segments = _transcribe_with_faster_whisper(
+                    audio,
+                    device=job.settings.asr_device,
+                    compute_type=job.settings.asr_compute_type,
+                    batch_size=job.settings.asr_batch_size,
+                )
             if segments is None:
                 if self.mode == "asr":
                     raise TechSprintError("faster-whisper not installed; cannot use ASR subtitles.")
@@ -2544,7 +2643,8 @@ class SubtitleService:
 
                 cues: list[tuple[float, float, str]] = []
                 source_text = ""
-                if segments:
+                timing_source = "tts" if use_tts_timings else "asr"
+                if segments and not use_tts_timings:
                     asr_json_path = job.workspace.asr_json
                     asr_txt_path = job.workspace.asr_txt
                     asr_payload = {"segments": segments}
@@ -2604,23 +2704,7 @@ class SubtitleService:
                         cues = _split_cues_for_max_duration_verbatim(cues)
 
                 if cues:
-                    lines: list[str] = []
-                    idx = 1
-                    for cue_start, cue_end, cue_text in cues:
-                        if cue_end <= cue_start:
-                            continue
-                        lines.append(str(idx))
-                        lines.append(f"{_format_srt_time(cue_start)} --> {_format_srt_time(cue_end)}")
-                        lines.append(
-                            _wrap_text_lines(
-                                cue_text,
-                                duration_seconds=cue_end - cue_start,
-                                sanitize=False,
-                            )
-                        )
-                        lines.append("")
-                        idx += 1
-                    out.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+                    out.write_bytes(_render_srt(cues, sanitize=False))
                     verbatim_check = _verbatim_check_srt(
                         srt_path=out,
                         source_text=source_text,
@@ -2644,7 +2728,7 @@ class SubtitleService:
                         format="srt",
                         text_path=text_path,
                         text_sha256=subtitle_digest,
-                        source="asr" if verbatim_policy == "audio" else "script",
+                        source=timing_source if verbatim_policy == "audio" else "script",
                         segment_count=len(segments),
                         segment_stats=_segment_stats(segments),
                         cue_count=len(cues),
@@ -2652,21 +2736,16 @@ class SubtitleService:
                         asr_split=True,
                     )
 
-                lines: list[str] = []
-                idx = 1
                 cues: list[tuple[float, float, str]] = []
                 integrity_repairs: list[str] = []
                 for seg in segments:
-                    start = float(seg["start"])
-                    end = float(seg["end"])
+                    start, end, text, seg_words = _normalize_segment(seg)
                     if audio_duration is not None:
                         end = min(end, audio_duration)
                     if end <= start:
                         continue
-                    text = str(seg["text"]).strip()
                     if not text:
                         continue
-                    seg_words = seg.get("words")
                     seg_cues = _split_asr_segment(
                         start=start,
                         end=end,
@@ -2681,22 +2760,14 @@ class SubtitleService:
                     repairs=integrity_repairs,
                 )
                 cues = _finalize_cues_for_srt(cues)
-                for cue_start, cue_end, cue_text in cues:
-                    if cue_end <= cue_start:
-                        continue
-                    lines.append(str(idx))
-                    lines.append(f"{_format_srt_time(cue_start)} --> {_format_srt_time(cue_end)}")
-                    lines.append(_wrap_text_lines(cue_text, duration_seconds=cue_end - cue_start))
-                    lines.append("")
-                    idx += 1
-                out.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+                out.write_bytes(_render_srt(cues))
                 _rewrite_srt_with_finalization(out)
                 return SubtitleArtifact(
                     path=out,
                     format="srt",
                     text_path=text_path,
                     text_sha256=subtitle_digest,
-                    source="asr",
+                    source=timing_source,
                     segment_count=len(segments),
                     segment_stats=_segment_stats(segments),
                     cue_count=len(cues),
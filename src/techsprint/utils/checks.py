@@ -1,12 +1,35 @@
 from __future__ import annotations
 
+import os
 import shutil
 
 from techsprint.exceptions import DependencyMissingError
 
+# binary -> (PATH it was resolved under, resolved executable)
+_WHICH_CACHE: dict[str, tuple[str, str]] = {}
+
+
+def resolve_binary(binary: str) -> str | None:
+    """shutil.which with a per-process cache, revalidated when PATH or the binary changes."""
+    path_env = os.environ.get("PATH", "")
+    cached = _WHICH_CACHE.get(binary)
+    # One access() on the known location instead of a stat per PATH entry.
+    if cached is not None and cached[0] == path_env and os.access(cached[1], os.X_OK):
+        return cached[1]
+    resolved = shutil.which(binary)
+    if resolved is None:
+        _WHICH_CACHE.pop(binary, None)
+        return None
+    _WHICH_CACHE[binary] = (path_env, resolved)
+    return resolved
+
+
+def clear_binary_cache() -> None:
+    _WHICH_CACHE.clear()
+
 
 def require_binary(binary: str) -> None:
-    if shutil.which(binary) is None:
+    if resolve_binary(binary) is None:
         raise DependencyMissingError(
             f"Missing required dependency '{binary}'. Install it and try again."
         )
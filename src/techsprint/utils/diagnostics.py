@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import importlib
+import functools
 import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Callable
 
@@ -23,17 +25,24 @@ def _run_cmd(cmd: list[str]) -> tuple[int, str]:
     return proc.returncode, proc.stdout.strip() or proc.stderr.strip()
 
 
+@functools.cache
 def _module_available(name: str) -> bool:
+    # find_spec locates the module without running its import-time side effects.
     try:
-        importlib.import_module(name)
-    except Exception:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
         return False
-    return True
 
 
 def _check_writable(path: Path) -> bool:
     try:
         path.mkdir(parents=True, exist_ok=True)
+    except Exception:
+        return False
+    if os.access(path, os.W_OK | os.X_OK):
+        return True
+    # access() can under-report on network filesystems (NFS/SMB); confirm with a real write.
+    try:
         with tempfile.NamedTemporaryFile(dir=path, delete=True):
             return True
     except Exception:
@@ -61,6 +70,13 @@ def _ffmpeg_hint() -> str:
     return "Linux: install via your package manager (e.g., `sudo apt-get install ffmpeg`) and ensure PATH includes ffmpeg."
 
 
+def _run_probes(probes: dict[str, Callable[[], object]]) -> dict[str, object]:
+    # Probes are subprocess waits and imports, so threads overlap them fine.
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = {label: pool.submit(probe) for label, probe in probes.items()}
+        return {label: future.result() for label, future in futures.items()}
+
+
 def run_doctor(settings: Settings) -> int:
     required_ok = True
     lines: list[str] = []
@@ -73,12 +89,22 @@ def run_doctor(settings: Settings) -> int:
     lines.append(_status_line(True, "TechSprint version", f": {_get_version()}"))
 
     workdir = Path(settings.workdir).expanduser().resolve()
-    writable = _check_writable(workdir)
+    results = _run_probes(
+        {
+            "workdir": lambda: _check_writable(workdir),
+            "ffmpeg": lambda: _run_cmd(["ffmpeg", "-version"]),
+            "ffprobe": lambda: _run_cmd(["ffprobe", "-version"]),
+            "edge_tts": lambda: _module_available("edge_tts"),
+            "feedparser": lambda: _module_available("feedparser"),
+        }
+    )
+
+    writable = results["workdir"]
     if not writable:
         required_ok = False
     lines.append(_status_line(writable, "Workdir writable", f": {workdir}"))
 
-    ffmpeg_code, ffmpeg_out = _run_cmd(["ffmpeg", "-version"])
+    ffmpeg_code, ffmpeg_out = results["ffmpeg"]
     if ffmpeg_code != 0:
         required_ok = False
         lines.append(_status_line(False, "ffmpeg", " (not found)"))
@@ -87,7 +113,7 @@ def run_doctor(settings: Settings) -> int:
         first_line = ffmpeg_out.splitlines()[0] if ffmpeg_out else "available"
         lines.append(_status_line(True, "ffmpeg", f": {first_line}"))
 
-    ffprobe_code, ffprobe_out = _run_cmd(["ffprobe", "-version"])
+    ffprobe_code, ffprobe_out = results["ffprobe"]
     if ffprobe_code != 0:
         required_ok = False
         lines.append(_status_line(False, "ffprobe", " (not found)"))
@@ -96,12 +122,12 @@ def run_doctor(settings: Settings) -> int:
         first_line = ffprobe_out.splitlines()[0] if ffprobe_out else "available"
         lines.append(_status_line(True, "ffprobe", f": {first_line}"))
 
-    if _module_available("edge_tts"):
+    if results["edge_tts"]:
         lines.append(_status_line(True, "edge-tts", " (available)"))
     else:
         lines.append(_warn_line("edge-tts", " (not installed)"))
 
-    if _module_available("feedparser"):
+    if results["feedparser"]:
         lines.append(_status_line(True, "feedparser", " (available)"))
     else:
         lines.append(_warn_line("feedparser", " (not installed)"))
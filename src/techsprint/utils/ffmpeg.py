@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-import json
+# json and concurrent.futures are imported where used: most callers only assemble
+# commands, and these two are a measurable share of this module's import time.
+import contextlib
+import functools
+import hashlib
+import os
 import re
-import shutil
 import subprocess
+import tempfile
+from collections import deque
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from techsprint.exceptions import TechSprintError
-from techsprint.utils.checks import require_binary
+from techsprint.utils.checks import require_binary, resolve_binary
 
 if TYPE_CHECKING:
     from techsprint.renderers.base import RenderSpec
@@ -18,6 +26,164 @@ def ensure_ffmpeg() -> None:
     require_binary("ffmpeg")
 
 
+# Bound probes so one malformed input (or a wedged driver) can't stall a batch.
+PROBE_TIMEOUT_SECONDS = 10
+LOUDNORM_TIMEOUT_SECONDS = 60
+
+
+def _run_probe(argv: list[str], *, timeout: float) -> subprocess.CompletedProcess[str] | None:
+    """Run a short-lived ffprobe/ffmpeg query; None if it exceeds `timeout`."""
+    try:
+        return subprocess.run(argv, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None
+
+
+CPU_VIDEO_ENCODER = "libx264"
+HW_VIDEO_ENCODERS = {
+    "nvenc": "h264_nvenc",
+    "vt": "h264_videotoolbox",
+    "qsv": "h264_qsv",
+}
+
+
+def _hw_encoder_works(ffmpeg: str, encoder: str) -> bool:
+    # Builds often list encoders whose hardware is absent; a tiny trial encode confirms it.
+    try:
+        proc = subprocess.run(
+            [
+                ffmpeg,
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                "lavfi",
+                "-i",
+                "color=c=black:s=256x256:d=0.1",
+                "-c:v",
+                encoder,
+                "-f",
+                "null",
+                "-",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+            timeout=PROBE_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return proc.returncode == 0
+
+
+@functools.cache
+def available_hw_encoders() -> tuple[str, ...]:
+    ffmpeg = resolve_binary("ffmpeg")
+    if not ffmpeg:
+        return ()
+    try:
+        proc = _run_probe([ffmpeg, "-hide_banner", "-encoders"], timeout=PROBE_TIMEOUT_SECONDS)
+    except OSError:
+        return ()
+    if proc is None or proc.returncode != 0:
+        return ()
+    return tuple(
+        encoder
+        for encoder in HW_VIDEO_ENCODERS.values()
+        if encoder in proc.stdout and _hw_encoder_works(ffmpeg, encoder)
+    )
+
+
+def select_video_encoder(preference: str = "auto") -> str:
+    if preference == "cpu":
+        return CPU_VIDEO_ENCODER
+    if preference in HW_VIDEO_ENCODERS:
+        return HW_VIDEO_ENCODERS[preference]
+    if preference != "auto":
+        raise TechSprintError("Invalid video_encoder; use auto, cpu, nvenc, vt, or qsv.")
+    hw_encoders = available_hw_encoders()
+    return hw_encoders[0] if hw_encoders else CPU_VIDEO_ENCODER
+
+
+X264_PRESET = "medium"
+X264_CRF = 20
+# Preview/debug encodes: skip motion-estimation and B-frame search for speed.
+PREVIEW_X264_PRESET = "ultrafast"
+PREVIEW_X264_TUNE = "zerolatency"
+
+
+def video_encoder_args(
+    encoder: str = CPU_VIDEO_ENCODER,
+    *,
+    preset: str = X264_PRESET,
+    crf: int = X264_CRF,
+    tune: str | None = None,
+) -> list[str]:
+    # Hardware encoders follow the same crf and preview/final choice as libx264.
+    preview = preset == PREVIEW_X264_PRESET
+    if encoder == "h264_nvenc":
+        # NVENC's constant-quality scale runs a few points below x264 CRF for similar output.
+        nvenc_preset = "p1" if preview else "p5"
+        return [
+            "-c:v",
+            encoder,
+            "-preset",
+            nvenc_preset,
+            "-tune",
+            "hq",
+            "-rc",
+            "vbr",
+            "-cq",
+            str(crf + 3),
+        ]
+    if encoder == "h264_videotoolbox":
+        args = ["-c:v", encoder, "-q:v", "50"]
+        return args + ["-realtime", "1"] if preview else args
+    if encoder == "h264_qsv":
+        qsv_preset = "veryfast" if preview else "medium"
+        return ["-c:v", encoder, "-preset", qsv_preset, "-global_quality", str(crf)]
+    args = ["-c:v", encoder, "-preset", preset, "-crf", str(crf)]
+    if tune:
+        args += ["-tune", tune]
+    args += ["-threads", "0", "-x264-params", _x264_params(tune, os.cpu_count() or 1)]
+    return args
+
+
+def _x264_params(tune: str | None, ncpu: int) -> str:
+    if tune == PREVIEW_X264_TUNE:
+        # Low-latency previews: slice threads, capped so small CI boxes aren't oversubscribed.
+        return f"threads={min(8, ncpu)}:sliced-threads=1"
+    # Final renders: frame threads plus parallel lookahead, which is otherwise serial.
+    return "threads=auto:lookahead-threads=auto:sliced-threads=0"
+
+
+# Minimal input analysis for inputs whose stream layout is known up front (our own mp3
+# narration, mp4 frame grabs); ffmpeg otherwise spends up to ~5s probing each input.
+LOW_LATENCY_INPUT_ARGS = ("-probesize", "32", "-analyzeduration", "0", "-fpsprobesize", "0")
+
+
+def _input_args(path: str | Path, *, low_latency: bool) -> list[str]:
+    args = list(LOW_LATENCY_INPUT_ARGS) if low_latency else []
+    return [*args, "-i", str(path)]
+
+
+VIDEO_FILTER_OUTPUT = "vout"
+
+
+def _build_video_filtergraph(stages: list[tuple[str, list[str]]]) -> str | None:
+    """Chain non-empty stages from [0:v] through labelled pads, ending at [vout]."""
+    stages = [(label, filters) for label, filters in stages if filters]
+    if not stages:
+        return None
+    parts: list[str] = []
+    source = "0:v"
+    for idx, (label, filters) in enumerate(stages):
+        sink = VIDEO_FILTER_OUTPUT if idx == len(stages) - 1 else label
+        parts.append(f"[{source}]{','.join(filters)}[{sink}]")
+        source = sink
+    return ";".join(parts)
+
+
 def build_compose_cmd(
     background_video: str | None,
     narration_audio: str,
@@ -33,7 +199,20 @@ def build_compose_cmd(
     debug_safe_area: bool = False,
     subtitles_force_style: bool = True,
     loudnorm: bool = False,
+    video_encoder: str = CPU_VIDEO_ENCODER,
+    stream_copy_video: bool = False,
+    low_latency: bool = True,
+    preset: str | None = None,
+    crf: int | None = None,
+    tune: str | None = None,
+    faststart: bool = False,
 ) -> list[str]:
+    """
+    Build the final compose command.
+
+    faststart moves the moov atom to the front for streaming, at the cost of a second
+    pass over the file; set it for final outputs and leave it off for previews.
+    """
     cmd: list[str] = [
         "ffmpeg",
         "-y",
@@ -56,17 +235,23 @@ def build_compose_cmd(
         cmd += ["-i", background_video]
     elif background_color is None:
         raise TechSprintError("Background video or color must be provided.")
-
-    cmd += ["-i", narration_audio]
-
-    filters: list[str] = []
-    if duration_seconds is not None:
-        filters.append(f"trim=duration={duration_seconds:.3f},setpts=PTS-STARTPTS")
-    if render is not None:
-        filters.append(f"scale={render.width}:{render.height}")
-        filters.append(f"fps={render.fps}")
+    elif stream_copy_video:
+        raise TechSprintError("Video stream copy requires a background video.")
+
+    cmd += _input_args(narration_audio, low_latency=low_latency)
+
+    base_filters: list[str] = []
+    if duration_seconds is not None and not stream_copy_video:
+        base_filters.append(f"trim=duration={duration_seconds:.3f},setpts=PTS-STARTPTS")
+    if render is not None and not stream_copy_video:
+        # A stream-copied background already matches the render size and rate.
+        base_filters.append(f"scale={render.width}:{render.height}")
+        base_filters.append(f"fps={render.fps}")
+        # Pin the output pixel format once so later stages don't bounce between formats.
+        base_filters.append("format=yuv420p")
+    subtitle_filters: list[str] = []
     if subtitles_srt:
-        filters.append(
+        subtitle_filters.append(
             build_subtitles_filter(
                 subtitles_srt,
                 render=render,
@@ -75,10 +260,18 @@ def build_compose_cmd(
                 force_style=subtitles_force_style,
             )
         )
-    if debug_safe_area:
-        filters.extend(build_safe_area_overlay_filters(render))
-    if filters:
-        cmd += ["-vf", ",".join(filters)]
+    overlay_filters = build_safe_area_overlay_filters(render) if debug_safe_area else []
+    graph = _build_video_filtergraph(
+        [("bg", base_filters), ("subs", subtitle_filters), ("overlay", overlay_filters)]
+    )
+    if graph:
+        if stream_copy_video:
+            raise TechSprintError("Video stream copy cannot apply scale/fps/subtitle filters.")
+        cmd += ["-filter_complex", graph, "-map", f"[{VIDEO_FILTER_OUTPUT}]", "-map", "1:a"]
+    elif stream_copy_video:
+        # Without explicit maps ffmpeg would pick the background's own audio track
+        # whenever it has more channels than the narration.
+        cmd += ["-map", "0:v:0", "-map", "1:a:0"]
 
     if duration_seconds is not None:
         cmd += ["-t", f"{duration_seconds:.3f}"]
@@ -90,42 +283,35 @@ def build_compose_cmd(
         audio_filters.append("loudnorm=I=-16:TP=-1.5:LRA=11:print_format=json")
     audio_filters.append("aresample=async=1:first_pts=0")
 
+    cmd += ["-af", ",".join(audio_filters)]
+    if stream_copy_video:
+        cmd += ["-c:v", "copy"]
+    else:
+        cmd += video_encoder_args(
+            video_encoder,
+            preset=preset or (render.x264_preset if render else X264_PRESET),
+            crf=crf if crf is not None else (render.x264_crf if render else X264_CRF),
+            tune=tune or (render.x264_tune if render else None),
+        )
+        cmd += ["-pix_fmt", "yuv420p"]
     cmd += [
-        "-af",
-        ",".join(audio_filters),
-        "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-crf",
-        "20",
-        "-pix_fmt",
-        "yuv420p",
         "-c:a",
         "aac",
         "-b:a",
         "192k",
-        out,
     ]
+    if faststart:
+        cmd += ["-movflags", "+faststart"]
+    cmd.append(out)
     return cmd
 
 
-def _escape_ass_value(value: str) -> str:
-    return (
-        value.replace("\\", r"\\")
-        .replace(":", r"\:")
-        .replace(",", r"\,")
-        .replace("'", r"\'")
-    )
+_FILTER_ESCAPE = str.maketrans({"\\": "\\\\", ":": "\\:", ",": "\\,", "'": "\\'"})
 
 
-def _escape_filter_path(value: str) -> str:
-    return (
-        value.replace("\\", r"\\")
-        .replace(":", r"\:")
-        .replace(",", r"\,")
-        .replace("'", r"\'")
-    )
+def _escape_filter_arg(value: str) -> str:
+    """Escape a filter option value (paths, force_style) in one pass."""
+    return value.translate(_FILTER_ESCAPE)
 
 
 def build_subtitles_filter(
@@ -136,7 +322,7 @@ def build_subtitles_filter(
     max_chars_per_line: int | None = None,
     force_style: bool = True,
 ) -> str:
-    path_value = _escape_filter_path(subtitles_srt)
+    path_value = _escape_filter_arg(subtitles_srt)
     if subtitles_srt.lower().endswith((".ass", ".ssa")):
         return f"ass={path_value}"
     if not force_style:
@@ -160,10 +346,16 @@ def build_subtitles_filter(
         f"MarginR={style['margin_r']},"
         "Alignment=2"
     )
-    return f"subtitles={path_value}:force_style='{_escape_ass_value(style)}'"
+    return f"subtitles={path_value}:force_style='{_escape_filter_arg(style)}'"
 
 
-def safe_area_margins(render: RenderSpec | None = None) -> dict[str, int]:
+def safe_area_margins(render: RenderSpec | None = None) -> Mapping[str, int]:
+    # RenderSpec is frozen, so the spec itself is the cache key; results are read-only views.
+    return MappingProxyType(_safe_area_margins(render))
+
+
+@functools.lru_cache(maxsize=64)
+def _safe_area_margins(render: RenderSpec | None) -> dict[str, int]:
     width = render.width if render else 1080
     height = render.height if render else 1920
     top_pct = render.safe_area_top_pct if render else 0.10
@@ -189,6 +381,15 @@ def subtitle_style_params(
     *,
     max_subtitle_lines: int | None = None,
     max_chars_per_line: int | None = None,
+) -> Mapping[str, int | str]:
+    return MappingProxyType(_subtitle_style_params(render, max_subtitle_lines, max_chars_per_line))
+
+
+@functools.lru_cache(maxsize=64)
+def _subtitle_style_params(
+    render: RenderSpec | None,
+    max_subtitle_lines: int | None,
+    max_chars_per_line: int | None,
 ) -> dict[str, int | str]:
     margins = safe_area_margins(render)
     base_width = margins["width"]
@@ -321,6 +522,11 @@ def subtitle_layout_ok(
 
 
 def build_safe_area_overlay_filters(render: RenderSpec | None = None) -> list[str]:
+    return list(_safe_area_overlay_filters(render))
+
+
+@functools.lru_cache(maxsize=64)
+def _safe_area_overlay_filters(render: RenderSpec | None) -> tuple[str, ...]:
     margins = safe_area_margins(render)
     width = margins["width"]
     height = margins["height"]
@@ -330,16 +536,22 @@ def build_safe_area_overlay_filters(render: RenderSpec | None = None) -> list[st
     margin_r = margins["margin_right"]
     safe_w = width - margin_l - margin_r
     safe_h = height - margin_top - margin_bottom
-    return [
+    return (
         f"drawbox=x={margin_l}:y={margin_top}:w={safe_w}:h={safe_h}:color=yellow@0.3:t=2",
         f"drawbox=x=0:y={height - margin_bottom}:w={width}:h={margin_bottom}:color=red@0.2:t=2",
         f"drawbox=x=0:y=0:w={width}:h={margin_top}:color=red@0.2:t=2",
         f"drawbox=x=0:y=0:w={margin_l}:h={height}:color=red@0.2:t=2",
         f"drawbox=x={width - margin_r}:y=0:w={margin_r}:h={height}:color=red@0.2:t=2",
-    ]
+    )
 
 
-def build_extract_frame_cmd(video: str | Path, out: str | Path, *, seconds: float) -> list[str]:
+def build_extract_frame_cmd(
+    video: str | Path,
+    out: str | Path,
+    *,
+    seconds: float,
+    low_latency: bool = True,
+) -> list[str]:
     return [
         "ffmpeg",
         "-y",
@@ -348,8 +560,7 @@ def build_extract_frame_cmd(video: str | Path, out: str | Path, *, seconds: floa
         "error",
         "-ss",
         f"{seconds:.3f}",
-        "-i",
-        str(video),
+        *_input_args(video, low_latency=low_latency),
         "-frames:v",
         "1",
         str(out),
@@ -362,6 +573,7 @@ def build_debug_frame_cmd(
     *,
     seconds: float,
     render: RenderSpec | None = None,
+    low_latency: bool = True,
 ) -> list[str]:
     filters = ",".join(build_safe_area_overlay_filters(render))
     return [
@@ -372,8 +584,7 @@ def build_debug_frame_cmd(
         "error",
         "-ss",
         f"{seconds:.3f}",
-        "-i",
-        str(video),
+        *_input_args(video, low_latency=low_latency),
         "-vf",
         filters,
         "-frames:v",
@@ -382,6 +593,49 @@ def build_debug_frame_cmd(
     ]
 
 
+_ASS_TEXT_ESCAPE = str.maketrans({"\\": r"\\", "{": r"\{", "}": r"\}", "\n": r"\N"})
+
+
+@functools.lru_cache(maxsize=32)
+def _ass_header(
+    font_name: str,
+    width: int,
+    height: int,
+    font_size: int,
+    outline: int,
+    shadow: int,
+    margin_l: int,
+    margin_r: int,
+    margin_v: int,
+) -> str:
+    return "\n".join(
+        [
+            "[Script Info]",
+            "ScriptType: v4.00+",
+            f"PlayResX: {width}",
+            f"PlayResY: {height}",
+            "",
+            "[V4+ Styles]",
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
+            "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, "
+            "ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+            "Alignment, MarginL, MarginR, MarginV, Encoding",
+            (
+                "Style: Default,"
+                f"{font_name},"
+                f"{font_size},"
+                "&H00FFFFFF,&H000000FF,&H00000000,&H64000000,"
+                "0,0,0,0,100,100,0,0,1,"
+                f"{outline},{shadow},2,"
+                f"{margin_l},{margin_r},{margin_v},1"
+            ),
+            "",
+            "[Events]",
+            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+        ]
+    )
+
+
 def write_ass_from_srt(
     srt_path: Path,
     ass_path: Path,
@@ -396,137 +650,194 @@ def write_ass_from_srt(
         max_subtitle_lines=max_subtitle_lines,
         max_chars_per_line=max_chars_per_line,
     )
-    width = int(style["width"])
-    height = int(style["height"])
-    outline = int(style["outline"])
-    shadow = int(style["shadow"])
-    font_size = int(style["font_size"])
-    margin_l = int(style["margin_l"])
-    margin_r = int(style["margin_r"])
-    margin_v = int(style["margin_v"])
-
-    lines = [
-        "[Script Info]",
-        "ScriptType: v4.00+",
-        f"PlayResX: {width}",
-        f"PlayResY: {height}",
-        "",
-        "[V4+ Styles]",
-        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
-        "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, "
-        "ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
-        "Alignment, MarginL, MarginR, MarginV, Encoding",
-        (
-            "Style: Default,"
-            f"{style['font_name']},"
-            f"{font_size},"
-            "&H00FFFFFF,&H000000FF,&H00000000,&H64000000,"
-            "0,0,0,0,100,100,0,0,1,"
-            f"{outline},{shadow},2,"
-            f"{margin_l},{margin_r},{margin_v},1"
-        ),
-        "",
-        "[Events]",
-        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
-    ]
-
+    header = _ass_header(
+        str(style["font_name"]),
+        int(style["width"]),
+        int(style["height"]),
+        int(style["font_size"]),
+        int(style["outline"]),
+        int(style["shadow"]),
+        int(style["margin_l"]),
+        int(style["margin_r"]),
+        int(style["margin_v"]),
+    )
+    lines = [header]
     for start, end, text in cues:
-        start_ass = _format_ass_time(start)
-        end_ass = _format_ass_time(end)
-        text = (
-            text.replace("\\", r"\\")
-            .replace("{", r"\{")
-            .replace("}", r"\}")
-            .replace("\n", r"\N")
-        )
         lines.append(
-            f"Dialogue: 0,{start_ass},{end_ass},Default,,0,0,0,,{text}"
+            f"Dialogue: 0,{_format_ass_time(start)},{_format_ass_time(end)},Default,,0,0,0,,"
+            f"{text.translate(_ASS_TEXT_ESCAPE)}"
         )
-
     ass_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
     return ass_path
 
 
+# Bump when write_ass_from_srt output changes so stale cached ASS files are not reused.
+ASS_CACHE_VERSION = 1
+
+
+def cached_ass_from_srt(
+    srt_path: Path,
+    cache_dir: Path,
+    *,
+    render: RenderSpec | None,
+    max_subtitle_lines: int,
+    max_chars_per_line: int,
+) -> Path:
+    """
+    Convert SRT to ASS once per (SRT bytes, resolved style) and reuse the file, so repeat
+    encodes of the same captions skip the conversion and libass SRT shaping.
+
+    Callers pass the run workspace as cache_dir. Writing a new conversion removes the
+    other `captions-*.ass` files there, so a run keeps only the ASS for its current
+    captions and style instead of accumulating one per edit.
+    """
+    style = subtitle_style_params(
+        render,
+        max_subtitle_lines=max_subtitle_lines,
+        max_chars_per_line=max_chars_per_line,
+    )
+    style_key = repr((ASS_CACHE_VERSION, sorted(style.items()))).encode("utf-8")
+    digest = hashlib.blake2b(srt_path.read_bytes() + style_key, digest_size=8).hexdigest()
+    ass_path = cache_dir / f"captions-{digest}.ass"
+    if ass_path.exists():
+        return ass_path
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # A unique temp name keeps concurrent conversions in one process from clobbering
+    # each other before the atomic rename.
+    with tempfile.NamedTemporaryFile(
+        dir=cache_dir, prefix=f"{ass_path.name}.", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        write_ass_from_srt(
+            srt_path,
+            tmp_path,
+            render=render,
+            max_subtitle_lines=max_subtitle_lines,
+            max_chars_per_line=max_chars_per_line,
+        )
+        os.replace(tmp_path, ass_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    for stale in cache_dir.glob("captions-*.ass"):
+        if stale != ass_path:
+            stale.unlink(missing_ok=True)
+    return ass_path
+
+
+# The body is the run of non-blank lines after the timing line; an empty cue ends at its
+# blank separator rather than running into the next cue.
+_SRT_CUE_RE = re.compile(
+    r"(\d+):(\d{2}):(\d{2}),(\d{3})[ \t]*-->[ \t]*(\d+):(\d{2}):(\d{2}),(\d{3})[^\n]*"
+    r"((?:\n[ \t]*\S[^\n]*)*)"
+)
+
+
 def _parse_srt_entries(path: Path) -> list[tuple[float, float, str]]:
     if not path.exists():
         return []
+    content = path.read_text(encoding="utf-8", errors="ignore").replace("\r\n", "\n")
     entries: list[tuple[float, float, str]] = []
-    for block in path.read_text(encoding="utf-8", errors="ignore").split("\n\n"):
-        lines = [l.rstrip() for l in block.splitlines() if l.strip()]
-        if not lines:
-            continue
-        timing = lines[1] if len(lines) > 1 and "-->" in lines[1] else (lines[0] if "-->" in lines[0] else None)
-        if not timing:
+    for match in _SRT_CUE_RE.finditer(content):
+        h1, m1, s1, ms1, h2, m2, s2, ms2, body = match.groups()
+        start = int(h1) * 3600 + int(m1) * 60 + int(s1) + int(ms1) / 1000.0
+        end = int(h2) * 3600 + int(m2) * 60 + int(s2) + int(ms2) / 1000.0
+        if end <= start:
             continue
-        parts = [p.strip() for p in timing.split("-->")]
-        if len(parts) != 2:
-            continue
-        start = _parse_srt_time(parts[0])
-        end = _parse_srt_time(parts[1])
-        if start is None or end is None or end <= start:
-            continue
-        text = "\n".join(lines[2:]) if len(lines) > 2 else ""
+        text = "\n".join(line.rstrip() for line in body.splitlines() if line.strip())
         entries.append((start, end, text))
     return entries
 
 
-def _parse_srt_time(value: str) -> float | None:
-    try:
-        hms, ms = value.split(",")
-        h, m, s = hms.split(":")
-        return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
-    except Exception:
-        return None
+def _format_ass_time(seconds: float) -> str:
+    # seconds -> "H:MM:SS.cc" (centiseconds), rounded once on the total.
+    total_s, cs = divmod(int(seconds * 100 + 0.5), 100)
+    total_m, s = divmod(total_s, 60)
+    h, m = divmod(total_m, 60)
+    return f"{h:d}:{m:02d}:{s:02d}.{cs:02d}"
 
 
-def _format_ass_time(seconds: float) -> str:
-    total_cs = int(seconds * 100 + 0.5)
-    cs = total_cs % 100
-    total_s = total_cs // 100
-    s = total_s % 60
-    total_m = total_s // 60
-    m = total_m % 60
-    h = total_m // 60
-    return f"{h}:{m:02d}:{s:02d}.{cs:02d}"
-
-
-def run_ffmpeg(cmd: list[str], *, stderr_path: Path | None = None) -> subprocess.CompletedProcess[str]:
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    if stderr_path is not None:
-        stderr_path.write_text(proc.stderr or "", encoding="utf-8")
-    if proc.returncode != 0:
-        raise RuntimeError(
-            "ffmpeg failed.\n"
-            f"STDOUT:\n{proc.stdout}\n\n"
-            f"STDERR:\n{proc.stderr}"
+FFMPEG_STDERR_TAIL_LINES = 200
+FFMPEG_PIPE_BUFSIZE = 1 << 20
+_F_SETPIPE_SZ = 1031  # Linux-only fcntl command; not exposed by the fcntl module before 3.10.
+
+
+def _grow_pipe(fd: int) -> None:
+    """Best effort: enlarge the kernel pipe buffer so ffmpeg blocks on writes less often."""
+    try:
+        import fcntl
+
+        fcntl.fcntl(fd, getattr(fcntl, "F_SETPIPE_SZ", _F_SETPIPE_SZ), FFMPEG_PIPE_BUFSIZE)
+    except (ImportError, OSError):
+        pass
+
+
+def run_ffmpeg(
+    cmd: list[str], *, stderr_path: Path | None = None
+) -> subprocess.CompletedProcess[str]:
+    """
+    Run ffmpeg, streaming stderr into stderr_path as it is produced.
+
+    Only the last FFMPEG_STDERR_TAIL_LINES lines of stderr are kept in memory; they are
+    returned as the result's stderr and quoted in the error on failure. stdout is
+    discarded (outputs go to files), so the result's stdout is None.
+    """
+    tail: deque[bytes] = deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+    with contextlib.ExitStack() as stack:
+        log_fh = stack.enter_context(stderr_path.open("wb")) if stderr_path is not None else None
+        proc = stack.enter_context(
+            subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                bufsize=FFMPEG_PIPE_BUFSIZE,
+            )
         )
-    return proc
+        assert proc.stderr is not None
+        _grow_pipe(proc.stderr.fileno())
+        for line in proc.stderr:
+            tail.append(line)
+            if log_fh is not None:
+                log_fh.write(line)
+        returncode = proc.wait()
+    stderr_tail = b"".join(tail).decode("utf-8", "replace")
+    if returncode != 0:
+        raise RuntimeError(f"ffmpeg failed.\nSTDERR:\n{stderr_tail}")
+    return subprocess.CompletedProcess(cmd, returncode, stdout=None, stderr=stderr_tail)
+
+
+def run_many(
+    cmds: list[list[str]],
+    *,
+    max_parallel: int | None = None,
+    return_exceptions: bool = False,
+) -> list[subprocess.CompletedProcess[str] | BaseException]:
+    """
+    Run independent ffmpeg commands concurrently, returning results in input order.
+
+    Threads suffice because the work happens in the child processes. With
+    return_exceptions=True a failed command yields its exception instead of raising.
+    """
+    if not cmds:
+        return []
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max_parallel or max(1, (os.cpu_count() or 2) // 2)
+    with ThreadPoolExecutor(max_workers=min(workers, len(cmds))) as pool:
+        futures = [pool.submit(run_ffmpeg, cmd) for cmd in cmds]
+    results: list[subprocess.CompletedProcess[str] | BaseException] = []
+    for future in futures:
+        exc = future.exception()
+        if exc is not None and not return_exceptions:
+            raise exc
+        results.append(exc if exc is not None else future.result())
+    return results
 
 
 def probe_duration(path: str | Path) -> float | None:
-    ffprobe = shutil.which("ffprobe")
-    if not ffprobe:
-        return None
-    proc = subprocess.run(
-        [
-            ffprobe,
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if proc.returncode != 0:
-        return None
-    try:
-        return float(proc.stdout.strip())
-    except ValueError:
-        return None
+    info = probe_media(path)
+    return info["duration_seconds"] if info else None
 
 
 def _parse_fps(rate: str | None) -> float | None:
@@ -540,10 +851,29 @@ def _parse_fps(rate: str | None) -> float | None:
 
 
 def probe_media(path: str | Path) -> dict | None:
-    ffprobe = shutil.which("ffprobe")
+    ffprobe = resolve_binary("ffprobe")
     if not ffprobe:
         return None
-    proc = subprocess.run(
+    try:
+        st = os.stat(path)
+    except OSError:
+        return _run_probe_media(ffprobe, str(path))
+    # Keyed on mtime+size so a re-rendered file is probed again.
+    info = _cached_probe_media(ffprobe, str(path), st.st_mtime_ns, st.st_size)
+    return dict(info) if info is not None else None
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_probe_media(ffprobe: str, path: str, _mtime_ns: int, _size: int) -> dict | None:
+    return _run_probe_media(ffprobe, path)
+
+
+def clear_probe_cache() -> None:
+    _cached_probe_media.cache_clear()
+
+
+def _run_probe_media(ffprobe: str, path: str) -> dict | None:
+    proc = _run_probe(
         [
             ffprobe,
             "-v",
@@ -554,11 +884,12 @@ def probe_media(path: str | Path) -> dict | None:
             "json",
             str(path),
         ],
-        capture_output=True,
-        text=True,
+        timeout=PROBE_TIMEOUT_SECONDS,
     )
-    if proc.returncode != 0:
+    if proc is None or proc.returncode != 0:
         return None
+    import json
+
     try:
         data = json.loads(proc.stdout)
     except json.JSONDecodeError:
@@ -595,26 +926,52 @@ def probe_media(path: str | Path) -> dict | None:
     }
 
 
-def probe_loudnorm(path: str | Path) -> dict:
-    ffmpeg = shutil.which("ffmpeg")
+STREAM_COPY_PIXEL_FORMATS = {"yuv420p", "yuvj420p"}
+
+
+def can_stream_copy_video(path: str | Path, render: RenderSpec | None = None) -> bool:
+    """
+    True when the video stream is already H.264 4:2:0 (and, given a render spec, already
+    at its size and frame rate) so it can be muxed without re-encoding.
+    """
+    info = probe_media(path)
+    if not info:
+        return False
+    is_h264 = info.get("video_codec") == "h264"
+    is_420 = info.get("pixel_format") in STREAM_COPY_PIXEL_FORMATS
+    if not (is_h264 and is_420):
+        return False
+    if render is None:
+        return True
+    fps = info.get("fps")
+    return (
+        info.get("width") == render.width
+        and info.get("height") == render.height
+        and fps is not None
+        and abs(fps - render.fps) < 0.01
+    )
+
+
+def probe_loudnorm(path: str | Path, *, low_latency: bool = True) -> dict:
+    ffmpeg = resolve_binary("ffmpeg")
     if not ffmpeg:
         raise TechSprintError("ffmpeg not found; loudnorm analysis unavailable.")
-    proc = subprocess.run(
+    proc = _run_probe(
         [
             ffmpeg,
             "-v",
             "info",
-            "-i",
-            str(path),
+            *_input_args(path, low_latency=low_latency),
             "-af",
             "loudnorm=I=-16:TP=-1.5:LRA=11:print_format=json",
             "-f",
             "null",
             "-",
         ],
-        capture_output=True,
-        text=True,
+        timeout=LOUDNORM_TIMEOUT_SECONDS,
     )
+    if proc is None:
+        raise TechSprintError(f"ffmpeg loudnorm timed out after {LOUDNORM_TIMEOUT_SECONDS}s.")
     if proc.returncode != 0:
         raise TechSprintError(f"ffmpeg loudnorm failed: {proc.stderr.strip()}")
 
@@ -624,13 +981,46 @@ def probe_loudnorm(path: str | Path) -> dict:
     return data
 
 
+def _matching_open_brace(text: str, end: int) -> int:
+    """Walk back from the `}` at `end` to its `{`, skipping quoted strings; -1 if unbalanced."""
+    depth = 0
+    in_string = False
+    idx = end
+    while idx >= 0:
+        char = text[idx]
+        if char == '"':
+            backslashes = 0
+            while idx - 1 - backslashes >= 0 and text[idx - 1 - backslashes] == "\\":
+                backslashes += 1
+            if backslashes % 2 == 0:
+                in_string = not in_string
+        elif not in_string:
+            if char == "}":
+                depth += 1
+            elif char == "{":
+                depth -= 1
+                if depth == 0:
+                    return idx
+        idx -= 1
+    return -1
+
+
 def parse_loudnorm_stderr(stderr: str) -> dict | None:
-    matches = re.findall(r"\{.*?\}", stderr, re.S)
-    for candidate in reversed(matches):
+    import json
+
+    # loudnorm prints its JSON block last, so scan back from the final `}` once.
+    end = stderr.rfind("}")
+    while end != -1:
+        start = _matching_open_brace(stderr, end)
+        if start == -1:
+            return None
         try:
-            return json.loads(candidate)
+            data = json.loads(stderr[start : end + 1])
         except json.JSONDecodeError:
-            continue
+            data = None
+        if isinstance(data, dict):
+            return data
+        end = stderr.rfind("}", 0, start)
     return None
 
 
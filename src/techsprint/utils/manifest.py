@@ -1,65 +1,72 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 import subprocess
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any
 
 from techsprint.domain.job import Job
 from techsprint.renderers.base import RenderSpec
 from techsprint.utils import ffmpeg
 from techsprint.utils.timing import StepTiming
 
+_UTC = timezone.utc
+
 
 def _iso(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).isoformat()
+    return dt.astimezone(_UTC).isoformat()
+
+
+# (attribute, keep falsy values such as 0/False) in manifest key order.
+_OPTIONAL_FIELDS = (
+    ("text_sha256", False),
+    ("source", False),
+    ("segment_count", True),
+    ("segment_stats", False),
+    ("cue_count", True),
+    ("cue_stats", False),
+    ("asr_split", True),
+    ("integrity_repairs", False),
+)
 
 
 def _artifact_entry(artifact: Any) -> dict[str, Any] | None:
     if artifact is None:
         return None
-    path = Path(artifact.path)
-    size = path.stat().st_size if path.exists() else None
-    entry = {"path": str(path), "size_bytes": size}
+    path = os.fspath(artifact.path)
+    try:
+        size = os.stat(path).st_size
+    except FileNotFoundError:
+        size = None
+    entry = {"path": path, "size_bytes": size}
     text_path = getattr(artifact, "text_path", None)
-    text_sha = getattr(artifact, "text_sha256", None)
     if text_path:
         entry["text_path"] = str(text_path)
-    if text_sha:
-        entry["text_sha256"] = text_sha
-    source = getattr(artifact, "source", None)
-    segment_count = getattr(artifact, "segment_count", None)
-    segment_stats = getattr(artifact, "segment_stats", None)
-    cue_count = getattr(artifact, "cue_count", None)
-    cue_stats = getattr(artifact, "cue_stats", None)
-    asr_split = getattr(artifact, "asr_split", None)
-    integrity_repairs = getattr(artifact, "integrity_repairs", None)
-    if source:
-        entry["source"] = source
-    if segment_count is not None:
-        entry["segment_count"] = segment_count
-    if segment_stats:
-        entry["segment_stats"] = segment_stats
-    if cue_count is not None:
-        entry["cue_count"] = cue_count
-    if cue_stats:
-        entry["cue_stats"] = cue_stats
-    if asr_split is not None:
-        entry["asr_split"] = asr_split
-    if integrity_repairs:
-        entry["integrity_repairs"] = integrity_repairs
+    for name, keep_falsy in _OPTIONAL_FIELDS:
+        value = getattr(artifact, name, None)
+        if value is not None and (keep_falsy or value):
+            entry[name] = value
     return entry
 
 
 def _find_repo_root(start: Path) -> Path | None:
-    current = start
+    current = os.fspath(start)
     for _ in range(6):
-        if (current / ".git").exists():
-            return current
-        if current.parent == current:
+        try:
+            os.lstat(os.path.join(current, ".git"))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        else:
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
             break
-        current = current.parent
+        current = parent
     return None
 
 
@@ -67,33 +74,79 @@ def _git_commit() -> str | None:
     root = _find_repo_root(Path(__file__).resolve())
     if root is None:
         return None
+    return _git_commit_at(root)
+
+
+# HEAD does not move during a run, so resolve it once per repo root rather than
+# forking git for every manifest write.
+@functools.lru_cache(maxsize=8)
+def _git_commit_at(root: Path) -> str | None:
+    commit = _read_git_head(root / ".git")
+    if commit:
+        return commit
     try:
         proc = subprocess.run(
             ["git", "rev-parse", "HEAD"],
             cwd=str(root),
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
     except Exception:
         return None
     if proc.returncode != 0:
         return None
-    value = proc.stdout.strip()
+    value = proc.stdout.decode("ascii", errors="ignore").strip()
     return value or None
 
 
+def _read_git_head(git_dir: Path) -> str | None:
+    """Resolve HEAD from the repository files, or None to fall back to git.
+
+    Worktrees and submodules (where ``.git`` is a ``gitdir:`` pointer file) and
+    anything else unusual are left to ``git rev-parse``.
+    """
+
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="ascii").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not head.startswith("ref: "):
+        return head if _is_object_id(head) else None
+    ref = head[5:]
+    try:
+        value = (git_dir / ref).read_text(encoding="ascii").strip()
+    except (OSError, UnicodeDecodeError):
+        value = _packed_ref(git_dir, ref)
+    return value if value and _is_object_id(value) else None
+
+
+def _packed_ref(git_dir: Path, ref: str) -> str | None:
+    try:
+        lines = (git_dir / "packed-refs").read_text(encoding="ascii").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    for line in lines:
+        value, _, name = line.partition(" ")
+        if name == ref:
+            return value
+    return None
+
+
+def _is_object_id(value: str) -> bool:
+    return len(value) in (40, 64) and all(c in "0123456789abcdef" for c in value)
+
+
 def _serialize_steps(steps: Iterable[StepTiming]) -> list[dict[str, Any]]:
-    serialized = []
-    for step in steps:
-        serialized.append(
-            {
-                "name": step.name,
-                "started_at": _iso(step.started_at),
-                "finished_at": _iso(step.finished_at),
-                "duration_s": step.duration_s,
-            }
-        )
-    return serialized
+    utc = _UTC
+    return [
+        {
+            "name": step.name,
+            "started_at": step.started_at.astimezone(utc).isoformat(),
+            "finished_at": step.finished_at.astimezone(utc).isoformat(),
+            "duration_s": step.duration_s,
+        }
+        for step in steps
+    ]
 
 
 def _probe_media(path: Path) -> dict[str, Any] | None:
@@ -109,32 +162,54 @@ def _probe_media(path: Path) -> dict[str, Any] | None:
     return info
 
 
+_SRT_TAIL_WINDOW = 8192
+
+
 def _subtitle_end_seconds(path: Path) -> float | None:
-    if not path.exists():
+    # Only the final cue matters, so read a window off the end of the file and
+    # widen it only when that window holds no cue timing.
+    try:
+        fh = path.open("rb")
+    except FileNotFoundError:
         return None
-    end_time = None
-    for block in path.read_text(encoding="utf-8", errors="ignore").split("\n\n"):
-        lines = [l.strip() for l in block.splitlines() if l.strip()]
-        if not lines:
-            continue
-        timing = (
-            lines[1]
-            if len(lines) > 1 and "-->" in lines[1]
-            else (lines[0] if "-->" in lines[0] else None)
-        )
-        if not timing:
-            continue
-        parts = [p.strip() for p in timing.split("-->")]
-        if len(parts) != 2:
-            continue
-        end = _parse_srt_time(parts[1])
-        if end is None:
-            continue
-        end_time = end
-    return end_time
+    with fh:
+        size = fh.seek(0, os.SEEK_END)
+        window = _SRT_TAIL_WINDOW
+        while True:
+            offset = max(0, size - window)
+            fh.seek(offset)
+            end_time = _last_cue_end(fh.read())
+            if end_time is not None or not offset:
+                return end_time
+            window *= 4
+
+
+def _last_cue_end(data: bytes) -> float | None:
+    # Timing lines are ASCII, so find them on the raw bytes and decode only the
+    # end timestamp rather than the cue text around it.
+    arrow = len(data)
+    while True:
+        arrow = data.rfind(b"-->", 0, arrow)
+        if arrow < 0:
+            return None
+        line_end = data.find(b"\n", arrow)
+        if line_end < 0:
+            line_end = len(data)
+        end = _parse_srt_time(data[arrow + 3 : line_end].strip().decode("ascii", "ignore"))
+        if end is not None:
+            return end
 
 
 def _parse_srt_time(value: str) -> float | None:
+    if len(value) == 12 and value[2] == ":" and value[5] == ":" and value[8] == ",":
+        # Canonical HH:MM:SS,mmm: slice fixed offsets instead of splitting.
+        try:
+            millis = (int(value[0:2]) * 3600 + int(value[3:5]) * 60 + int(value[6:8])) * 1000 + int(
+                value[9:12]
+            )
+        except ValueError:
+            return None
+        return millis / 1000.0
     try:
         hms, ms = value.split(",")
         h, m, s = hms.split(":")
@@ -143,6 +218,7 @@ def _parse_srt_time(value: str) -> float | None:
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def _load_run_manifest_schema() -> dict[str, Any]:
     schema_path = Path(__file__).with_name("run_schema.json")
     if not schema_path.exists():
@@ -153,6 +229,9 @@ def _load_run_manifest_schema() -> dict[str, Any]:
         raise ValueError(f"run_schema.json is not valid JSON: {exc}") from exc
 
 
+_DEFINITIONS_PREFIX = "#/definitions/"
+
+
 def _is_number(value: Any) -> bool:
     return isinstance(value, (int, float)) and not isinstance(value, bool)
 
@@ -165,38 +244,62 @@ def _is_datetime(value: str) -> bool:
         return False
 
 
-def _validate_type(instance: Any, allowed_types: list[str]) -> bool:
-    for allowed in allowed_types:
-        if allowed == "null" and instance is None:
-            return True
-        if allowed == "object" and isinstance(instance, dict):
-            return True
-        if allowed == "array" and isinstance(instance, list):
-            return True
-        if allowed == "string" and isinstance(instance, str):
-            return True
-        if allowed == "number" and _is_number(instance):
-            return True
-        if allowed == "integer" and isinstance(instance, int) and not isinstance(instance, bool):
-            return True
-        if allowed == "boolean" and isinstance(instance, bool):
-            return True
-    return False
-
-
-def _validate_instance(
-    instance: Any,
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+_TYPE_CHECKERS: dict[str, Callable[[Any], bool]] = {
+    "null": lambda value: value is None,
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "number": _is_number,
+    "integer": _is_integer,
+    "boolean": lambda value: isinstance(value, bool),
+}
+
+
+_Validator = Callable[[Any, list[Any]], None]
+
+
+def _location(path: list[Any]) -> str:
+    return "/".join(str(p) for p in path) or "<root>"
+
+
+def _compile_validator(
     schema: dict[str, Any],
-    root_schema: dict[str, Any],
-    path: list[Any],
-) -> None:
+    definitions: dict[str, Any],
+    compiled_refs: dict[str, _Validator] | None = None,
+) -> _Validator:
+    """Specialize ``schema`` into a validator closure.
+
+    Keyword lookups and ``$ref`` resolution happen once here, so validating a
+    payload only runs the checks the schema actually declares. Validators share
+    one ``path`` list, appending before descending and popping afterwards; the
+    location string is only built when raising.
+    """
+
+    if compiled_refs is None:
+        compiled_refs = {}
+
     if "$ref" in schema:
         ref = schema["$ref"]
-        if not ref.startswith("#/definitions/"):
-            location = "/".join(str(p) for p in path) or "<root>"
-            raise ValueError(f"Invalid run manifest at {location}: unsupported $ref '{ref}'")
-        ref_key = ref.split("/")[-1]
-        schema = root_schema.get("definitions", {}).get(ref_key, {})
+        if not ref.startswith(_DEFINITIONS_PREFIX):
+
+            def reject_ref(instance: Any, path: list[Any]) -> None:
+                raise ValueError(
+                    f"Invalid run manifest at {_location(path)}: unsupported $ref '{ref}'"
+                )
+
+            return reject_ref
+        ref_key = ref[len(_DEFINITIONS_PREFIX) :]
+        if ref_key not in compiled_refs:
+            # Placeholder first so self-referencing definitions terminate.
+            compiled_refs[ref_key] = lambda instance, path: compiled_refs[ref_key](instance, path)
+            compiled_refs[ref_key] = _compile_validator(
+                definitions.get(ref_key, {}), definitions, compiled_refs
+            )
+        return compiled_refs[ref_key]
 
     schema_type = schema.get("type")
     allowed_types: list[str] = []
@@ -204,66 +307,91 @@ def _validate_instance(
         allowed_types = schema_type
     elif schema_type:
         allowed_types = [schema_type]
-    if allowed_types:
-        if not _validate_type(instance, allowed_types):
-            location = "/".join(str(p) for p in path) or "<root>"
-            expected = ", ".join(allowed_types)
-            raise ValueError(f"Invalid run manifest at {location}: expected types [{expected}]")
-        if instance is None:
-            return
-
-    if isinstance(instance, str):
-        min_length = schema.get("minLength")
-        if isinstance(min_length, int) and len(instance) < min_length:
-            location = "/".join(str(p) for p in path) or "<root>"
-            raise ValueError(
-                f"Invalid run manifest at {location}: string is shorter than {min_length}"
-            )
-        if schema.get("format") == "date-time" and not _is_datetime(instance):
-            location = "/".join(str(p) for p in path) or "<root>"
-            raise ValueError(
-                f"Invalid run manifest at {location}: expected ISO-8601 date-time"
-            )
+    expected = ", ".join(allowed_types)
+    type_checks = tuple(_TYPE_CHECKERS[name] for name in allowed_types if name in _TYPE_CHECKERS)
+
+    min_length = schema.get("minLength")
+    if not isinstance(min_length, int):
+        min_length = None
+    check_datetime = schema.get("format") == "date-time"
+    minimum = schema.get("minimum")
+    if not isinstance(minimum, (int, float)):
+        minimum = None
+    min_items = schema.get("minItems")
+    if not isinstance(min_items, int):
+        min_items = None
+    item_schema = schema.get("items")
+    validate_item = (
+        _compile_validator(item_schema, definitions, compiled_refs) if item_schema else None
+    )
+    required = tuple(schema.get("required", []))
+    property_validators = {
+        key: _compile_validator(value, definitions, compiled_refs)
+        for key, value in schema.get("properties", {}).items()
+    }
+    reject_additional = schema.get("additionalProperties", True) is False
 
-    if _is_number(instance):
-        minimum = schema.get("minimum")
-        if isinstance(minimum, (int, float)) and instance < minimum:
-            location = "/".join(str(p) for p in path) or "<root>"
-            raise ValueError(
-                f"Invalid run manifest at {location}: value below minimum {minimum}"
-            )
+    def validate(instance: Any, path: list[Any]) -> None:
+        if allowed_types:
+            if not any(check(instance) for check in type_checks):
+                raise ValueError(
+                    f"Invalid run manifest at {_location(path)}: expected types [{expected}]"
+                )
+            if instance is None:
+                return
 
-    if isinstance(instance, list):
-        min_items = schema.get("minItems")
-        if isinstance(min_items, int) and len(instance) < min_items:
-            location = "/".join(str(p) for p in path) or "<root>"
+        if isinstance(instance, str):
+            if min_length is not None and len(instance) < min_length:
+                raise ValueError(
+                    f"Invalid run manifest at {_location(path)}: "
+                    f"string is shorter than {min_length}"
+                )
+            if check_datetime and not _is_datetime(instance):
+                raise ValueError(
+                    f"Invalid run manifest at {_location(path)}: expected ISO-8601 date-time"
+                )
+
+        if minimum is not None and _is_number(instance) and instance < minimum:
             raise ValueError(
-                f"Invalid run manifest at {location}: expected at least {min_items} items"
+                f"Invalid run manifest at {_location(path)}: value below minimum {minimum}"
             )
-        item_schema = schema.get("items")
-        if item_schema:
-            for idx, item in enumerate(instance):
-                _validate_instance(item, item_schema, root_schema, [*path, idx])
-
-    if isinstance(instance, dict):
-        required = schema.get("required", [])
-        for key in required:
-            if key not in instance:
-                location = "/".join(str(p) for p in path) or "<root>"
+
+        if isinstance(instance, list):
+            if min_items is not None and len(instance) < min_items:
                 raise ValueError(
-                    f"Invalid run manifest at {location}: missing required field '{key}'"
+                    f"Invalid run manifest at {_location(path)}: "
+                    f"expected at least {min_items} items"
                 )
-        properties = schema.get("properties", {})
-        for key, value in instance.items():
-            if key in properties:
-                _validate_instance(value, properties[key], root_schema, [*path, key])
-            else:
-                additional = schema.get("additionalProperties", True)
-                if additional is False:
-                    location = "/".join(str(p) for p in path) or "<root>"
+            if validate_item is not None:
+                for idx, item in enumerate(instance):
+                    path.append(idx)
+                    validate_item(item, path)
+                    path.pop()
+
+        if isinstance(instance, dict):
+            for key in required:
+                if key not in instance:
                     raise ValueError(
-                        f"Invalid run manifest at {location}: unexpected field '{key}'"
+                        f"Invalid run manifest at {_location(path)}: missing required field '{key}'"
                     )
+            for key, value in instance.items():
+                validate_value = property_validators.get(key)
+                if validate_value is not None:
+                    path.append(key)
+                    validate_value(value, path)
+                    path.pop()
+                elif reject_additional:
+                    raise ValueError(
+                        f"Invalid run manifest at {_location(path)}: unexpected field '{key}'"
+                    )
+
+    return validate
+
+
+@functools.lru_cache(maxsize=1)
+def _run_manifest_validator() -> _Validator:
+    schema = _load_run_manifest_schema()
+    return _compile_validator(schema, schema.get("definitions", {}))
 
 
 def validate_run_manifest(
@@ -275,8 +403,11 @@ def validate_run_manifest(
         ValueError: if validation fails or the schema cannot be loaded.
     """
 
-    manifest_schema = schema or _load_run_manifest_schema()
-    _validate_instance(manifest, manifest_schema, manifest_schema, [])
+    if schema:
+        validator = _compile_validator(schema, schema.get("definitions", {}))
+    else:
+        validator = _run_manifest_validator()
+    validator(manifest, [])
 
 
 def write_run_manifest(
@@ -286,13 +417,32 @@ def write_run_manifest(
     started_at: datetime,
     finished_at: datetime,
     render: RenderSpec | None,
+    include_media_probe: bool = True,
 ) -> Path:
+    """Write ``run.json`` for ``job`` and return its path.
+
+    ``include_media_probe=False`` records ``media_probe`` as null, skipping the
+    stream probe and loudnorm analysis of the rendered video.
+    """
+
     artifacts = job.artifacts
-    video_path = artifacts.video.path if artifacts.video else None
-    media_probe = _probe_media(Path(video_path)) if video_path else None
-    audio_duration = ffmpeg.probe_duration(job.workspace.audio_mp3)
-    video_duration = ffmpeg.probe_duration(job.workspace.output_mp4)
-    subtitles_end = _subtitle_end_seconds(job.workspace.subtitles_srt)
+    video_path = artifacts.video.path if artifacts.video and include_media_probe else None
+    # The probes and the git lookup are independent and mostly wait on
+    # subprocesses or disk, so overlap them.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        media_probe_future = pool.submit(_probe_media, Path(video_path)) if video_path else None
+        audio_duration_future = pool.submit(ffmpeg.probe_duration, job.workspace.audio_mp3)
+        subtitles_end_future = pool.submit(_subtitle_end_seconds, job.workspace.subtitles_srt)
+        git_commit_future = pool.submit(_git_commit)
+        media_probe = media_probe_future.result() if media_probe_future else None
+        if media_probe is not None and Path(video_path) == job.workspace.output_mp4:
+            # The media probe's format section already carries the duration.
+            video_duration = media_probe.get("duration_seconds")
+        else:
+            video_duration = ffmpeg.probe_duration(job.workspace.output_mp4)
+        audio_duration = audio_duration_future.result()
+        subtitles_end = subtitles_end_future.result()
+        git_commit = git_commit_future.result()
     av_delta = abs(video_duration - audio_duration) if audio_duration and video_duration else None
     subtitle_delta = (
         abs(subtitles_end - audio_duration)
@@ -310,7 +460,7 @@ def write_run_manifest(
         "started_at": _iso(started_at),
         "finished_at": _iso(finished_at),
         "duration_seconds_total": (finished_at - started_at).total_seconds(),
-        "git_commit": _git_commit(),
+        "git_commit": git_commit,
         "settings_public": job.settings.to_public_dict(),
         "cli_overrides": job.cli_overrides,
         "anchor_id": job.settings.anchor,
@@ -342,5 +492,6 @@ def write_run_manifest(
     validate_run_manifest(payload)
 
     out = job.workspace.run_manifest
-    out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    with out.open("w", encoding="utf-8") as fh:
+        json.dump(payload, fh, indent=2)
     return out
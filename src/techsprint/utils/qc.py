@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import bisect
+import functools
 import json
 import math
+import operator
 import re
+import statistics
+import threading
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Iterable
+from typing import Any
 
 from techsprint.domain.job import Job
 from techsprint.exceptions import TechSprintError
 from techsprint.utils import ffmpeg
-from techsprint.utils.text import normalize_text
 from techsprint.services.subtitles import (
     CAPTION_BAD_FORMS,
     CAPTION_BRACKET_LINE_RE,
@@ -23,6 +29,7 @@ from techsprint.services.subtitles import (
     CAPTION_METADATA_RE,
     _has_verb,
     _normalize_verbatim_text,
+    _resolve_whisper_runtime,
     _normalize_ellipses,
     _sentence_case,
     _tokenize_verbatim,
@@ -43,6 +50,11 @@ BROADCAST_ASR_CONFUSIONS = {
 }
 
 
+_EDGE_PUNCTUATION = ",;:.!?"
+_BAD_SPACING_RE = re.compile(r"  |\s+[.,!?;:]")
+_BAD_FORMS_RE = re.compile("|".join(re.escape(bad) for bad in CAPTION_BAD_FORMS))
+
+
 @dataclass(frozen=True)
 class DriftMetrics:
     avg_seconds: float
@@ -50,43 +62,49 @@ class DriftMetrics:
 
 
 def _token_overlap(a: str, b: str) -> float:
-    a_tokens = set(normalize_text(a).lower().split())
-    b_tokens = set(normalize_text(b).lower().split())
+    # str.split() already collapses whitespace, so normalize_text would only
+    # add a join and a second split here.
+    a_tokens = set(a.lower().split())
+    b_tokens = set(b.lower().split())
     if not a_tokens or not b_tokens:
         return 0.0
     return len(a_tokens & b_tokens) / max(len(a_tokens), len(b_tokens))
 
 
+# One cue per match: the timing line, then the run of non-blank lines right after it,
+# so an empty cue stops at its blank separator instead of swallowing the next cue.
+_CUE_RE = re.compile(
+    r"^[ \t]*(\d+:\d+:\d+,\d+)[ \t]*-->[ \t]*(\d+:\d+:\d+,\d+)[^\n]*((?:\n[ \t]*\S[^\n]*)*)",
+    re.MULTILINE,
+)
+
+
 def _parse_srt_cues(srt_path: Path) -> list[tuple[float, float, str]]:
-    if not srt_path.exists():
+    try:
+        raw = srt_path.read_bytes()
+    except FileNotFoundError:
         return []
     cues: list[tuple[float, float, str]] = []
-    for block in srt_path.read_text(encoding="utf-8", errors="ignore").split("\n\n"):
-        lines = [l.strip() for l in block.splitlines() if l.strip()]
-        if not lines:
-            continue
-        timing = lines[1] if len(lines) > 1 and "-->" in lines[1] else (lines[0] if "-->" in lines[0] else None)
-        if not timing:
-            continue
-        parts = [p.strip() for p in timing.split("-->")]
-        if len(parts) != 2:
-            continue
-        start = _parse_time(parts[0])
-        end = _parse_time(parts[1])
+    data = raw.decode("utf-8", errors="ignore").replace("\r\n", "\n")
+    for match in _CUE_RE.finditer(data):
+        start = _parse_time(match.group(1))
+        end = _parse_time(match.group(2))
         if start is None or end is None or end < start:
             continue
-        text = " ".join(lines[2:]) if len(lines) > 2 else ""
+        text = " ".join(line.strip() for line in match.group(3).split("\n") if line.strip())
         cues.append((start, end, text))
     return cues
 
 
+_TIME_RE = re.compile(r"(\d+):(\d+):(\d+),(\d+)")
+
+
 def _parse_time(value: str) -> float | None:
-    try:
-        hms, ms = value.split(",")
-        h, m, s = hms.split(":")
-        return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
-    except Exception:
+    match = _TIME_RE.fullmatch(value.strip())
+    if match is None:
         return None
+    h, m, s, ms = match.groups()
+    return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
 
 
 def _midpoints(times: Iterable[tuple[float, float]]) -> list[float]:
@@ -96,25 +114,64 @@ def _midpoints(times: Iterable[tuple[float, float]]) -> list[float]:
 def compute_drift(cue_midpoints: list[float], segment_midpoints: list[float]) -> DriftMetrics | None:
     if not cue_midpoints or not segment_midpoints:
         return None
+    # Nearest segment per cue via binary search over the sorted midpoints.
+    segments = sorted(segment_midpoints)
+    last = len(segments) - 1
     deltas = []
     for cue_mid in cue_midpoints:
-        nearest = min(segment_midpoints, key=lambda s: abs(s - cue_mid))
-        deltas.append(abs(nearest - cue_mid))
+        idx = bisect.bisect_left(segments, cue_mid)
+        right = segments[min(idx, last)]
+        left = segments[max(idx - 1, 0)]
+        deltas.append(min(abs(right - cue_mid), abs(cue_mid - left)))
     return DriftMetrics(avg_seconds=sum(deltas) / len(deltas), max_seconds=max(deltas))
 
 
-def _transcribe_with_faster_whisper(audio_path: Path) -> dict | None:
+_WHISPER_MODEL_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_whisper_model(size: str, device: str, compute_type: str):
+    # Loading the weights takes seconds; keep one model per configuration.
+    from faster_whisper import WhisperModel  # type: ignore
+
+    return WhisperModel(size, device=device, compute_type=compute_type)
+
+
+def _whisper_model(size: str, device: str, compute_type: str):
+    # lru_cache alone lets two threads that miss together both load the weights.
+    with _WHISPER_MODEL_LOCK:
+        return _load_whisper_model(size, device, compute_type)
+
+
+def _transcribe_with_faster_whisper(
+    audio_path: Path, *, device: str = "auto", compute_type: str = "auto"
+) -> dict | None:
+    if find_spec("faster_whisper") is None:
+        return None
     try:
-        from faster_whisper import WhisperModel  # type: ignore
+        # Same runtime resolution as subtitle ASR, so both run on the same device.
+        device, compute_type = _resolve_whisper_runtime(device, compute_type)
+        model = _whisper_model("base", device, compute_type)
+        segments, _info = model.transcribe(str(audio_path), word_timestamps=True)
+        seg_list = list(segments)
+        word_midpoints: list[float] = []
+        for seg in seg_list:
+            words = getattr(seg, "words", None)
+            if words:
+                for w in words:
+                    mid = (w.start + w.end) / 2
+                    word_midpoints.append(mid)
+        return {"segments": seg_list, "word_midpoints": word_midpoints}
     except Exception:
         return None
 
 
-def _verbatim_diff_summary(expected_text: str, actual_text: str) -> dict:
-    expected_norm = _normalize_verbatim_text(expected_text, remove_non_speech=False)
-    actual_norm = _normalize_verbatim_text(actual_text, remove_non_speech=False)
-    expected_tokens = _tokenize_verbatim(expected_norm, normalize_case=True)
-    actual_tokens = _tokenize_verbatim(actual_norm, normalize_case=True)
+def _verbatim_tokens(text: str) -> list[str]:
+    normalized = _normalize_verbatim_text(text, remove_non_speech=False)
+    return _tokenize_verbatim(normalized, normalize_case=True)
+
+
+def _compare_token_lists(expected_tokens: list[str], actual_tokens: list[str]) -> dict:
     mismatch = None
     for idx, (expected, actual) in enumerate(zip(expected_tokens, actual_tokens)):
         if expected != actual:
@@ -137,20 +194,110 @@ def _verbatim_diff_summary(expected_text: str, actual_text: str) -> dict:
         "actual_len": len(actual_tokens),
         "mismatch": mismatch,
     }
-    model = WhisperModel("base", device="cpu", compute_type="int8")
-    try:
-        segments, _info = model.transcribe(str(audio_path), word_timestamps=True)
-        seg_list = list(segments)
-        word_midpoints: list[float] = []
-        for seg in seg_list:
-            words = getattr(seg, "words", None)
-            if words:
-                for w in words:
-                    mid = (w.start + w.end) / 2
-                    word_midpoints.append(mid)
-        return {"segments": seg_list, "word_midpoints": word_midpoints}
-    except Exception:
-        return None
+
+
+def _violations_message(violations: list[dict]) -> str:
+    detail_parts = [f"cue {v['cue']} {v['rule']}" for v in violations]
+    detail = "; ".join(detail_parts[:12])
+    if len(detail_parts) > 12:
+        detail = f"{detail}; +{len(detail_parts) - 12} more"
+    return f"Caption text/layout violations: {detail}"
+
+
+def _drift_exceeds(qc: dict, limits: tuple[float, float]) -> bool:
+    drift = qc.get("drift")
+    return bool(drift) and (drift["avg_seconds"] > limits[0] or drift["max_seconds"] > limits[1])
+
+
+_STRICT_AND_BROADCAST = {"strict": None, "broadcast": None}
+
+# (message, failed(qc, limit), {mode: limit}) for the metric checks shared by the
+# strict and broadcast gates; a check only runs for the modes it lists.
+_FAILURE_CHECKS: tuple[tuple[str, Callable[[dict, Any], bool], dict[str, Any]], ...] = (
+    (
+        "SRT extends beyond audio duration",
+        lambda qc, _: qc["srt_span_ok"] is False,
+        _STRICT_AND_BROADCAST,
+    ),
+    (
+        "Max cue duration exceeds caption limits",
+        lambda qc, _: (
+            bool(qc["cue_stats"]) and qc["cue_stats"]["max_seconds"] > CAPTION_MAX_SECONDS
+        ),
+        _STRICT_AND_BROADCAST,
+    ),
+    (
+        "Cues under minimum duration present",
+        lambda qc, _: qc["cue_short_percent"] is not None and qc["cue_short_percent"] > 0,
+        _STRICT_AND_BROADCAST,
+    ),
+    (
+        "Median cue duration below {limit}s",
+        lambda qc, limit: qc["cue_median_seconds"] is not None and qc["cue_median_seconds"] < limit,
+        {"strict": 1.5, "broadcast": 1.0},
+    ),
+    (
+        "Orphan line rate exceeds 5%",
+        lambda qc, _: qc["orphan_line_rate"] is not None and qc["orphan_line_rate"] > 0.05,
+        _STRICT_AND_BROADCAST,
+    ),
+    (
+        "Cue changes per 10s exceeds 5",
+        lambda qc, _: qc["cue_changes_per_10s"] is not None and qc["cue_changes_per_10s"] > 5,
+        _STRICT_AND_BROADCAST,
+    ),
+    (
+        "Subtitle coverage ends too early",
+        lambda qc, _: (
+            qc["audio_duration"] is not None
+            and qc["subtitle_end_seconds"] is not None
+            and (qc["audio_duration"] - qc["subtitle_end_seconds"]) > 0.2
+        ),
+        _STRICT_AND_BROADCAST,
+    ),
+    (
+        "AV duration delta exceeds 0.25s",
+        lambda qc, _: qc["av_delta_seconds"] is not None and qc["av_delta_seconds"] > 0.25,
+        _STRICT_AND_BROADCAST,
+    ),
+    (
+        "Subtitle end delta exceeds 0.25s",
+        lambda qc, _: (
+            qc["subtitle_delta_seconds"] is not None and qc["subtitle_delta_seconds"] > 0.25
+        ),
+        _STRICT_AND_BROADCAST,
+    ),
+    (
+        "Subtitle starts after audio by >0.2s",
+        lambda qc, _: (
+            qc["subtitle_start_seconds"] is not None and qc["subtitle_start_seconds"] > 0.2
+        ),
+        _STRICT_AND_BROADCAST,
+    ),
+    (
+        "Subtitle layout exceeds safe-area bounds",
+        lambda qc, _: qc["subtitle_layout_ok"] is False,
+        _STRICT_AND_BROADCAST,
+    ),
+    (
+        "Subtitle/ASR drift exceeds broadcast threshold",
+        _drift_exceeds,
+        {"broadcast": (0.25, 0.25)},
+    ),
+    (
+        "Subtitle/ASR drift exceeds thresholds",
+        _drift_exceeds,
+        {"strict": (0.8, 2.0)},
+    ),
+)
+
+
+def _threshold_failures(qc: dict, mode: str) -> list[str]:
+    failures = []
+    for message, failed, limits in _FAILURE_CHECKS:
+        if mode in limits and failed(qc, limits[mode]):
+            failures.append(message.format(limit=limits[mode]))
+    return failures
 
 
 def run_qc(job: Job, *, mode: str, render=None, enable_asr: bool = True) -> dict:
@@ -159,6 +306,8 @@ def run_qc(job: Job, *, mode: str, render=None, enable_asr: bool = True) -> dict
     script_text = job.artifacts.script.text if job.artifacts.script else ""
     audio_duration = ffmpeg.probe_duration(audio)
     cues = _parse_srt_cues(srt)
+    # Column views of the cues: one transpose instead of a pass per reduction.
+    starts, ends, texts = (list(col) for col in zip(*cues)) if cues else ([], [], [])
 
     verbatim_mode = job.settings.verbatim_policy in {"audio", "script"}
     qc: dict = {
@@ -190,43 +339,44 @@ def run_qc(job: Job, *, mode: str, render=None, enable_asr: bool = True) -> dict
     qc["verbatim_policy"] = job.settings.verbatim_policy
 
     if cues and audio_duration is not None:
-        qc["subtitle_start_seconds"] = cues[0][0]
-        max_end = max(end for _, end, _ in cues)
+        qc["subtitle_start_seconds"] = starts[0]
+        max_end = max(ends)
         qc["subtitle_end_seconds"] = max_end
         if max_end > audio_duration + 0.05:
             qc["srt_span_ok"] = False
-        durations = [end - start for start, end, _ in cues]
+        durations = list(map(operator.sub, ends, starts))
         qc["cue_stats"] = {
             "min_seconds": min(durations),
             "max_seconds": max(durations),
-            "avg_seconds": sum(durations) / len(durations),
+            "avg_seconds": statistics.fmean(durations),
         }
         cps_values = []
         orphan_count = 0
         violations = []
-        for idx, (start, end, text) in enumerate(cues, start=1):
-            duration = end - start
+        for idx, (duration, text) in enumerate(zip(durations, texts), start=1):
             if duration <= 0:
                 continue
-            cps = len(text.replace(" ", "")) / duration if text else 0.0
+            cps = (len(text) - text.count(" ")) / duration if text else 0.0
             cps_values.append(cps)
+            # Tokenize once per cue; every check below reuses these lists.
+            words = text.split()
+            last_word = words[-1].lower().strip(_EDGE_PUNCTUATION) if words else ""
             lines = [line for line in text.split("\n") if line.strip()]
             normalized_text = _normalize_ellipses(text)
             if normalized_text != text:
                 violations.append({"cue": idx, "rule": "ellipsis_spam"})
             if len(lines) == 2:
-                word_counts = [len(line.split()) for line in lines]
-                short_orphan = any(len(line.split()) == 1 and len(line.strip()) <= 3 for line in lines)
+                line_words = [line.split() for line in lines]
+                short_orphan = any(len(lw) == 1 and len(lw[0]) <= 3 for lw in line_words)
                 if short_orphan and duration < 1.8:
                     orphan_count += 1
                     violations.append({"cue": idx, "rule": "orphan_line"})
-                for line in lines:
-                    words = line.split()
-                    if not words:
-                        continue
-                    if words[0].lower().strip(",;:.!?") in CAPTION_FORBIDDEN_TOKENS:
+                # The second line's last word is the cue's last word.
+                line_ends = (line_words[0][-1].lower().strip(_EDGE_PUNCTUATION), last_word)
+                for lw, line_end in zip(line_words, line_ends):
+                    if lw[0].lower().strip(_EDGE_PUNCTUATION) in CAPTION_FORBIDDEN_TOKENS:
                         violations.append({"cue": idx, "rule": "forbidden_line_start"})
-                    if words[-1].lower().strip(",;:.!?") in CAPTION_FORBIDDEN_TOKENS:
+                    if line_end in CAPTION_FORBIDDEN_TOKENS:
                         violations.append({"cue": idx, "rule": "forbidden_line_end"})
             if duration < (CAPTION_MIN_SECONDS - 0.02):
                 violations.append({"cue": idx, "rule": "min_duration"})
@@ -238,10 +388,9 @@ def run_qc(job: Job, *, mode: str, render=None, enable_asr: bool = True) -> dict
                 violations.append({"cue": idx, "rule": "max_cps", "cps": round(cps, 2)})
             if text and text.rstrip().endswith(","):
                 violations.append({"cue": idx, "rule": "dangling_comma"})
-            last_word = text.split()[-1].lower().strip(",;:.!?") if text.split() else ""
             if last_word in CAPTION_DANGLING_TAIL_WORDS:
                 violations.append({"cue": idx, "rule": "dangling_tail"})
-            if len(text.split()) < 4 and not _has_verb(text):
+            if len(words) < 4 and not _has_verb(text):
                 violations.append({"cue": idx, "rule": "fragment_no_verb"})
             if _sentence_case(text) != text:
                 violations.append({"cue": idx, "rule": "sentence_case"})
@@ -251,35 +400,26 @@ def run_qc(job: Job, *, mode: str, render=None, enable_asr: bool = True) -> dict
                 violations.append({"cue": idx, "rule": "metadata_tokens", "text": text})
             if CAPTION_BRACKET_LINE_RE.match(text.strip()):
                 violations.append({"cue": idx, "rule": "bracket_only"})
-            if "  " in text or re.search(r"\s+[.,!?;:]", text):
+            if _BAD_SPACING_RE.search(text):
                 violations.append({"cue": idx, "rule": "bad_spacing"})
-            lowered = text.lower()
-            for bad in CAPTION_BAD_FORMS.keys():
-                if bad in lowered:
-                    violations.append({"cue": idx, "rule": "bad_term"})
-                    break
-        qc["cue_cps_max"] = max(cps_values) if cps_values else None
+            if _BAD_FORMS_RE.search(text.lower()):
+                violations.append({"cue": idx, "rule": "bad_term"})
         if cps_values:
-            cps_sorted = sorted(cps_values)
-            mid_cps = len(cps_sorted) // 2
-            if len(cps_sorted) % 2 == 0:
-                qc["cue_cps_median"] = (cps_sorted[mid_cps - 1] + cps_sorted[mid_cps]) / 2
-            else:
-                qc["cue_cps_median"] = cps_sorted[mid_cps]
+            qc["cue_cps_max"] = max(cps_values)
+            qc["cue_cps_median"] = statistics.median(cps_values)
         qc["violations"] = violations
-        durations_sorted = sorted(durations)
-        if durations_sorted:
-            mid = len(durations_sorted) // 2
-            if len(durations_sorted) % 2 == 0:
-                qc["cue_median_seconds"] = (durations_sorted[mid - 1] + durations_sorted[mid]) / 2
-            else:
-                qc["cue_median_seconds"] = durations_sorted[mid]
-            short_count = sum(1 for d in durations if d < CAPTION_MIN_SECONDS)
+        if durations:
+            qc["cue_median_seconds"] = statistics.median(durations)
+            short_count = sum(d < CAPTION_MIN_SECONDS for d in durations)
             qc["cue_short_percent"] = short_count / len(durations)
             qc["orphan_line_rate"] = orphan_count / len(durations)
 
     if enable_asr:
-        asr = _transcribe_with_faster_whisper(audio)
+        asr = _transcribe_with_faster_whisper(
+            audio,
+            device=job.settings.asr_device,
+            compute_type=job.settings.asr_compute_type,
+        )
         if asr is None:
             qc["asr"] = "skipped_missing_dependency"
         else:
@@ -288,7 +428,7 @@ def run_qc(job: Job, *, mode: str, render=None, enable_asr: bool = True) -> dict
             word_midpoints = asr.get("word_midpoints") or []
             asr_text = " ".join(seg.text for seg in segments if getattr(seg, "text", None))
             qc["text_overlap"] = _token_overlap(script_text, asr_text)
-            cue_midpoints = _midpoints([(start, end) for start, end, _ in cues])
+            cue_midpoints = _midpoints(zip(starts, ends))
             if word_midpoints:
                 seg_midpoints = word_midpoints
             else:
@@ -311,11 +451,7 @@ def run_qc(job: Job, *, mode: str, render=None, enable_asr: bool = True) -> dict
     if qc["orphan_line_rate"] is not None and qc["orphan_line_rate"] > 0.05:
         qc["warnings"].append("Orphan line rate exceeds 5%")
     if qc.get("violations"):
-        detail_parts = [f"cue {v['cue']} {v['rule']}" for v in qc["violations"]]
-        detail = "; ".join(detail_parts[:12])
-        if len(detail_parts) > 12:
-            detail = f"{detail}; +{len(detail_parts) - 12} more"
-        qc["warnings"].append(f"Caption text/layout violations: {detail}")
+        qc["warnings"].append(_violations_message(qc["violations"]))
     if qc["cue_changes_per_10s"] is not None and qc["cue_changes_per_10s"] > 5:
         qc["warnings"].append("Cue changes per 10s exceeds 5")
 
@@ -355,61 +491,39 @@ def run_qc(job: Job, *, mode: str, render=None, enable_asr: bool = True) -> dict
     if not layout_ok:
         qc["warnings"].append("Subtitle layout exceeds safe-area bounds")
 
-    if ffmpeg.shutil.which("ffmpeg") and video_duration:
+    if ffmpeg.resolve_binary("ffmpeg") and video_duration:
         frame_times = [0.5, max(0.5, video_duration / 2)]
         frame_labels = ["frame_0_5", "frame_mid"]
-        for label, seconds in zip(frame_labels, frame_times, strict=True):
-            out_path = job.workspace.path(f"{label}.png")
-            try:
-                cmd = ffmpeg.build_extract_frame_cmd(job.workspace.output_mp4, out_path, seconds=seconds)
-                ffmpeg.run_ffmpeg(cmd)
-                qc["frames"][label] = str(out_path)
-            except Exception:
-                qc["frames"][label] = "failed"
+        frame_paths = [job.workspace.path(f"{label}.png") for label in frame_labels]
+        cmds = [
+            ffmpeg.build_extract_frame_cmd(job.workspace.output_mp4, out_path, seconds=seconds)
+            for out_path, seconds in zip(frame_paths, frame_times, strict=True)
+        ]
+        results = ffmpeg.run_many(cmds, return_exceptions=True)
+        for label, out_path, result in zip(frame_labels, frame_paths, results, strict=True):
+            qc["frames"][label] = "failed" if isinstance(result, BaseException) else str(out_path)
 
     job.workspace.qc_report_json.write_text(json.dumps(qc, indent=2), encoding="utf-8")
 
     if mode == "broadcast":
-        caption_text = " ".join(text for _, _, text in cues)
+        caption_text = " ".join(texts)
         asr_text = ""
         if job.workspace.asr_txt.exists():
             asr_text = job.workspace.asr_txt.read_text(encoding="utf-8", errors="ignore")
+        # Each text is tokenized once and shared by the pairwise comparisons.
+        script_tokens = _verbatim_tokens(script_text)
+        caption_tokens = _verbatim_tokens(caption_text)
+        asr_tokens = _verbatim_tokens(asr_text) if asr_text else None
         qc["verbatim_diff"] = {
-            "script_vs_captions": _verbatim_diff_summary(script_text, caption_text),
-            "asr_vs_captions": _verbatim_diff_summary(asr_text, caption_text)
-            if asr_text
+            "script_vs_captions": _compare_token_lists(script_tokens, caption_tokens),
+            "asr_vs_captions": _compare_token_lists(asr_tokens, caption_tokens)
+            if asr_tokens is not None
             else {"status": "skipped"},
-            "script_vs_asr": _verbatim_diff_summary(script_text, asr_text)
-            if asr_text
+            "script_vs_asr": _compare_token_lists(script_tokens, asr_tokens)
+            if asr_tokens is not None
             else {"status": "skipped"},
         }
-        failures = []
-        if qc["srt_span_ok"] is False:
-            failures.append("SRT extends beyond audio duration")
-        if qc["cue_stats"] and qc["cue_stats"]["max_seconds"] > CAPTION_MAX_SECONDS:
-            failures.append("Max cue duration exceeds caption limits")
-        if qc["cue_short_percent"] is not None and qc["cue_short_percent"] > 0:
-            failures.append("Cues under minimum duration present")
-        if qc["cue_median_seconds"] is not None and qc["cue_median_seconds"] < 1.0:
-            failures.append("Median cue duration below 1.0s")
-        if qc["orphan_line_rate"] is not None and qc["orphan_line_rate"] > 0.05:
-            failures.append("Orphan line rate exceeds 5%")
-        if qc["cue_changes_per_10s"] is not None and qc["cue_changes_per_10s"] > 5:
-            failures.append("Cue changes per 10s exceeds 5")
-        if audio_duration is not None and qc["subtitle_end_seconds"] is not None:
-            if (audio_duration - qc["subtitle_end_seconds"]) > 0.2:
-                failures.append("Subtitle coverage ends too early")
-        if qc["av_delta_seconds"] is not None and qc["av_delta_seconds"] > 0.25:
-            failures.append("AV duration delta exceeds 0.25s")
-        if qc["subtitle_delta_seconds"] is not None and qc["subtitle_delta_seconds"] > 0.25:
-            failures.append("Subtitle end delta exceeds 0.25s")
-        if qc["subtitle_start_seconds"] is not None and qc["subtitle_start_seconds"] > 0.2:
-            failures.append("Subtitle starts after audio by >0.2s")
-        if qc["subtitle_layout_ok"] is False:
-            failures.append("Subtitle layout exceeds safe-area bounds")
-        drift = qc.get("drift")
-        if drift and (drift["avg_seconds"] > 0.25 or drift["max_seconds"] > 0.25):
-            failures.append("Subtitle/ASR drift exceeds broadcast threshold")
+        failures = _threshold_failures(qc, mode)
         if qc.get("violations"):
             hard_fail_rules = {
                 "end_punctuation",
@@ -422,11 +536,7 @@ def run_qc(job: Job, *, mode: str, render=None, enable_asr: bool = True) -> dict
             }
             hard_fail = [v for v in qc["violations"] if v["rule"] in hard_fail_rules]
             if hard_fail:
-                detail_parts = [f"cue {v['cue']} {v['rule']}" for v in hard_fail]
-                detail = "; ".join(detail_parts[:12])
-                if len(detail_parts) > 12:
-                    detail = f"{detail}; +{len(detail_parts) - 12} more"
-                failures.append(f"Caption text/layout violations: {detail}")
+                failures.append(_violations_message(hard_fail))
         script_lower = script_text.lower()
         caption_lower = caption_text.lower()
         missing_terms = [
@@ -447,39 +557,9 @@ def run_qc(job: Job, *, mode: str, render=None, enable_asr: bool = True) -> dict
         if failures:
             raise TechSprintError("QC failed: " + "; ".join(failures))
     elif mode == "strict":
-        failures = []
-        if qc["srt_span_ok"] is False:
-            failures.append("SRT extends beyond audio duration")
-        if qc["cue_stats"] and qc["cue_stats"]["max_seconds"] > CAPTION_MAX_SECONDS:
-            failures.append("Max cue duration exceeds caption limits")
-        if qc["cue_short_percent"] is not None and qc["cue_short_percent"] > 0:
-            failures.append("Cues under minimum duration present")
-        if qc["cue_median_seconds"] is not None and qc["cue_median_seconds"] < 1.5:
-            failures.append("Median cue duration below 1.5s")
-        if qc["orphan_line_rate"] is not None and qc["orphan_line_rate"] > 0.05:
-            failures.append("Orphan line rate exceeds 5%")
-        if qc["cue_changes_per_10s"] is not None and qc["cue_changes_per_10s"] > 5:
-            failures.append("Cue changes per 10s exceeds 5")
-        if audio_duration is not None and qc["subtitle_end_seconds"] is not None:
-            if (audio_duration - qc["subtitle_end_seconds"]) > 0.2:
-                failures.append("Subtitle coverage ends too early")
-        if qc["av_delta_seconds"] is not None and qc["av_delta_seconds"] > 0.25:
-            failures.append("AV duration delta exceeds 0.25s")
-        if qc["subtitle_delta_seconds"] is not None and qc["subtitle_delta_seconds"] > 0.25:
-            failures.append("Subtitle end delta exceeds 0.25s")
-        if qc["subtitle_start_seconds"] is not None and qc["subtitle_start_seconds"] > 0.2:
-            failures.append("Subtitle starts after audio by >0.2s")
-        if qc["subtitle_layout_ok"] is False:
-            failures.append("Subtitle layout exceeds safe-area bounds")
-        drift = qc.get("drift")
-        if drift and (drift["avg_seconds"] > 0.8 or drift["max_seconds"] > 2.0):
-            failures.append("Subtitle/ASR drift exceeds thresholds")
+        failures = _threshold_failures(qc, mode)
         if qc.get("violations") and not verbatim_mode:
-            detail_parts = [f"cue {v['cue']} {v['rule']}" for v in qc["violations"]]
-            detail = "; ".join(detail_parts[:12])
-            if len(detail_parts) > 12:
-                detail = f"{detail}; +{len(detail_parts) - 12} more"
-            failures.append(f"Caption text/layout violations: {detail}")
+            failures.append(_violations_message(qc["violations"]))
         if failures:
             raise TechSprintError("QC failed: " + "; ".join(failures))
 
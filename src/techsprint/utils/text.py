@@ -1,11 +1,46 @@
 from __future__ import annotations
 
 import hashlib
+import os
+import re
+from pathlib import Path
+
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
 
 
 def normalize_text(text: str) -> str:
     return " ".join(text.split()).strip()
 
 
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
 def sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return sha256_bytes(text.encode("utf-8"))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def write_text_with_digest(path: Path, text: str) -> str:
+    """
+    Write text (UTF-8) and return its sha256, reusing a `.sha256` sidecar when the
+    file already holds exactly these bytes (e.g. on a pipeline retry).
+    """
+    data = text.encode("utf-8")
+    sidecar = path.with_suffix(".sha256")
+    try:
+        if path.read_bytes() == data:
+            cached = sidecar.read_text(encoding="utf-8").strip()
+            if _SHA256_HEX.fullmatch(cached):
+                return cached
+    except OSError:
+        pass
+    digest = sha256_bytes(data)
+    _write_atomic(path, data)
+    _write_atomic(sidecar, digest.encode("ascii"))
+    return digest
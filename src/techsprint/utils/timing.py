@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -7,26 +8,28 @@ from typing import Callable, Iterator, List
 
 
 Clock = Callable[[], datetime]
+MonotonicClock = Callable[[], int]
 
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepTiming:
     name: str
     started_at: datetime
     finished_at: datetime
-
-    @property
-    def duration_s(self) -> float:
-        return (self.finished_at - self.started_at).total_seconds()
+    # Measured on StepTimer's monotonic clock, so wall-clock jumps never skew it.
+    duration_s: float
 
 
 class StepTimer:
-    def __init__(self, *, clock: Clock = utc_now) -> None:
+    def __init__(
+        self, *, clock: Clock = utc_now, monotonic_ns: MonotonicClock = time.monotonic_ns
+    ) -> None:
         self._clock = clock
+        self._monotonic_ns = monotonic_ns
         self.steps: List[StepTiming] = []
 
     @property
@@ -36,14 +39,17 @@ class StepTimer:
     @contextmanager
     def step(self, name: str) -> Iterator[None]:
         started_at = self._clock()
+        started_ns = self._monotonic_ns()
         try:
             yield
         finally:
+            elapsed_ns = self._monotonic_ns() - started_ns
             finished_at = self._clock()
             self.steps.append(
                 StepTiming(
                     name=name,
                     started_at=started_at,
                     finished_at=finished_at,
+                    duration_s=elapsed_ns / 1e9,
                 )
             )
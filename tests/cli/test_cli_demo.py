@@ -2,130 +2,39 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from typer.testing import CliRunner
+import pytest
 
-from techsprint.cli.main import app
+from techsprint.cli import main as cli_main
+from techsprint.utils import qc
 
 
-def test_cli_demo_creates_output(monkeypatch, tmp_path: Path) -> None:
-    import techsprint.demo as demo
-    import techsprint.services.subtitles as subtitles
-    from techsprint.utils import ffmpeg
-
-    def fake_run_ffmpeg(cmd: list[str], *, stderr_path=None) -> None:
-        out = Path(cmd[-1])
-        out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_bytes(b"0")
-
-    monkeypatch.setattr(demo, "edge_tts_available", lambda: False)
-    monkeypatch.setattr(subtitles, "_transcribe_with_faster_whisper", lambda _path: None)
-    monkeypatch.setattr(ffmpeg, "ensure_ffmpeg", lambda: None)
-    monkeypatch.setattr(ffmpeg, "probe_duration", lambda _: 5.0)
-    monkeypatch.setattr(ffmpeg, "run_ffmpeg", fake_run_ffmpeg)
-
-    runner = CliRunner()
-    workdir = tmp_path / ".techsprint"
-    result = runner.invoke(app, ["demo", "--workdir", str(workdir)])
-
-    assert result.exit_code == 0
-    outputs = list(workdir.glob("*/final.mp4"))
-    assert outputs
-    srt_files = list(workdir.glob("*/captions.srt"))
-    assert srt_files
-    cue_count = len([b for b in srt_files[0].read_text().split("\n\n") if b.strip()])
-    assert cue_count > 1
-
-
-def test_cli_make_demo_flag_creates_output(monkeypatch, tmp_path: Path) -> None:
-    import techsprint.demo as demo
-    import techsprint.services.subtitles as subtitles
-    from techsprint.utils import ffmpeg
-
-    def fake_run_ffmpeg(cmd: list[str], *, stderr_path=None) -> None:
-        out = Path(cmd[-1])
-        out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_bytes(b"0")
-
-    monkeypatch.setattr(demo, "edge_tts_available", lambda: False)
-    monkeypatch.setattr(subtitles, "_transcribe_with_faster_whisper", lambda _path: None)
-    monkeypatch.setattr(ffmpeg, "ensure_ffmpeg", lambda: None)
-    monkeypatch.setattr(ffmpeg, "probe_duration", lambda _: 5.0)
-    monkeypatch.setattr(ffmpeg, "run_ffmpeg", fake_run_ffmpeg)
-
-    runner = CliRunner()
-    workdir = tmp_path / ".techsprint"
-    result = runner.invoke(app, ["make", "--demo", "--workdir", str(workdir)])
-
-    assert result.exit_code == 0
-    outputs = list(workdir.glob("*/final.mp4"))
-    assert outputs
-    srt_files = list(workdir.glob("*/captions.srt"))
-    assert srt_files
-    cue_count = len([b for b in srt_files[0].read_text().split("\n\n") if b.strip()])
-    assert cue_count > 1
-
-
-def test_cli_run_demo_alias_creates_output(monkeypatch, tmp_path: Path) -> None:
-    import techsprint.demo as demo
-    import techsprint.services.subtitles as subtitles
-    from techsprint.utils import ffmpeg
-
-    def fake_run_ffmpeg(cmd: list[str], *, stderr_path=None) -> None:
-        out = Path(cmd[-1])
-        out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_bytes(b"0")
-
-    monkeypatch.setattr(demo, "edge_tts_available", lambda: False)
-    monkeypatch.setattr(subtitles, "_transcribe_with_faster_whisper", lambda _path: None)
-    monkeypatch.setattr(ffmpeg, "ensure_ffmpeg", lambda: None)
-    monkeypatch.setattr(ffmpeg, "probe_duration", lambda _: 5.0)
-    monkeypatch.setattr(ffmpeg, "run_ffmpeg", fake_run_ffmpeg)
-
-    runner = CliRunner()
+@pytest.mark.parametrize(
+    "argv",
+    [["demo"], ["make", "--demo"], ["run", "--demo"]],
+    ids=["demo", "make-demo", "run-demo"],
+)
+@pytest.mark.usefixtures("stub_ffmpeg")
+def test_cli_demo_variants_create_output(runner, cli_app, tmp_path: Path, argv: list[str]) -> None:
     workdir = tmp_path / ".techsprint"
-    result = runner.invoke(app, ["run", "--demo", "--workdir", str(workdir)])
+    result = runner.invoke(cli_app, [*argv, "--workdir", str(workdir)])
 
     assert result.exit_code == 0
     outputs = list(workdir.glob("*/final.mp4"))
     assert outputs
     srt_files = list(workdir.glob("*/captions.srt"))
     assert srt_files
-    cue_count = len([b for b in srt_files[0].read_text().split("\n\n") if b.strip()])
-    assert cue_count > 1
-
-
-def test_cli_demo_offline_runs_qc(monkeypatch, tmp_path: Path) -> None:
-    import techsprint.cli.main as cli_main
-    import techsprint.utils.qc as qc
-
-    called: dict[str, object] = {}
-
-    def fake_run_demo(job, render=None, force_sine=False):  # noqa: ANN001
-        called["force_sine"] = force_sine
-        return job
-
-    def fake_run_qc(job, mode: str, render=None, enable_asr: bool = True):  # noqa: ANN001
-        called["qc_mode"] = mode
-        called["enable_asr"] = enable_asr
-        return {}
-
-    monkeypatch.setattr(cli_main, "run_demo", fake_run_demo)
-    monkeypatch.setattr(qc, "run_qc", fake_run_qc)
-
-    runner = CliRunner()
-    workdir = tmp_path / ".techsprint"
-    result = runner.invoke(app, ["demo", "--offline", "--workdir", str(workdir)])
-
-    assert result.exit_code == 0
-    assert called.get("force_sine") is True
-    assert called.get("qc_mode") == "strict"
-    assert called.get("enable_asr") is False
-
-
-def test_cli_run_demo_offline_runs_qc(monkeypatch, tmp_path: Path) -> None:
-    import techsprint.cli.main as cli_main
-    import techsprint.utils.qc as qc
-
+    # More than one cue means at least one blank-line separator between blocks.
+    assert srt_files[0].read_text().strip().count("\n\n") >= 1
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["demo", "--offline"], ["run", "--demo", "--offline"]],
+    ids=["demo", "run-demo"],
+)
+def test_cli_demo_offline_runs_qc(
+    runner, cli_app, monkeypatch, tmp_path: Path, argv: list[str]
+) -> None:
     called: dict[str, object] = {}
 
     def fake_run_demo(job, render=None, force_sine=False):  # noqa: ANN001
@@ -140,9 +49,8 @@ def test_cli_run_demo_offline_runs_qc(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(cli_main, "run_demo", fake_run_demo)
     monkeypatch.setattr(qc, "run_qc", fake_run_qc)
 
-    runner = CliRunner()
     workdir = tmp_path / ".techsprint"
-    result = runner.invoke(app, ["run", "--demo", "--offline", "--workdir", str(workdir)])
+    result = runner.invoke(cli_app, [*argv, "--workdir", str(workdir)])
 
     assert result.exit_code == 0
     assert called.get("force_sine") is True
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-from typer.testing import CliRunner
+from techsprint.cli import main as cli_main
+from techsprint.renderers import TIKTOK, YOUTUBE_SHORTS
 
-from techsprint.cli.main import app
-from techsprint.renderers import TIKTOK
 
-
-def test_cli_render_option_maps_to_spec(monkeypatch, tmp_path) -> None:
+def test_cli_render_option_maps_to_spec(runner, cli_app, monkeypatch, tmp_path) -> None:
     class DummyAnchor:
         last_render = None
 
@@ -16,13 +14,10 @@ def test_cli_render_option_maps_to_spec(monkeypatch, tmp_path) -> None:
         def run(self, job):  # noqa: ANN001
             return job
 
-    import techsprint.cli.main as cli_main
-
     monkeypatch.setitem(cli_main.ANCHORS, "tech", DummyAnchor)
 
-    runner = CliRunner()
     result = runner.invoke(
-        app,
+        cli_app,
         [
             "make",
             "--render",
@@ -36,7 +31,7 @@ def test_cli_render_option_maps_to_spec(monkeypatch, tmp_path) -> None:
     assert DummyAnchor.last_render is TIKTOK
 
     alias_result = runner.invoke(
-        app,
+        cli_app,
         [
             "make",
             "--render",
@@ -46,3 +41,4 @@ def test_cli_render_option_maps_to_spec(monkeypatch, tmp_path) -> None:
         ],
     )
     assert alias_result.exit_code == 0
+    assert DummyAnchor.last_render is YOUTUBE_SHORTS
@@ -2,14 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from typer.testing import CliRunner
+from techsprint.cli import main as cli_main
 
-from techsprint.cli.main import app
-
-
-def test_cli_run_invokes_anchor(monkeypatch, tmp_path: Path) -> None:
-    import techsprint.cli.main as cli_main
 
+def test_cli_run_invokes_anchor(runner, cli_app, monkeypatch, tmp_path: Path) -> None:
     class DummyAnchor:
         called = False
         language = None
@@ -26,10 +22,9 @@ def test_cli_run_invokes_anchor(monkeypatch, tmp_path: Path) -> None:
 
     monkeypatch.setitem(cli_main.ANCHORS, "tech", DummyAnchor)
 
-    runner = CliRunner()
     workdir = tmp_path / ".techsprint"
     result = runner.invoke(
-        app,
+        cli_app,
         [
             "run",
             "--workdir",
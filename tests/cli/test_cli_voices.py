@@ -2,12 +2,10 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from typer.testing import CliRunner
+from techsprint.cli import main as cli_main
 
-from techsprint.cli.main import app
 
-
-def test_cli_voices_filters_by_locale(monkeypatch) -> None:
+def test_cli_voices_filters_by_locale(runner, cli_app, monkeypatch) -> None:
     async def list_voices():  # noqa: ANN001
         return [
             {
@@ -25,19 +23,16 @@ def test_cli_voices_filters_by_locale(monkeypatch) -> None:
         ]
 
     fake_edge = SimpleNamespace(list_voices=list_voices)
-    import techsprint.cli.main as cli_main
-
     monkeypatch.setattr(cli_main, "_load_edge_tts", lambda: fake_edge)
 
-    runner = CliRunner()
-    result = runner.invoke(app, ["voices", "--locale", "fr-FR", "--limit", "10"])
+    result = runner.invoke(cli_app, ["voices", "--locale", "fr-FR", "--limit", "10"])
 
     assert result.exit_code == 0
     assert "fr-FR-DeniseNeural" in result.output
     assert "en-US-JennyNeural" not in result.output
 
 
-def test_cli_voices_json(monkeypatch) -> None:
+def test_cli_voices_json(runner, cli_app, monkeypatch) -> None:
     async def list_voices():  # noqa: ANN001
         return [
             {"ShortName": "fr-FR-DeniseNeural", "Gender": "Female", "Locale": "fr-FR"},
@@ -45,24 +40,18 @@ def test_cli_voices_json(monkeypatch) -> None:
         ]
 
     fake_edge = SimpleNamespace(list_voices=list_voices)
-    import techsprint.cli.main as cli_main
-
     monkeypatch.setattr(cli_main, "_load_edge_tts", lambda: fake_edge)
 
-    runner = CliRunner()
-    result = runner.invoke(app, ["voices", "--locale", "fr-FR", "--json"])
+    result = runner.invoke(cli_app, ["voices", "--locale", "fr-FR", "--json"])
 
     assert result.exit_code == 0
     assert result.output.strip().startswith("[")
 
 
-def test_cli_voices_missing_edge_tts(monkeypatch) -> None:
-    import techsprint.cli.main as cli_main
-
+def test_cli_voices_missing_edge_tts(runner, cli_app, monkeypatch) -> None:
     monkeypatch.setattr(cli_main, "_load_edge_tts", lambda: None)
 
-    runner = CliRunner()
-    result = runner.invoke(app, ["voices", "--locale", "fr-FR"])
+    result = runner.invoke(cli_app, ["voices", "--locale", "fr-FR"])
 
     assert result.exit_code == 0
     assert "edge-tts not installed" in result.output
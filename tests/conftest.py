@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import inspect
+from pathlib import Path
 
+import pytest
 import typer.testing
 
+from techsprint.utils import checks, ffmpeg
+
 
 def _patch_clirunner() -> None:
     if "mix_stderr" in inspect.signature(typer.testing.CliRunner).parameters:
@@ -18,3 +22,61 @@ def _patch_clirunner() -> None:
 
 
 _patch_clirunner()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_binary_cache():
+    # Tests patch shutil.which to simulate missing tools; don't let a cached hit mask that.
+    checks.clear_binary_cache()
+    yield
+    checks.clear_binary_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_probe_cache():
+    # probe_media keys on mtime and size; a file rewritten within one mtime tick, or a
+    # swapped ffprobe, must not see another test's cached result.
+    ffmpeg.clear_probe_cache()
+    yield
+    ffmpeg.clear_probe_cache()
+
+
+@pytest.fixture(autouse=True)
+def _no_hw_encoders(monkeypatch):
+    # Keep encoder selection independent of the host's ffmpeg build and GPU.
+    probe = ffmpeg.available_hw_encoders
+    probe.cache_clear()
+    monkeypatch.setattr(ffmpeg, "available_hw_encoders", lambda: ())
+    yield
+    probe.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def runner() -> typer.testing.CliRunner:
+    return typer.testing.CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli_app():
+    from techsprint.cli.main import app
+
+    return app
+
+
+@pytest.fixture
+def stub_ffmpeg(monkeypatch):
+    # Lets the demo pipeline run end to end without ffmpeg, edge-tts or an ASR model.
+    from techsprint import demo
+    from techsprint.services import subtitles
+
+    def fake_run_ffmpeg(cmd: list[str], *, stderr_path=None) -> None:
+        out = Path(cmd[-1])
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_bytes(b"0")
+
+    monkeypatch.setattr(demo, "edge_tts_available", lambda: False)
+    monkeypatch.setattr(subtitles, "_transcribe_with_faster_whisper", lambda _path, **_kwargs: None)
+    monkeypatch.setattr(ffmpeg, "ensure_ffmpeg", lambda: None)
+    monkeypatch.setattr(ffmpeg, "probe_duration", lambda _: 5.0)
+    monkeypatch.setattr(ffmpeg, "run_ffmpeg", fake_run_ffmpeg)
+    return ffmpeg
@@ -4,13 +4,12 @@ from pathlib import Path
 
 from typer.testing import CliRunner
 
+from techsprint.cli import main as cli_main
 from techsprint.cli.main import app
 from techsprint.exceptions import ConfigurationError, DependencyMissingError
 
 
 def test_cli_reports_config_error(monkeypatch, tmp_path: Path) -> None:
-    import techsprint.cli.main as cli_main
-
     def fake_run_pipeline(*_args, **_kwargs):  # noqa: ANN001
         raise ConfigurationError("bad config value")
 
@@ -31,8 +30,6 @@ def test_cli_reports_config_error(monkeypatch, tmp_path: Path) -> None:
 
 
 def test_cli_reports_dependency_error(monkeypatch, tmp_path: Path) -> None:
-    import techsprint.cli.main as cli_main
-
     def fake_run_doctor(_settings):  # noqa: ANN001
         raise DependencyMissingError("ffmpeg missing")
 
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from techsprint.exceptions import DependencyMissingError
+from techsprint.utils import checks
+
+
+def _make_binary(directory: Path, name: str) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    binary = directory / name
+    binary.write_text("#!/bin/sh\n", encoding="utf-8")
+    binary.chmod(0o755)
+    return binary
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX executable bits")
+def test_require_binary_caches_and_revalidates(monkeypatch, tmp_path: Path) -> None:
+    checks.clear_binary_cache()
+    binary = _make_binary(tmp_path / "bin", "techsprint-tool")
+    monkeypatch.setenv("PATH", str(binary.parent))
+
+    calls: list[str] = []
+    real_which = checks.shutil.which
+
+    def counting_which(name, *args, **kwargs):
+        calls.append(name)
+        return real_which(name, *args, **kwargs)
+
+    monkeypatch.setattr(checks.shutil, "which", counting_which)
+
+    checks.require_binary("techsprint-tool")
+    checks.require_binary("techsprint-tool")
+    assert calls == ["techsprint-tool"]
+
+    binary.unlink()
+    with pytest.raises(DependencyMissingError):
+        checks.require_binary("techsprint-tool")
+    checks.clear_binary_cache()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX executable bits")
+def test_ffprobe_lookup_is_shared_across_probes(monkeypatch, tmp_path: Path) -> None:
+    import subprocess
+
+    from techsprint.utils import ffmpeg
+
+    binary = _make_binary(tmp_path / "bin", "ffprobe")
+    monkeypatch.setenv("PATH", str(binary.parent))
+    calls: list[str] = []
+    real_which = checks.shutil.which
+    monkeypatch.setattr(checks.shutil, "which", lambda name: calls.append(name) or real_which(name))
+    monkeypatch.setattr(
+        ffmpeg.subprocess,
+        "run",
+        lambda cmd, **_kwargs: subprocess.CompletedProcess(
+            cmd, 0, stdout='{"format": {"duration": "2.5"}}', stderr=""
+        ),
+    )
+
+    assert ffmpeg.probe_duration(tmp_path / "a.mp3") == 2.5
+    assert ffmpeg.probe_duration(tmp_path / "b.mp3") == 2.5
+    assert calls == ["ffprobe"]
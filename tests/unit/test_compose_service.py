@@ -21,6 +21,14 @@ class DummyJob:
     workspace: Workspace
 
 
+@pytest.fixture(scope="session")
+def background_video(tmp_path_factory) -> Path:
+    # ComposeService only reads the background, so one stub file serves every test.
+    path = tmp_path_factory.mktemp("background") / "bg.mp4"
+    path.write_bytes(b"bg")
+    return path
+
+
 def _capture_cmd(monkeypatch, output_path: Path) -> dict[str, list[str]]:
     calls: dict[str, list[str]] = {}
 
@@ -30,14 +38,14 @@ def _capture_cmd(monkeypatch, output_path: Path) -> dict[str, list[str]]:
 
     monkeypatch.setattr(ffmpeg, "ensure_ffmpeg", lambda: None)
     monkeypatch.setattr(ffmpeg, "run_ffmpeg", fake_run)
+    # No real ffprobe: the background reads as not stream-copyable unless a test says so.
+    monkeypatch.setattr(ffmpeg, "probe_media", lambda _path: {})
     return calls
 
 
-def _inputs_from_cmd(cmd: list[str]) -> list[str]:
-    return [cmd[i + 1] for i, value in enumerate(cmd) if value == "-i"]
-
-
-def test_compose_default_render_uses_settings(monkeypatch, tmp_path: Path) -> None:
+def test_compose_default_render_uses_settings(
+    monkeypatch, tmp_path: Path, background_video: Path
+) -> None:
     settings = Settings()
     settings.workdir = str(tmp_path / ".techsprint")
     settings.burn_subtitles = True
@@ -45,8 +53,7 @@ def test_compose_default_render_uses_settings(monkeypatch, tmp_path: Path) -> No
     workspace = Workspace.create(settings.workdir, run_id="default")
     job = DummyJob(settings=settings, workspace=workspace)
 
-    bg_path = tmp_path / "bg.mp4"
-    bg_path.write_bytes(b"bg")
+    bg_path = background_video
     settings.background_video = str(bg_path)
 
     workspace.audio_mp3.write_bytes(b"audio")
@@ -61,21 +68,23 @@ def test_compose_default_render_uses_settings(monkeypatch, tmp_path: Path) -> No
     ComposeService().render(job)
 
     cmd = calls["cmd"]
-    inputs = _inputs_from_cmd(cmd)
-    assert str(bg_path) in inputs
-    assert str(workspace.audio_mp3) in inputs
+    assert cmd[cmd.index(str(bg_path)) - 1] == "-i"
+    assert cmd[cmd.index(str(workspace.audio_mp3)) - 1] == "-i"
     assert cmd[-1] == str(workspace.output_mp4)
 
-    assert "-vf" in cmd
-    vf = cmd[cmd.index("-vf") + 1]
+    assert "-filter_complex" in cmd
+    vf = cmd[cmd.index("-filter_complex") + 1]
     assert "trim=duration=2.500" in vf
     assert "ass=" in vf
-    assert "captions.ass" in vf
+    assert "captions-" in vf
+    assert list(workspace.root.glob("captions-*.ass"))
     assert "scale=" not in vf
     assert "fps=" not in vf
 
 
-def test_compose_custom_render_spec_controls_filters(monkeypatch, tmp_path: Path) -> None:
+def test_compose_custom_render_spec_controls_filters(
+    monkeypatch, tmp_path: Path, background_video: Path
+) -> None:
     settings = Settings()
     settings.workdir = str(tmp_path / ".techsprint")
     settings.burn_subtitles = False
@@ -83,8 +92,7 @@ def test_compose_custom_render_spec_controls_filters(monkeypatch, tmp_path: Path
     workspace = Workspace.create(settings.workdir, run_id="custom")
     job = DummyJob(settings=settings, workspace=workspace)
 
-    bg_path = tmp_path / "bg.mp4"
-    bg_path.write_bytes(b"bg")
+    bg_path = background_video
     settings.background_video = str(bg_path)
 
     workspace.audio_mp3.write_bytes(b"audio")
@@ -100,22 +108,27 @@ def test_compose_custom_render_spec_controls_filters(monkeypatch, tmp_path: Path
     ComposeService().render(job, render=render)
 
     cmd = calls["cmd"]
-    inputs = _inputs_from_cmd(cmd)
-    assert str(bg_path) in inputs
-    assert str(workspace.audio_mp3) in inputs
+    assert cmd[cmd.index(str(bg_path)) - 1] == "-i"
+    assert cmd[cmd.index(str(workspace.audio_mp3)) - 1] == "-i"
     assert cmd[-1] == str(workspace.output_mp4)
 
-    assert "-vf" in cmd
-    vf = cmd[cmd.index("-vf") + 1]
+    assert "-filter_complex" in cmd
+    vf = cmd[cmd.index("-filter_complex") + 1]
     assert "trim=duration=4.000" in vf
     assert "scale=1080:1920" in vf
     assert "fps=30" in vf
     assert "ass=" in vf
-    assert "captions.ass" in vf
+    assert "captions-" in vf
+    assert list(workspace.root.glob("captions-*.ass"))
     assert "force_style=" not in vf
+    assert vf.count("format=yuv420p") == 1
+    assert vf.endswith("[vout]")
+    assert cmd[cmd.index("-map") + 1] == "[vout]"
 
 
-def test_compose_loops_and_trims_to_audio(monkeypatch, tmp_path: Path) -> None:
+def test_compose_loops_and_trims_to_audio(
+    monkeypatch, tmp_path: Path, background_video: Path
+) -> None:
     settings = Settings()
     settings.workdir = str(tmp_path / ".techsprint")
     settings.burn_subtitles = False
@@ -123,21 +136,15 @@ def test_compose_loops_and_trims_to_audio(monkeypatch, tmp_path: Path) -> None:
     workspace = Workspace.create(settings.workdir, run_id="loop")
     job = DummyJob(settings=settings, workspace=workspace)
 
-    bg_path = tmp_path / "bg.mp4"
-    bg_path.write_bytes(b"bg")
+    bg_path = background_video
     settings.background_video = str(bg_path)
 
     workspace.audio_mp3.write_bytes(b"audio")
 
-    def fake_probe(path):
-        if Path(path) == bg_path:
-            return 1.0
-        if Path(path) == workspace.audio_mp3:
-            return 3.0
-        return None
+    durations = {str(bg_path): 1.0, str(workspace.audio_mp3): 3.0}
 
     calls = _capture_cmd(monkeypatch, workspace.output_mp4)
-    monkeypatch.setattr(ffmpeg, "probe_duration", fake_probe)
+    monkeypatch.setattr(ffmpeg, "probe_duration", lambda path: durations.get(str(path)))
     ComposeService().render(job)
 
     cmd = calls["cmd"]
@@ -176,6 +183,7 @@ def test_strict_layout_records_metadata_before_failure(monkeypatch, tmp_path: Pa
 
     monkeypatch.setattr(ffmpeg, "ensure_ffmpeg", lambda: None)
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda *_args, **_kwargs: 1.0)
+    monkeypatch.setattr(ffmpeg, "probe_media", lambda _path: {})
     monkeypatch.setattr(ffmpeg, "write_ass_from_srt", lambda *a, **k: workspace.path("captions.ass"))
     monkeypatch.setattr(ffmpeg, "build_compose_cmd", lambda *a, **k: ["echo", "ffmpeg"])
     monkeypatch.setattr(ffmpeg, "run_ffmpeg", lambda *a, **k: None)
@@ -185,3 +193,64 @@ def test_strict_layout_records_metadata_before_failure(monkeypatch, tmp_path: Pa
 
     assert job.artifacts.subtitles.layout_ok is False
     assert job.artifacts.subtitles.layout_bbox is not None
+
+
+def test_compose_stream_copies_h264_background_without_burn_in(
+    monkeypatch, tmp_path: Path, background_video: Path
+) -> None:
+    settings = Settings()
+    settings.workdir = str(tmp_path / ".techsprint")
+    settings.burn_subtitles = False
+
+    workspace = Workspace.create(settings.workdir, run_id="copy")
+    job = DummyJob(settings=settings, workspace=workspace)
+
+    bg_path = background_video
+    settings.background_video = str(bg_path)
+    workspace.audio_mp3.write_bytes(b"audio")
+
+    calls = _capture_cmd(monkeypatch, workspace.output_mp4)
+    monkeypatch.setattr(ffmpeg, "probe_duration", lambda path: 2.0)
+    monkeypatch.setattr(
+        ffmpeg,
+        "probe_media",
+        lambda _path: {"video_codec": "h264", "pixel_format": "yuv420p"},
+    )
+    ComposeService().render(job)
+
+    cmd = calls["cmd"]
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+    assert "-filter_complex" not in cmd
+    assert cmd[cmd.index("-t") + 1] == "2.000"
+
+
+def test_compose_stream_copies_background_matching_render(
+    monkeypatch, tmp_path: Path, background_video: Path
+) -> None:
+    settings = Settings()
+    settings.workdir = str(tmp_path / ".techsprint")
+
+    workspace = Workspace.create(settings.workdir, run_id="copy-render")
+    job = DummyJob(settings=settings, workspace=workspace)
+
+    bg_path = background_video
+    settings.background_video = str(bg_path)
+    workspace.audio_mp3.write_bytes(b"audio")
+
+    calls = _capture_cmd(monkeypatch, workspace.output_mp4)
+    monkeypatch.setattr(ffmpeg, "probe_duration", lambda path: 2.0)
+    probe = {"video_codec": "h264", "pixel_format": "yuv420p", "width": 1080, "height": 1920}
+    monkeypatch.setattr(ffmpeg, "probe_media", lambda _path: {**probe, "fps": 30.0})
+    render = RenderSpec("tiktok", 1080, 1920, fps=30, burn_subtitles=False)
+    ComposeService().render(job, render=render)
+
+    cmd = calls["cmd"]
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+    assert "-filter_complex" not in cmd
+
+    monkeypatch.setattr(ffmpeg, "probe_media", lambda _path: {**probe, "fps": 25.0})
+    ComposeService().render(job, render=render)
+
+    cmd = calls["cmd"]
+    assert cmd[cmd.index("-c:v") + 1] != "copy"
+    assert "fps=30" in cmd[cmd.index("-filter_complex") + 1]
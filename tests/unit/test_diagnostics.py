@@ -60,3 +60,27 @@ def test_doctor_missing_edge_tts(monkeypatch) -> None:
     settings = Settings()
     code = diagnostics.run_doctor(settings)
     assert code == 0
+
+
+def test_module_available_does_not_import(monkeypatch) -> None:
+    import sys
+
+    diagnostics._module_available.cache_clear()
+    monkeypatch.delitem(sys.modules, "json.tool", raising=False)
+
+    assert diagnostics._module_available("json.tool") is True
+    assert "json.tool" not in sys.modules
+    assert diagnostics._module_available("techsprint_missing_module") is False
+
+
+def test_check_writable_skips_write_probe_when_access_allows(monkeypatch, tmp_path) -> None:
+    def fail_probe(*_args, **_kwargs):
+        raise AssertionError("temp-file probe should not run")
+
+    monkeypatch.setattr(diagnostics.tempfile, "NamedTemporaryFile", fail_probe)
+    assert diagnostics._check_writable(tmp_path / "work") is True
+
+
+def test_check_writable_confirms_denied_access_with_write_probe(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(diagnostics.os, "access", lambda *_args: False)
+    assert diagnostics._check_writable(tmp_path) is True
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from types import SimpleNamespace
+import json
+import os
+import sys
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
 from techsprint.utils import ffmpeg
 
@@ -21,10 +26,10 @@ def test_probe_loudnorm_parses_json(monkeypatch) -> None:
     }
     """
 
-    def fake_run(cmd, capture_output, text):  # noqa: ANN001
+    def fake_run(cmd, capture_output, text, timeout):
         return SimpleNamespace(returncode=0, stdout="", stderr=stderr)
 
-    monkeypatch.setattr(ffmpeg.shutil, "which", lambda _: "ffmpeg")
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _: "ffmpeg")
     monkeypatch.setattr(ffmpeg.subprocess, "run", fake_run)
 
     data = ffmpeg.probe_loudnorm("input.mp4")
@@ -181,6 +186,42 @@ def test_ass_writer_keeps_commas_clean(tmp_path: Path) -> None:
     assert "Today\\," not in content
 
 
+def test_cached_ass_from_srt_reuses_matching_conversion(monkeypatch, tmp_path: Path) -> None:
+    srt_path = tmp_path / "captions.srt"
+    srt_path.write_text("1\n00:00:00,000 --> 00:00:01,000\nHello\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    first = ffmpeg.cached_ass_from_srt(
+        srt_path, cache_dir, render=None, max_subtitle_lines=2, max_chars_per_line=20
+    )
+    assert first.exists()
+    assert "Hello" in first.read_text(encoding="utf-8")
+
+    def fail_write(*_args, **_kwargs):
+        raise AssertionError("cached ASS should be reused")
+
+    monkeypatch.setattr(ffmpeg, "write_ass_from_srt", fail_write)
+    again = ffmpeg.cached_ass_from_srt(
+        srt_path, cache_dir, render=None, max_subtitle_lines=2, max_chars_per_line=20
+    )
+    assert again == first
+
+    monkeypatch.undo()
+    from techsprint.renderers.base import RenderSpec
+
+    restyled = ffmpeg.cached_ass_from_srt(
+        srt_path,
+        cache_dir,
+        render=RenderSpec("wide", 1920, 1080),
+        max_subtitle_lines=2,
+        max_chars_per_line=20,
+    )
+    assert restyled != first
+    # The superseded conversion is removed once the new one is in place.
+    assert list(cache_dir.glob("captions-*.ass")) == [restyled]
+    assert not list(cache_dir.glob("*.tmp"))
+
+
 def test_build_compose_cmd_includes_loudnorm() -> None:
     cmd = ffmpeg.build_compose_cmd(
         "bg.mp4",
@@ -215,3 +256,259 @@ def test_parse_loudnorm_stderr_extracts_json() -> None:
     data = ffmpeg.parse_loudnorm_stderr(stderr)
     assert data is not None
     assert data["output_i"] == "-16.0"
+
+
+def test_run_ffmpeg_writes_stderr_and_reports_tail(tmp_path: Path) -> None:
+    stderr_path = tmp_path / "ffmpeg.stderr.txt"
+    cmd = [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+    with pytest.raises(RuntimeError) as excinfo:
+        ffmpeg.run_ffmpeg(cmd, stderr_path=stderr_path)
+
+    assert "boom" in str(excinfo.value)
+    assert stderr_path.read_text(encoding="utf-8") == "boom"
+
+
+def test_run_ffmpeg_keeps_bounded_stderr_tail(tmp_path: Path) -> None:
+    stderr_path = tmp_path / "ffmpeg.stderr.txt"
+    script = "import sys\nfor i in range(500): sys.stderr.write(f'line {i}\\n')\nsys.exit(1)"
+    with pytest.raises(RuntimeError) as excinfo:
+        ffmpeg.run_ffmpeg([sys.executable, "-c", script], stderr_path=stderr_path)
+
+    message = str(excinfo.value)
+    assert "line 499" in message
+    assert "line 0\n" not in message
+    assert len(stderr_path.read_text(encoding="utf-8").splitlines()) == 500
+
+
+def test_run_ffmpeg_returns_stderr_tail(tmp_path: Path) -> None:
+    cmd = [sys.executable, "-c", "import sys; sys.stderr.write('frame=1\\n')"]
+    result = ffmpeg.run_ffmpeg(cmd)
+
+    assert result.returncode == 0
+    assert result.stdout is None
+    assert result.stderr == "frame=1\n"
+
+
+def test_select_video_encoder_prefers_hardware(monkeypatch) -> None:
+    monkeypatch.setattr(ffmpeg, "available_hw_encoders", lambda: ("h264_videotoolbox",))
+    assert ffmpeg.select_video_encoder("auto") == "h264_videotoolbox"
+    assert ffmpeg.select_video_encoder("cpu") == "libx264"
+    assert ffmpeg.select_video_encoder("nvenc") == "h264_nvenc"
+
+    monkeypatch.setattr(ffmpeg, "available_hw_encoders", lambda: ())
+    assert ffmpeg.select_video_encoder("auto") == "libx264"
+
+
+def test_build_compose_cmd_uses_hw_encoder_args() -> None:
+    cmd = ffmpeg.build_compose_cmd(
+        "bg.mp4",
+        "audio.mp3",
+        None,
+        "out.mp4",
+        video_encoder="h264_nvenc",
+    )
+    assert cmd[cmd.index("-c:v") + 1] == "h264_nvenc"
+    assert "-cq" in cmd
+    assert "-crf" not in cmd
+    assert cmd[cmd.index("-cq") + 1] == "23"
+    assert cmd[cmd.index("-preset") + 1] == "p5"
+
+    preview = ffmpeg.video_encoder_args("h264_nvenc", preset="ultrafast", crf=18)
+    assert preview[preview.index("-preset") + 1] == "p1"
+    assert preview[preview.index("-cq") + 1] == "21"
+
+
+def test_low_latency_probe_flags_precede_fast_seek_inputs() -> None:
+    cmd = ffmpeg.build_extract_frame_cmd("out.mp4", "frame.png", seconds=1.5)
+    i = cmd.index("-i")
+    assert cmd.index("-ss") < i
+    assert cmd[i - 6 : i] == list(ffmpeg.LOW_LATENCY_INPUT_ARGS)
+    assert cmd[i - 2 : i] == ["-fpsprobesize", "0"]
+
+    compose = ffmpeg.build_compose_cmd("bg.mp4", "audio.mp3", None, "out.mp4")
+    audio_i = compose.index("audio.mp3") - 1
+    assert compose[audio_i - 6 : audio_i] == list(ffmpeg.LOW_LATENCY_INPUT_ARGS)
+    assert compose.count("-probesize") == 1
+
+    full = ffmpeg.build_extract_frame_cmd("out.mp4", "frame.png", seconds=1.5, low_latency=False)
+    assert "-probesize" not in full
+
+
+def test_build_compose_cmd_x264_preset_from_render_and_override() -> None:
+    from techsprint.renderers.base import RenderSpec
+
+    render = RenderSpec("final", 1080, 1920, x264_preset="slow", x264_crf=18)
+    cmd = ffmpeg.build_compose_cmd("bg.mp4", "audio.mp3", None, "out.mp4", render=render)
+    assert cmd[cmd.index("-preset") + 1] == "slow"
+    assert cmd[cmd.index("-crf") + 1] == "18"
+    assert "-tune" not in cmd
+
+    preview = ffmpeg.build_compose_cmd(
+        "bg.mp4",
+        "audio.mp3",
+        None,
+        "out.mp4",
+        render=render,
+        preset="ultrafast",
+        tune="zerolatency",
+    )
+    assert preview[preview.index("-preset") + 1] == "ultrafast"
+    assert preview[preview.index("-tune") + 1] == "zerolatency"
+    assert "sliced-threads=1" in preview[preview.index("-x264-params") + 1]
+    assert cmd[cmd.index("-threads") + 1] == "0"
+    assert "lookahead-threads=auto" in cmd[cmd.index("-x264-params") + 1]
+
+
+def test_parse_loudnorm_stderr_takes_last_balanced_block() -> None:
+    stderr = (
+        "Input #0 {not json}\n"
+        '[Parsed_loudnorm_0 @ 0x1] {"input_i" : "-23.0", "note" : "a } b \\" {"}\n'
+        "trailing {junk"
+    )
+    data = ffmpeg.parse_loudnorm_stderr(stderr)
+    assert data == {"input_i": "-23.0", "note": 'a } b " {'}
+
+    assert ffmpeg.parse_loudnorm_stderr('{"output_i": "-16.0"} then {oops}') == {
+        "output_i": "-16.0"
+    }
+    assert ffmpeg.parse_loudnorm_stderr("no json here") is None
+
+
+def test_probe_media_is_cached_until_file_changes(monkeypatch, tmp_path: Path) -> None:
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"v1")
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, capture_output, text, timeout):
+        calls.append(cmd)
+        payload = {"format": {"duration": str(len(calls))}, "streams": []}
+        return SimpleNamespace(returncode=0, stdout=json.dumps(payload), stderr="")
+
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _: "ffprobe")
+    monkeypatch.setattr(ffmpeg.subprocess, "run", fake_run)
+
+    assert ffmpeg.probe_media(media)["duration_seconds"] == 1.0
+    assert ffmpeg.probe_duration(media) == 1.0
+    assert len(calls) == 1
+
+    media.write_bytes(b"v2 longer")
+    os.utime(media, ns=(0, 1))
+    assert ffmpeg.probe_duration(media) == 2.0
+    assert len(calls) == 2
+
+
+def test_run_many_preserves_order_and_collects_failures(monkeypatch) -> None:
+    def fake_run(cmd, *, stderr_path=None):
+        if cmd[0] == "bad":
+            raise RuntimeError("ffmpeg failed.")
+        return cmd[0]
+
+    monkeypatch.setattr(ffmpeg, "run_ffmpeg", fake_run)
+
+    results = ffmpeg.run_many([["a"], ["bad"], ["c"]], max_parallel=3, return_exceptions=True)
+    assert results[0] == "a"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == "c"
+
+    with pytest.raises(RuntimeError):
+        ffmpeg.run_many([["a"], ["bad"]])
+    assert ffmpeg.run_many([]) == []
+
+
+def test_parse_srt_entries_handles_crlf_multiline_and_invalid_cues(tmp_path: Path) -> None:
+    srt_path = tmp_path / "captions.srt"
+    srt_path.write_bytes(
+        b"1\r\n00:00:00,000 --> 00:00:01,500\r\nHello\r\nworld  \r\n\r\n"
+        b"2\r\n00:00:02,000 --> 00:00:01,000\r\nBackwards\r\n\r\n"
+        b"3\r\n01:00:02,250 --> 01:00:03,000\r\nLast\r\n"
+    )
+    assert ffmpeg._parse_srt_entries(srt_path) == [
+        (0.0, 1.5, "Hello\nworld"),
+        (3602.25, 3603.0, "Last"),
+    ]
+
+
+def test_parse_srt_entries_keeps_empty_cue_separate(tmp_path: Path) -> None:
+    srt_path = tmp_path / "captions.srt"
+    srt_path.write_text(
+        "1\n00:00:00,000 --> 00:00:01,000\nOne\n\n"
+        "2\n00:00:01,000 --> 00:00:02,000\n\n"
+        "3\n00:00:02,000 --> 00:00:03,000\nThree\n",
+        encoding="utf-8",
+    )
+    assert ffmpeg._parse_srt_entries(srt_path) == [
+        (0.0, 1.0, "One"),
+        (1.0, 2.0, ""),
+        (2.0, 3.0, "Three"),
+    ]
+
+
+def test_ass_writer_escapes_override_braces_and_newlines(tmp_path: Path) -> None:
+    srt_path = tmp_path / "captions.srt"
+    ass_path = tmp_path / "captions.ass"
+    srt_path.write_text(
+        "1\n00:00:00,000 --> 00:00:01,000\nUse {braces} \\ here\nsecond line\n",
+        encoding="utf-8",
+    )
+    ffmpeg.write_ass_from_srt(
+        srt_path, ass_path, render=None, max_subtitle_lines=2, max_chars_per_line=20
+    )
+    dialogue = ass_path.read_text(encoding="utf-8").splitlines()[-1]
+    assert dialogue.endswith(r"Use \{braces\} \\ here\Nsecond line")
+
+
+def test_format_ass_time_rounds_to_centiseconds() -> None:
+    assert ffmpeg._format_ass_time(0.0) == "0:00:00.00"
+    assert ffmpeg._format_ass_time(59.996) == "0:01:00.00"
+    assert ffmpeg._format_ass_time(3723.456) == "1:02:03.46"
+
+
+def test_style_params_are_memoized_read_only_views() -> None:
+    from techsprint.renderers.base import RenderSpec
+
+    render = RenderSpec("tiktok", 1080, 1920)
+    first = ffmpeg.subtitle_style_params(render, max_subtitle_lines=2, max_chars_per_line=36)
+    second = ffmpeg.subtitle_style_params(render, max_subtitle_lines=2, max_chars_per_line=36)
+    assert first == second
+    with pytest.raises(TypeError):
+        first["font_size"] = 1  # type: ignore[index]
+
+    filters = ffmpeg.build_safe_area_overlay_filters(render)
+    filters.append("mutated")
+    assert "mutated" not in ffmpeg.build_safe_area_overlay_filters(render)
+
+
+def test_escape_filter_arg_escapes_filter_metacharacters() -> None:
+    assert ffmpeg._escape_filter_arg("C:\\subs\\it's,here.ass") == r"C\:\\subs\\it\'s\,here.ass"
+
+
+def test_build_compose_cmd_stream_copy_maps_background_video_and_narration() -> None:
+    cmd = ffmpeg.build_compose_cmd(
+        "bg.mp4", "audio.mp3", None, "out.mp4", duration_seconds=2.0, stream_copy_video=True
+    )
+    assert "-filter_complex" not in cmd
+    maps = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"]
+    assert maps == ["0:v:0", "1:a:0"]
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+
+
+def test_build_compose_cmd_faststart_only_when_requested() -> None:
+    cmd = ffmpeg.build_compose_cmd("bg.mp4", "audio.mp3", None, "out.mp4", faststart=True)
+    assert cmd[-3:] == ["-movflags", "+faststart", "out.mp4"]
+    assert "-movflags" not in ffmpeg.build_compose_cmd("bg.mp4", "audio.mp3", None, "out.mp4")
+
+
+def test_probes_time_out_instead_of_hanging(monkeypatch, tmp_path: Path) -> None:
+    import subprocess
+
+    from techsprint.exceptions import TechSprintError
+
+    def hanging_run(cmd, **kwargs):
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda name: name)
+    monkeypatch.setattr(ffmpeg.subprocess, "run", hanging_run)
+
+    assert ffmpeg.probe_media(tmp_path / "missing.mp4") is None
+    with pytest.raises(TechSprintError, match="timed out"):
+        ffmpeg.probe_loudnorm("input.mp4")
@@ -82,3 +82,34 @@ def test_validate_run_manifest_failure_message(tmp_path: Path) -> None:
         validate_run_manifest(manifest)
 
     assert "duration_seconds_total" in str(excinfo.value)
+
+
+def test_run_manifest_schema_is_loaded_once() -> None:
+    from techsprint.utils import manifest as manifest_utils
+
+    assert manifest_utils._load_run_manifest_schema() is manifest_utils._load_run_manifest_schema()
+
+
+def test_validate_run_manifest_reports_nested_locations(tmp_path: Path) -> None:
+    manifest = _build_sample_manifest(tmp_path)
+    manifest["steps"][0]["extra"] = True
+    with pytest.raises(ValueError, match="at steps/0: unexpected field 'extra'"):
+        validate_run_manifest(manifest)
+
+    manifest = _build_sample_manifest(tmp_path)
+    del manifest["artifacts"]["video"]["path"]
+    with pytest.raises(ValueError, match="at artifacts/video: missing required field 'path'"):
+        validate_run_manifest(manifest)
+
+    manifest = _build_sample_manifest(tmp_path)
+    manifest["media_probe"]["width"] = -1
+    with pytest.raises(ValueError, match="at media_probe/width: value below minimum 0"):
+        validate_run_manifest(manifest)
+
+
+@pytest.mark.parametrize("value", [True, 1.5, "3"])
+def test_validate_run_manifest_rejects_non_integer_counts(tmp_path: Path, value) -> None:
+    manifest = _build_sample_manifest(tmp_path)
+    manifest["artifacts"]["subtitles"]["cue_count"] = value
+    with pytest.raises(ValueError, match=r"artifacts/subtitles/cue_count: expected types"):
+        validate_run_manifest(manifest)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
+
 from techsprint.domain.artifacts import (
     AudioArtifact,
     ScriptArtifact,
@@ -89,3 +93,126 @@ def test_pipeline_unit_end_to_end(tmp_path: Path) -> None:
     assert job.artifacts.audio.path.exists()
     assert job.artifacts.subtitles.path.exists()
     assert job.artifacts.video.path.exists()
+
+
+def test_pipeline_overlaps_compose_without_burn_in(tmp_path: Path) -> None:
+    settings = Settings()
+    settings.workdir = str(tmp_path / ".techsprint")
+    settings.burn_subtitles = False
+
+    ws = Workspace.create(settings.workdir, run_id="unit2")
+    job = Job(settings=settings, workspace=ws)
+
+    compose_started = threading.Event()
+
+    @dataclass
+    class BlockingSubtitleService(FakeSubtitleService):
+        def generate(self, job: Job, *, script_text: str) -> SubtitleArtifact:
+            # Compose must be able to start while subtitles are still in flight.
+            assert compose_started.wait(timeout=5)
+            return super().generate(job, script_text=script_text)
+
+    @dataclass
+    class SignallingComposeService(FakeComposeService):
+        def render(self, job: Job, *, render=None) -> VideoArtifact:
+            compose_started.set()
+            return super().render(job, render=render)
+
+    class DummyPrompt:
+        system = "x"
+
+        def render(self, **kwargs):
+            return "x"
+
+    pipeline = Pipeline(
+        news=FakeNewsService(),  # type: ignore[arg-type]
+        script=FakeScriptService(),  # type: ignore[arg-type]
+        audio=FakeAudioService(),  # type: ignore[arg-type]
+        subtitles=BlockingSubtitleService(),  # type: ignore[arg-type]
+        compose=SignallingComposeService(),  # type: ignore[arg-type]
+    )
+    job = pipeline.run(job, prompt=DummyPrompt())
+
+    assert job.artifacts.subtitles is not None
+    assert job.artifacts.video is not None
+    manifest = ws.run_manifest.read_text(encoding="utf-8")
+    assert manifest.index('"generate_subtitles"') < manifest.index('"compose_video"')
+
+
+@dataclass
+class FailingSubtitleService(FakeSubtitleService):
+    def generate(self, job: Job, *, script_text: str) -> SubtitleArtifact:
+        raise RuntimeError("subtitles broke")
+
+
+class DummyPrompt:
+    system = "x"
+
+    def render(self, **kwargs):
+        return "x"
+
+
+def _no_burn_in_run(tmp_path: Path, run_id: str, *, subtitles, compose) -> Job:
+    settings = Settings()
+    settings.workdir = str(tmp_path / ".techsprint")
+    settings.burn_subtitles = False
+    job = Job(settings=settings, workspace=Workspace.create(settings.workdir, run_id=run_id))
+    pipeline = Pipeline(
+        news=FakeNewsService(),  # type: ignore[arg-type]
+        script=FakeScriptService(),  # type: ignore[arg-type]
+        audio=FakeAudioService(),  # type: ignore[arg-type]
+        subtitles=subtitles,
+        compose=compose,
+    )
+    return pipeline.run(job, prompt=DummyPrompt())
+
+
+def test_pipeline_subtitle_failure_does_not_wait_for_compose(tmp_path: Path) -> None:
+    release = threading.Event()
+
+    @dataclass
+    class SlowComposeService(FakeComposeService):
+        def render(self, job: Job, *, render=None) -> VideoArtifact:
+            release.wait(timeout=5)
+            return super().render(job, render=render)
+
+    try:
+        with pytest.raises(RuntimeError, match="subtitles broke"):
+            _no_burn_in_run(
+                tmp_path, "unit3", subtitles=FailingSubtitleService(), compose=SlowComposeService()
+            )
+        # The failure surfaced while the encode was still in flight.
+        assert not release.is_set()
+        assert (tmp_path / ".techsprint" / "unit3" / "run.json").exists()
+    finally:
+        release.set()
+
+
+def test_pipeline_reports_compose_error_when_subtitles_also_fail(tmp_path: Path) -> None:
+    compose_thread: list[threading.Thread] = []
+
+    @dataclass
+    class FailingComposeService(FakeComposeService):
+        def render(self, job: Job, *, render=None) -> VideoArtifact:
+            compose_thread.append(threading.current_thread())
+            raise RuntimeError("compose broke")
+
+    @dataclass
+    class LateFailingSubtitleService(FakeSubtitleService):
+        def generate(self, job: Job, *, script_text: str) -> SubtitleArtifact:
+            # Let the compose worker finish failing before subtitles fail too.
+            deadline = time.monotonic() + 5
+            while not compose_thread and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            raise RuntimeError("subtitles broke")
+
+    with pytest.raises(RuntimeError, match="subtitles broke") as excinfo:
+        _no_burn_in_run(
+            tmp_path,
+            "unit4",
+            subtitles=LateFailingSubtitleService(),
+            compose=FailingComposeService(),
+        )
+
+    assert any("compose broke" in note for note in getattr(excinfo.value, "__notes__", []))
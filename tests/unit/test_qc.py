@@ -33,7 +33,164 @@ def test_qc_strict_flags_duration_deltas(tmp_path: Path, monkeypatch) -> None:
     )
 
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda path: 10.0 if "audio" in str(path) else 9.5)
-    monkeypatch.setattr(ffmpeg.shutil, "which", lambda _: None)
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _: None)
 
     with pytest.raises(TechSprintError, match="AV duration delta exceeds"):
         run_qc(job, mode="strict")
+
+
+def test_parse_srt_cues_joins_lines_and_skips_bad_timings(tmp_path: Path) -> None:
+    from techsprint.utils.qc import _parse_srt_cues
+
+    srt = tmp_path / "captions.srt"
+    srt.write_text(
+        "1\n00:00:00,000 --> 00:00:01,500\n Hello there \nfriend\n\n"
+        "2\n00:00:03,000 --> 00:00:02,000\nBackwards\n\n"
+        "3\n00:00:02,000 --> 00:00:04,250\nLast one.\n",
+        encoding="utf-8",
+    )
+    assert _parse_srt_cues(srt) == [
+        (0.0, 1.5, "Hello there friend"),
+        (2.0, 4.25, "Last one."),
+    ]
+    assert _parse_srt_cues(tmp_path / "missing.srt") == []
+
+
+def test_parse_srt_cues_keeps_empty_cue_separate(tmp_path: Path) -> None:
+    from techsprint.utils.qc import _parse_srt_cues
+
+    srt = tmp_path / "captions.srt"
+    srt.write_text(
+        "1\n00:00:00,000 --> 00:00:01,000\nOne.\n\n"
+        "2\n00:00:01,000 --> 00:00:02,000\n\n"
+        "3\n00:00:02,000 --> 00:00:03,000\nThree.\n",
+        encoding="utf-8",
+    )
+    assert _parse_srt_cues(srt) == [(0.0, 1.0, "One."), (1.0, 2.0, ""), (2.0, 3.0, "Three.")]
+
+
+def test_parse_time_accepts_srt_timestamps_only() -> None:
+    from techsprint.utils.qc import _parse_time
+
+    assert _parse_time("01:02:03,450") == 3723.45
+    assert _parse_time(" 0:00:01,5 ") == 1.005
+    assert _parse_time("00:00:01.500") is None
+    assert _parse_time("") is None
+
+
+def test_compare_token_lists_reports_first_mismatch() -> None:
+    from techsprint.utils.qc import _compare_token_lists, _verbatim_tokens
+
+    expected = _verbatim_tokens("Hello, “world” today.")
+    summary = _compare_token_lists(expected, _verbatim_tokens('hello, "world" today.'))
+    assert summary["status"] == "pass"
+
+    summary = _compare_token_lists(expected, _verbatim_tokens("Hello, world"))
+    assert summary["status"] == "fail"
+    assert summary["mismatch"] == {
+        "mismatch_index": 2,
+        "expected_token": '"',
+        "actual_token": "world",
+    }
+
+
+def test_whisper_model_is_loaded_once_per_configuration(monkeypatch) -> None:
+    import sys
+    import types
+
+    from techsprint.utils import qc
+
+    loads = []
+
+    class FakeWhisperModel:
+        def __init__(self, size, *, device, compute_type):
+            loads.append((size, device, compute_type))
+
+    monkeypatch.setitem(
+        sys.modules, "faster_whisper", types.SimpleNamespace(WhisperModel=FakeWhisperModel)
+    )
+    qc._load_whisper_model.cache_clear()
+    try:
+        first = qc._whisper_model("base", "cpu", "int8")
+        assert qc._whisper_model("base", "cpu", "int8") is first
+    finally:
+        qc._load_whisper_model.cache_clear()
+    assert loads == [("base", "cpu", "int8")]
+
+
+def test_transcribe_with_faster_whisper_collects_word_midpoints(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    from techsprint.utils import qc
+
+    segment = SimpleNamespace(
+        start=0.0,
+        end=1.0,
+        text="hi there",
+        words=[SimpleNamespace(start=0.0, end=0.4), SimpleNamespace(start=0.5, end=1.0)],
+    )
+
+    class FakeModel:
+        def transcribe(self, path, *, word_timestamps):
+            return iter([segment]), None
+
+    loads = []
+
+    def fake_whisper_model(*args):
+        loads.append(args)
+        return FakeModel()
+
+    monkeypatch.setattr(qc, "find_spec", lambda _name: object())
+    monkeypatch.setattr(qc, "_whisper_model", fake_whisper_model)
+
+    result = qc._transcribe_with_faster_whisper(
+        Path("audio.mp3"), device="cuda", compute_type="int8_float16"
+    )
+    assert result == {"segments": [segment], "word_midpoints": [0.2, 0.75]}
+    assert loads == [("base", "cuda", "int8_float16")]
+
+    monkeypatch.setattr(qc, "find_spec", lambda _name: None)
+    assert qc._transcribe_with_faster_whisper(Path("audio.mp3")) is None
+
+
+def test_parse_srt_cues_handles_crlf(tmp_path: Path) -> None:
+    from techsprint.utils.qc import _parse_srt_cues
+
+    srt = tmp_path / "captions.srt"
+    srt.write_bytes(
+        b"1\r\n00:00:00,000 --> 00:00:01,000\r\nOne.\r\n\r\n"
+        b"2\r\n00:00:01,000 --> 00:00:02,000\r\nTwo.\r\n"
+    )
+    assert _parse_srt_cues(srt) == [(0.0, 1.0, "One."), (1.0, 2.0, "Two.")]
+
+
+def test_token_overlap_is_case_and_whitespace_insensitive() -> None:
+    from techsprint.utils.qc import _token_overlap
+
+    assert _token_overlap("Hello  big\nWorld", "hello world") == 2 / 3
+    assert _token_overlap("", "hello") == 0.0
+
+
+def test_threshold_failures_apply_mode_specific_limits() -> None:
+    from techsprint.utils.qc import _threshold_failures
+
+    qc = {
+        "srt_span_ok": True,
+        "cue_stats": None,
+        "cue_short_percent": None,
+        "cue_median_seconds": 1.2,
+        "orphan_line_rate": None,
+        "cue_changes_per_10s": None,
+        "audio_duration": 10.0,
+        "subtitle_end_seconds": 10.0,
+        "av_delta_seconds": None,
+        "subtitle_delta_seconds": None,
+        "subtitle_start_seconds": None,
+        "subtitle_layout_ok": True,
+        "drift": {"avg_seconds": 0.3, "max_seconds": 0.5},
+    }
+    assert _threshold_failures(qc, "strict") == ["Median cue duration below 1.5s"]
+    assert _threshold_failures(qc, "broadcast") == [
+        "Subtitle/ASR drift exceeds broadcast threshold"
+    ]
+    assert _threshold_failures(qc, "draft") == []
@@ -35,7 +35,7 @@ def test_qc_flags_overfragmentation(tmp_path: Path, monkeypatch) -> None:
     ws.subtitles_srt.write_text("\n".join(cues), encoding="utf-8")
 
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda path: 10.0)
-    monkeypatch.setattr(ffmpeg.shutil, "which", lambda _: None)
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _: None)
 
     with pytest.raises(TechSprintError, match="Cues under minimum duration"):
         run_qc(job, mode="strict")
@@ -55,7 +55,55 @@ def test_qc_rejects_metadata_tokens(tmp_path: Path, monkeypatch) -> None:
     )
 
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda path: 2.0)
-    monkeypatch.setattr(ffmpeg.shutil, "which", lambda _: None)
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _: None)
 
     qc = run_qc(job, mode="strict")
     assert any("Caption text/layout violations" in warning for warning in qc["warnings"])
+
+
+def test_qc_flags_bad_spacing_and_bad_terms(tmp_path: Path, monkeypatch) -> None:
+    settings = Settings()
+    settings.workdir = str(tmp_path / ".techsprint")
+    ws = Workspace.create(settings.workdir, run_id="qcterms")
+    job = Job(settings=settings, workspace=ws)
+
+    ws.audio_mp3.write_bytes(b"audio")
+    ws.output_mp4.write_bytes(b"video")
+    ws.subtitles_srt.write_text(
+        "1\n00:00:00,000 --> 00:00:02,000\nWarner Brothers made a bid.\n\n"
+        "2\n00:00:02,000 --> 00:00:04,000\nThe deal is done , finally.\n",
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(ffmpeg, "probe_duration", lambda path: 4.0)
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _: None)
+
+    qc = run_qc(job, mode="draft", enable_asr=False)
+    rules = {(v["cue"], v["rule"]) for v in qc["violations"]}
+    assert (1, "bad_term") in rules
+    assert (2, "bad_spacing") in rules
+    assert (1, "bad_spacing") not in rules
+
+
+def test_qc_cue_duration_stats(tmp_path: Path, monkeypatch) -> None:
+    settings = Settings()
+    settings.workdir = str(tmp_path / ".techsprint")
+    ws = Workspace.create(settings.workdir, run_id="qcstats")
+    job = Job(settings=settings, workspace=ws)
+
+    ws.audio_mp3.write_bytes(b"audio")
+    ws.output_mp4.write_bytes(b"video")
+    ws.subtitles_srt.write_text(
+        "1\n00:00:00,000 --> 00:00:00,500\nShort one.\n\n"
+        "2\n00:00:00,500 --> 00:00:02,500\nThis cue runs longer.\n\n"
+        "3\n00:00:02,500 --> 00:00:05,500\nAnd this one is the longest.\n",
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(ffmpeg, "probe_duration", lambda path: 5.5)
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _: None)
+
+    qc = run_qc(job, mode="draft", enable_asr=False)
+    assert qc["cue_stats"] == {"min_seconds": 0.5, "max_seconds": 3.0, "avg_seconds": 5.5 / 3}
+    assert qc["cue_median_seconds"] == 2.0
+    assert qc["cue_short_percent"] == pytest.approx(1 / 3)
@@ -10,3 +10,17 @@ def test_drift_threshold() -> None:
     assert drift is not None
     assert drift.avg_seconds <= 0.15
     assert drift.max_seconds <= 0.2
+
+
+def test_drift_matches_brute_force_nearest_neighbour() -> None:
+    import random
+
+    rng = random.Random(7)
+    cue_midpoints = [rng.uniform(-5, 65) for _ in range(200)]
+    segment_midpoints = [rng.uniform(0, 60) for _ in range(150)]
+    expected = [min(abs(s - c) for s in segment_midpoints) for c in cue_midpoints]
+
+    drift = compute_drift(cue_midpoints, segment_midpoints)
+    assert drift is not None
+    assert drift.max_seconds == max(expected)
+    assert abs(drift.avg_seconds - sum(expected) / len(expected)) < 1e-12
@@ -38,7 +38,7 @@ def test_qc_strict_passes_clean_srt(tmp_path: Path, monkeypatch) -> None:
 
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda _path: 4.0)
     monkeypatch.setattr(ffmpeg, "subtitle_layout_ok", lambda **_kwargs: (True, None))
-    monkeypatch.setattr(ffmpeg.shutil, "which", lambda _value: None)
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _value: None)
 
     qc = run_qc(job, mode="strict", enable_asr=False)
     assert qc["violations"] == []
@@ -72,7 +72,7 @@ def test_qc_strict_passes_dangling_tail_fix(tmp_path: Path, monkeypatch) -> None
 
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda _path: 3.0)
     monkeypatch.setattr(ffmpeg, "subtitle_layout_ok", lambda **_kwargs: (True, None))
-    monkeypatch.setattr(ffmpeg.shutil, "which", lambda _value: None)
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _value: None)
 
     qc = run_qc(job, mode="strict", enable_asr=False)
     assert qc["violations"] == []
@@ -107,7 +107,7 @@ def test_qc_strict_passes_forbidden_tail_fix(tmp_path: Path, monkeypatch) -> Non
 
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda _path: 3.0)
     monkeypatch.setattr(ffmpeg, "subtitle_layout_ok", lambda **_kwargs: (True, None))
-    monkeypatch.setattr(ffmpeg.shutil, "which", lambda _value: None)
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _value: None)
 
     qc = run_qc(job, mode="strict", enable_asr=False)
     assert qc["violations"] == []
@@ -149,7 +149,7 @@ def test_qc_strict_passes_hard_max_duration_split(tmp_path: Path, monkeypatch) -
 
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda _path: 7.4)
     monkeypatch.setattr(ffmpeg, "subtitle_layout_ok", lambda **_kwargs: (True, None))
-    monkeypatch.setattr(ffmpeg.shutil, "which", lambda _value: None)
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _value: None)
 
     qc = run_qc(job, mode="strict", enable_asr=False)
     assert qc["violations"] == []
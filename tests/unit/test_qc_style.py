@@ -23,7 +23,7 @@ def test_ass_style_values_in_qc_report(tmp_path: Path, monkeypatch) -> None:
     )
 
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda path: 2.0)
-    monkeypatch.setattr(ffmpeg.shutil, "which", lambda _: None)
+    monkeypatch.setattr(ffmpeg, "resolve_binary", lambda _: None)
     monkeypatch.setattr(
         ffmpeg,
         "subtitle_layout_ok",
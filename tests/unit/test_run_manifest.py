@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 
 from techsprint.config.settings import Settings
@@ -119,3 +120,178 @@ def test_pipeline_writes_run_manifest(tmp_path: Path, monkeypatch) -> None:
     assert len(data["steps"]) == 5
     assert data["loudnorm_filter_stats"]["output_i"] == "-16.0"
     manifest_utils.validate_run_manifest(data)
+
+
+def test_git_commit_is_resolved_once_per_repo(monkeypatch, tmp_path: Path) -> None:
+    (tmp_path / ".git").mkdir()
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+
+        class Proc:
+            returncode = 0
+            stdout = b"cafef00d\n"
+
+        return Proc()
+
+    monkeypatch.setattr(manifest_utils, "_find_repo_root", lambda _: tmp_path)
+    monkeypatch.setattr(manifest_utils.subprocess, "run", fake_run)
+    manifest_utils._git_commit_at.cache_clear()
+    try:
+        assert manifest_utils._git_commit() == "cafef00d"
+        assert manifest_utils._git_commit() == "cafef00d"
+    finally:
+        manifest_utils._git_commit_at.cache_clear()
+    assert len(calls) == 1
+
+
+def test_artifact_entry_reports_size_or_none(tmp_path: Path) -> None:
+    present = tmp_path / "audio.mp3"
+    present.write_bytes(b"abc")
+    entry = manifest_utils._artifact_entry(AudioArtifact(path=present, format="mp3"))
+    assert entry == {"path": str(present), "size_bytes": 3}
+
+    missing = tmp_path / "missing.mp3"
+    entry = manifest_utils._artifact_entry(AudioArtifact(path=missing, format="mp3"))
+    assert entry == {"path": str(missing), "size_bytes": None}
+
+
+def test_find_repo_root_walks_up_to_git_dir(tmp_path: Path) -> None:
+    (tmp_path / ".git").mkdir()
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    assert manifest_utils._find_repo_root(nested / "module.py") == tmp_path
+    assert (
+        manifest_utils._find_repo_root(tmp_path / "x" / "y" / "z" / "w" / "v" / "u" / "t") is None
+    )
+
+
+def test_subtitle_end_seconds_reads_last_cue(tmp_path: Path, monkeypatch) -> None:
+    srt = tmp_path / "captions.srt"
+    cues = [
+        f"{i}\n00:00:{i % 60:02d},000 --> 00:{i // 60:02d}:{i % 60:02d},500\n" + "word " * 40
+        for i in range(1, 400)
+    ]
+    srt.write_text("\n\n".join(cues) + "\n", encoding="utf-8")
+    assert manifest_utils._subtitle_end_seconds(srt) == 6 * 60 + 39.5
+
+    # A final cue larger than the tail window forces the window to widen.
+    monkeypatch.setattr(manifest_utils, "_SRT_TAIL_WINDOW", 64)
+    srt.write_text("1\n00:00:00,000 --> 00:00:03,250\n" + "x" * 500 + "\n", encoding="utf-8")
+    assert manifest_utils._subtitle_end_seconds(srt) == 3.25
+    assert manifest_utils._subtitle_end_seconds(tmp_path / "missing.srt") is None
+
+
+def test_parse_srt_time_canonical_and_loose_forms() -> None:
+    assert manifest_utils._parse_srt_time("01:02:03,456") == 3723.456
+    assert manifest_utils._parse_srt_time("1:02:03,5") == 3723.005
+    assert manifest_utils._parse_srt_time("aa:02:03,456") is None
+    assert manifest_utils._parse_srt_time("garbage") is None
+
+
+def test_write_run_manifest_probes_each_file_once(tmp_path: Path, monkeypatch) -> None:
+    from techsprint.domain.artifacts import Artifacts
+
+    workspace = Workspace.create(str(tmp_path), run_id="run2")
+    workspace.output_mp4.write_bytes(b"video")
+    workspace.audio_mp3.write_bytes(b"audio")
+    job = Job(
+        settings=Settings(),
+        workspace=workspace,
+        artifacts=Artifacts(video=VideoArtifact(path=workspace.output_mp4)),
+    )
+    probed: list[Path] = []
+
+    def fake_probe_media(path):
+        probed.append(Path(path))
+        return {"duration_seconds": 2.0, "audio_present": True}
+
+    monkeypatch.setattr(ffmpeg, "probe_media", fake_probe_media)
+    monkeypatch.setattr(ffmpeg, "probe_loudnorm", lambda _: None)
+    monkeypatch.setattr(manifest_utils, "_git_commit", lambda: None)
+
+    now = datetime.now(UTC)
+    out = manifest_utils.write_run_manifest(
+        job=job, steps=[], started_at=now, finished_at=now, render=None
+    )
+
+    assert sorted(probed) == sorted([workspace.output_mp4, workspace.audio_mp3])
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data["av_delta_seconds"] == 0.0
+
+
+def test_git_commit_reads_head_without_spawning_git(monkeypatch, tmp_path: Path) -> None:
+    sha = "0123456789abcdef0123456789abcdef01234567"
+    other = "f" * 40
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="ascii")
+    (git_dir / "refs" / "heads" / "main").write_text(sha + "\n", encoding="ascii")
+
+    def fail_run(*args, **kwargs):
+        raise AssertionError("git should not be spawned")
+
+    monkeypatch.setattr(manifest_utils.subprocess, "run", fail_run)
+    assert manifest_utils._read_git_head(git_dir) == sha
+
+    (git_dir / "refs" / "heads" / "main").unlink()
+    (git_dir / "packed-refs").write_text(
+        f"# pack-refs with: peeled\n{other} refs/heads/dev\n{sha} refs/heads/main\n",
+        encoding="ascii",
+    )
+    assert manifest_utils._read_git_head(git_dir) == sha
+
+    (git_dir / "HEAD").write_text(other + "\n", encoding="ascii")
+    assert manifest_utils._read_git_head(git_dir) == other
+
+
+def test_artifact_entry_keeps_zero_counts_but_drops_empty_fields(tmp_path: Path) -> None:
+    srt = tmp_path / "captions.srt"
+    artifact = SubtitleArtifact(
+        path=srt, source="", cue_count=0, cue_stats={}, asr_split=False, integrity_repairs=[]
+    )
+    entry = manifest_utils._artifact_entry(artifact)
+    assert entry == {"path": str(srt), "size_bytes": None, "cue_count": 0, "asr_split": False}
+
+
+def test_write_run_manifest_can_skip_media_probe(tmp_path: Path, monkeypatch) -> None:
+    from techsprint.domain.artifacts import Artifacts
+
+    workspace = Workspace.create(str(tmp_path), run_id="run3")
+    workspace.output_mp4.write_bytes(b"video")
+    job = Job(
+        settings=Settings(),
+        workspace=workspace,
+        artifacts=Artifacts(video=VideoArtifact(path=workspace.output_mp4)),
+    )
+
+    def fail_loudnorm(_):
+        raise AssertionError("loudnorm should not run")
+
+    monkeypatch.setattr(ffmpeg, "probe_media", lambda _: {"duration_seconds": 2.0})
+    monkeypatch.setattr(ffmpeg, "probe_loudnorm", fail_loudnorm)
+    monkeypatch.setattr(manifest_utils, "_git_commit", lambda: None)
+
+    now = datetime.now(UTC)
+    out = manifest_utils.write_run_manifest(
+        job=job,
+        steps=[],
+        started_at=now,
+        finished_at=now,
+        render=None,
+        include_media_probe=False,
+    )
+
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data["media_probe"] is None
+    assert data["av_delta_seconds"] == 0.0
+
+
+def test_subtitle_end_seconds_skips_arrows_in_cue_text(tmp_path: Path) -> None:
+    srt = tmp_path / "captions.srt"
+    srt.write_bytes(
+        "1\r\n00:00:00,000 --> 00:00:01,500\r\nnaïve\r\n\r\n"
+        "2\r\n00:00:01,500 --> 00:00:04,000\r\nclick --> next\r\n".encode()
+    )
+    assert manifest_utils._subtitle_end_seconds(srt) == 4.0
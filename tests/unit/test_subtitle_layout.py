@@ -9,3 +9,34 @@ def test_wrap_text_lines_limits_chars() -> None:
     lines = wrapped.splitlines()
     assert len(lines) <= subtitles.MAX_SUBTITLE_LINES
     assert all(len(line) <= subtitles.MAX_CHARS_PER_LINE for line in lines)
+
+
+def test_format_srt_time_carries_rounded_milliseconds() -> None:
+    assert subtitles._format_srt_time(0.0) == "00:00:00,000"
+    assert subtitles._format_srt_time(3661.25) == "01:01:01,250"
+    assert subtitles._format_srt_time(59.9996) == "00:01:00,000"
+
+
+def test_render_srt_emits_utf8_bytes_and_skips_empty_cues() -> None:
+    rendered = subtitles._render_srt(
+        [(0.0, 1.0, "Café opens"), (1.0, 1.0, "skipped"), (1.5, 2.5, "Second cue")]
+    )
+    assert isinstance(rendered, bytes)
+    expected = (
+        "1\n00:00:00,000 --> 00:00:01,000\nCafé opens\n\n"
+        "2\n00:00:01,500 --> 00:00:02,500\nSecond cue\n"
+    )
+    assert rendered == expected.encode()
+
+
+def test_normalize_segment_accepts_dicts_and_objects() -> None:
+    from types import SimpleNamespace
+
+    assert subtitles._normalize_segment({"start": 0, "end": 1.5, "text": " hi "}) == (
+        0.0,
+        1.5,
+        "hi",
+        None,
+    )
+    seg = SimpleNamespace(start=0.0, end=2.0, text="zero start", words=[{"word": "zero"}])
+    assert subtitles._normalize_segment(seg) == (0.0, 2.0, "zero start", [{"word": "zero"}])
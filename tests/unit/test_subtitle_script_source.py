@@ -56,7 +56,7 @@ def test_script_source_uses_script_text(monkeypatch, tmp_path: Path) -> None:
     ]
     monkeypatch.setattr(
         "techsprint.services.subtitles._transcribe_with_faster_whisper",
-        lambda _path: segments,
+        lambda _path, **_kwargs: segments,
     )
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda _path: 12.0)
 
@@ -40,7 +40,7 @@ def test_asr_subtitles_use_segment_timing(monkeypatch, tmp_path: Path) -> None:
     ]
     monkeypatch.setattr(
         "techsprint.services.subtitles._transcribe_with_faster_whisper",
-        lambda _path: segments,
+        lambda _path, **_kwargs: segments,
     )
     monkeypatch.setattr(ffmpeg, "probe_duration", lambda _path: 5.0)
 
@@ -71,3 +71,123 @@ def test_asr_merges_short_cues() -> None:
     assert len(merged) <= 2
     assert merged[0][0] == 0.0
     assert merged[-1][1] == 2.0
+
+
+def test_whisper_runtime_prefers_reduced_precision() -> None:
+    from techsprint.services.subtitles import _resolve_whisper_runtime
+
+    assert _resolve_whisper_runtime("cpu", "auto") == ("cpu", "int8")
+    assert _resolve_whisper_runtime("cuda", "auto") == ("cuda", "float16")
+    assert _resolve_whisper_runtime("cuda", "int8_float16") == ("cuda", "int8_float16")
+
+
+def test_whisper_batch_size_uses_batched_pipeline(monkeypatch, tmp_path: Path) -> None:
+    import sys
+    import types
+
+    from techsprint.services.subtitles import _transcribe_with_faster_whisper
+
+    calls: dict = {}
+    segment = types.SimpleNamespace(start=0.0, end=1.0, text="Hi", words=None)
+
+    class FakeModel:
+        def __init__(self, _name, **kwargs):
+            calls["model"] = kwargs
+
+        def transcribe(self, _path, **_kwargs):
+            raise AssertionError("batched path should be used")
+
+    class FakePipeline:
+        def __init__(self, model):
+            self.model = model
+
+        def transcribe(self, _path, **kwargs):
+            calls["transcribe"] = kwargs
+            return iter([segment]), None
+
+    fake = types.SimpleNamespace(WhisperModel=FakeModel, BatchedInferencePipeline=FakePipeline)
+    monkeypatch.setitem(sys.modules, "faster_whisper", fake)
+
+    payload = _transcribe_with_faster_whisper(tmp_path / "audio.mp3", device="cpu", batch_size=8)
+
+    assert payload == [{"start": 0.0, "end": 1.0, "text": "Hi", "words": None}]
+    assert calls["transcribe"]["batch_size"] == 8
+
+
+def test_tts_word_timings_skip_asr(monkeypatch, tmp_path: Path) -> None:
+    settings = Settings()
+    settings.workdir = str(tmp_path / ".techsprint")
+    settings.verbatim_policy = "audio"
+    ws = Workspace.create(settings.workdir, run_id="tts1")
+    job = Job(settings=settings, workspace=ws)
+
+    script_text = "Hello world. This is a test."
+    job.artifacts.audio = AudioArtifact(
+        path=ws.audio_mp3,
+        format="mp3",
+        text_path=ws.audio_text_txt,
+        text_sha256=sha256_text(normalize_text(script_text)),
+        word_timings=[
+            ("Hello", 0.0, 0.4),
+            ("world", 0.45, 0.9),
+            ("This", 1.5, 1.7),
+            ("is", 1.75, 1.85),
+            ("a", 1.9, 1.95),
+            ("test", 2.0, 2.5),
+        ],
+    )
+    ws.audio_mp3.write_bytes(b"audio")
+
+    def fail_transcribe(_path, **_kwargs):
+        raise AssertionError("ASR should be skipped when TTS word timings exist")
+
+    monkeypatch.setattr(
+        "techsprint.services.subtitles._transcribe_with_faster_whisper",
+        fail_transcribe,
+    )
+    monkeypatch.setattr(ffmpeg, "probe_duration", lambda _path: 3.0)
+
+    artifact = SubtitleService(backend=None, mode="auto").generate(job, script_text=script_text)
+
+    assert artifact.source == "tts"
+    assert artifact.segment_count == 2
+    assert not ws.asr_json.exists()
+    assert ws.subtitles_srt.read_text(encoding="utf-8").strip()
+
+
+def test_asr_mode_transcribes_even_with_tts_word_timings(monkeypatch, tmp_path: Path) -> None:
+    settings = Settings()
+    settings.workdir = str(tmp_path / ".techsprint")
+    settings.verbatim_policy = "audio"
+    ws = Workspace.create(settings.workdir, run_id="tts2")
+    job = Job(settings=settings, workspace=ws)
+
+    script_text = "Hello world."
+    job.artifacts.audio = AudioArtifact(
+        path=ws.audio_mp3,
+        format="mp3",
+        text_path=ws.audio_text_txt,
+        text_sha256=sha256_text(normalize_text(script_text)),
+        word_timings=[("Hello", 0.0, 0.4), ("world", 0.45, 0.9)],
+    )
+    ws.audio_mp3.write_bytes(b"audio")
+
+    calls: list[Path] = []
+
+    def fake_transcribe(path, **_kwargs):
+        calls.append(path)
+        return [{"start": 0.0, "end": 1.0, "text": "Hello world."}]
+
+    monkeypatch.setattr(
+        "techsprint.services.subtitles._transcribe_with_faster_whisper",
+        fake_transcribe,
+    )
+    monkeypatch.setattr(ffmpeg, "probe_duration", lambda _path: 1.0)
+
+    artifact = SubtitleService(backend=None, mode="asr").generate(job, script_text=script_text)
+
+    assert calls == [ws.audio_mp3]
+    assert artifact.source == "asr"
+    assert ws.asr_json.exists()
+    assert ws.asr_txt.read_text(encoding="utf-8") == "Hello world."
+    assert job.artifacts.asr is not None
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from techsprint.services import subtitles
 from techsprint.services.subtitles import OpenAITranscribeBackend
 from techsprint.utils import ffmpeg
 
@@ -55,3 +56,37 @@ def test_transcribe_segments_cap_to_audio_duration(
 
     text = out_path.read_text(encoding="utf-8")
     assert "00:00:05,000" in text
+
+
+def test_transcribe_reads_audio_once_across_format_fallback(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    audio_path = tmp_path / "audio.mp3"
+    audio_path.write_bytes(b"audio")
+    out_path = tmp_path / "captions.srt"
+
+    uploads: list[tuple[str, object]] = []
+
+    class FakeTranscriptions:
+        def create(self, *, model, file, response_format):
+            uploads.append((response_format, file))
+            if response_format == "verbose_json":
+                raise RuntimeError("unsupported_value: response_format")
+            return {"segments": [{"start": 0.0, "end": 1.0, "text": "hello"}]}
+
+    class FakeClient:
+        audio = type("Audio", (), {"transcriptions": FakeTranscriptions()})()
+
+    monkeypatch.setattr(subtitles, "_openai_client", lambda _api_key: FakeClient())
+    backend = OpenAITranscribeBackend(api_key="test-key", model="whisper-1")
+    reads = []
+    original_read = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or original_read(self))
+    monkeypatch.setattr(ffmpeg, "probe_duration", lambda _path: 5.0)
+
+    backend.transcribe_to_srt(audio_path=audio_path, out_path=out_path)
+
+    assert [fmt for fmt, _file in uploads] == ["verbose_json", "json"]
+    assert uploads[0][1] == uploads[1][1] == ("audio.mp3", b"audio", "audio/mpeg")
+    assert reads == [audio_path]
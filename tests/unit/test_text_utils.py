@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from techsprint.utils import text
+from techsprint.utils.text import sha256_bytes, sha256_text, write_text_with_digest
+
+
+def test_write_text_with_digest_reuses_sidecar_for_identical_text(
+    monkeypatch, tmp_path: Path
+) -> None:
+    path = tmp_path / "subtitles_text.txt"
+    digest = write_text_with_digest(path, "Hello world.")
+
+    assert digest == sha256_text("Hello world.")
+    assert path.read_text(encoding="utf-8") == "Hello world."
+    assert path.with_suffix(".sha256").read_text(encoding="utf-8") == digest
+
+    def fail_write(*_args):
+        raise AssertionError("unchanged text should not be rewritten")
+
+    monkeypatch.setattr(text, "_write_atomic", fail_write)
+    assert write_text_with_digest(path, "Hello world.") == digest
+
+
+def test_write_text_with_digest_rewrites_changed_text(tmp_path: Path) -> None:
+    path = tmp_path / "subtitles_text.txt"
+    write_text_with_digest(path, "old")
+
+    digest = write_text_with_digest(path, "new")
+
+    assert digest == sha256_text("new")
+    assert path.read_text(encoding="utf-8") == "new"
+    assert path.with_suffix(".sha256").read_text(encoding="utf-8") == digest
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_sha256_bytes_matches_text_digest() -> None:
+    assert sha256_bytes("héllo".encode()) == sha256_text("héllo")
+    assert sha256_text("") == "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
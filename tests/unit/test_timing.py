@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from techsprint.utils.timing import StepTimer
+
+
+def test_step_timer_measures_duration_on_monotonic_clock() -> None:
+    ticks = iter([1_000_000_000, 3_500_000_000])
+    wall = datetime(2024, 1, 1, tzinfo=UTC)
+    # A wall clock that jumps backwards must not produce a negative duration.
+    stamps = iter([wall, wall - timedelta(seconds=30)])
+    timer = StepTimer(clock=lambda: next(stamps), monotonic_ns=lambda: next(ticks))
+
+    with timer.step("compose_video"):
+        pass
+
+    (step,) = timer.steps
+    assert step.name == "compose_video"
+    assert step.duration_s == 2.5
+